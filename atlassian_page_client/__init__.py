@@ -3,24 +3,89 @@ A Python client library for interacting with Atlassian Confluence pages.
 
 This library provides a simple interface to read and modify Confluence pages
 through the Atlassian REST API.
+
+The classes below are imported on first access, so importing the package does
+not import requests, bs4 or aiohttp until a class that needs them is used.
 """
 
-from .attachment_client import AtlassianAttachmentClient
-from .blog_client import AtlassianBlogClient
-from .client_factory import AtlassianClientFactory
-from .page import AtlassianPage
-from .page_client import AtlassianPageClient
-from .page_content import AtlassianPageContent
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .async_attachment_client import AsyncAtlassianAttachmentClient
+    from .async_blog_client import AsyncAtlassianBlogClient
+    from .async_page_client import AsyncAtlassianPageClient
+    from .attachment_client import AtlassianAttachmentClient
+    from .blog_client import AtlassianBlogClient
+    from .bulk import BulkResult
+    from .client_factory import AtlassianClientFactory
+    from .compact_page import CompactAtlassianPage
+    from .edit_queue import PageEditQueue
+    from .exceptions import (
+        AtlassianAPIError,
+        AtlassianAuthenticationError,
+        AtlassianConflictError,
+        AtlassianNotFoundError,
+        AtlassianRateLimitError,
+        AtlassianServerError,
+    )
+    from .hooks import ParseEvent, RequestEvent, RequestHooks
+    from .page import AtlassianPage
+    from .page_cache import PageCache
+    from .page_client import AtlassianPageClient
+    from .page_content import AtlassianPageContent
+    from .page_summary import PageSummary
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+    from .storage_stream import StorageElement, StorageStream
 
 __version__ = "0.1.0"
 __author__ = "Yannick Zimmermann"
 __email__ = "yannick.zimmermann@proton.me"
 
-__all__ = [
-    "AtlassianPageClient",
-    "AtlassianBlogClient",
-    "AtlassianAttachmentClient",
-    "AtlassianPage",
-    "AtlassianPageContent",
-    "AtlassianClientFactory",
-]
+# exported name -> module defining it
+_LAZY_IMPORTS = {
+    "AtlassianPageClient": ".page_client",
+    "AtlassianBlogClient": ".blog_client",
+    "AtlassianAttachmentClient": ".attachment_client",
+    "AtlassianPage": ".page",
+    "CompactAtlassianPage": ".compact_page",
+    "AtlassianPageContent": ".page_content",
+    "StorageStream": ".storage_stream",
+    "StorageElement": ".storage_stream",
+    "AtlassianClientFactory": ".client_factory",
+    "AsyncAtlassianPageClient": ".async_page_client",
+    "AsyncAtlassianBlogClient": ".async_blog_client",
+    "AsyncAtlassianAttachmentClient": ".async_attachment_client",
+    "BulkResult": ".bulk",
+    "PageCache": ".page_cache",
+    "PageEditQueue": ".edit_queue",
+    "PageSummary": ".page_summary",
+    "RetryPolicy": ".retry",
+    "RateLimiter": ".rate_limit",
+    "RequestHooks": ".hooks",
+    "RequestEvent": ".hooks",
+    "ParseEvent": ".hooks",
+    "AtlassianAPIError": ".exceptions",
+    "AtlassianAuthenticationError": ".exceptions",
+    "AtlassianNotFoundError": ".exceptions",
+    "AtlassianConflictError": ".exceptions",
+    "AtlassianRateLimitError": ".exceptions",
+    "AtlassianServerError": ".exceptions",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # cache it, later lookups no longer go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
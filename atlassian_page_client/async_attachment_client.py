@@ -0,0 +1,28 @@
+import os
+from typing import TYPE_CHECKING
+
+from .async_base_client import AsyncAtlassianBaseClient
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncAtlassianAttachmentClient(AsyncAtlassianBaseClient):
+    HEADERS = {"X-Atlassian-Token": "no-check"}
+
+    async def post(self, blogpost_id: int, file_path: str) -> "aiohttp.ClientResponse":
+        import aiohttp
+
+        apiUrl = f"/wiki/rest/api/content/{blogpost_id}/child/attachment"
+
+        with self._instrument("post", apiUrl, str(blogpost_id)) as event:
+            with open(file_path, "rb") as f:
+                files = aiohttp.FormData()
+                files.add_field("file", f, filename=file_path)
+
+                response = await self._request("post", apiUrl, data=files)
+
+            event.bytes_sent = os.path.getsize(file_path)
+            await self.check_response(response)
+
+        return response
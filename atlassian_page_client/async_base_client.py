@@ -0,0 +1,176 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, ContextManager, Dict, Optional, Tuple, Type
+
+from .exceptions import error_for_status
+from .hooks import RequestEvent, RequestHooks, body_size, current_event, instrument
+from .http_session import AsyncSession
+from .json_backend import resolve_json_backend
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, is_replayable, parse_retry_after
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+def _transport_errors() -> Tuple[Type[BaseException], ...]:
+    try:
+        import aiohttp
+    except ImportError:
+        return (asyncio.TimeoutError,)
+    return (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+class AsyncAtlassianBaseClient:
+    HEADERS: Dict[str, str] = {}
+
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        base_url: str,
+        session: Optional[AsyncSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[str] = None,
+    ):
+        self.base_url = base_url
+        self.email = email
+        self.token = token
+        self.session = session if session is not None else AsyncSession(email, token)
+        # a passed in session may be shared, e.g. by a factory's clients, and is
+        # closed by its owner
+        self._owns_session = session is None
+        self.headers = {**self.session.headers, **self.HEADERS}
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.hooks = hooks
+        self.json = resolve_json_backend(json_backend)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the session if the client created it, a passed in session is left
+        open for its owner (e.g. AtlassianClientFactory.aclose)
+        """
+        if self._owns_session:
+            await self.session.close()
+
+    async def check_response(self, response: "aiohttp.ClientResponse") -> None:
+        if response.status != 200:
+            text = await response.text()
+            raise error_for_status(
+                response.url,
+                response.status,
+                text,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+    def _instrument(
+        self, method: str, api_url: str, page_id: Optional[str] = None
+    ) -> ContextManager[RequestEvent]:
+        """
+        Reports the client call in the with block to the hooks, if any
+        """
+        return instrument(self.hooks, method, self.base_url + api_url, page_id)
+
+    async def _request(
+        self, method: str, api_url: str, **kwargs
+    ) -> "aiohttp.ClientResponse":
+        """
+        Sends a request relative to base_url and reads the whole body before the
+        connection goes back to the pool, so the returned response can still be
+        read with text() or json(). Retries follow the retry policy, as in the
+        synchronous clients.
+        """
+        headers = kwargs.pop("headers", self.headers)
+
+        if self.retry_policy is None:
+            return await self._send(method, api_url, headers, kwargs)
+
+        replayable = is_replayable(kwargs.get("data"))
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(method, api_url, headers, kwargs)
+            except _transport_errors():
+                delay = self.retry_policy.retry_delay(
+                    method, attempt, replayable=replayable
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry_policy.retry_delay(
+                    method,
+                    attempt,
+                    status=response.status,
+                    retry_after=response.headers.get("Retry-After"),
+                    replayable=replayable,
+                )
+                if delay is None:
+                    return response
+            event = current_event.get()
+            if event is not None:
+                event.retries += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self, method: str, api_url: str, headers: Dict[str, str], kwargs: dict
+    ) -> "aiohttp.ClientResponse":
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(method)
+
+        client_session = await self.session.get()
+
+        event = current_event.get()
+        if event is not None:
+            return await self._send_timed(
+                event, client_session, method, api_url, headers, kwargs
+            )
+
+        async with client_session.request(
+            method.upper(), self.base_url + api_url, headers=headers, **kwargs
+        ) as response:
+            await response.read()
+
+        return response
+
+    async def _send_timed(
+        self,
+        event: RequestEvent,
+        client_session: "aiohttp.ClientSession",
+        method: str,
+        api_url: str,
+        headers: Dict[str, str],
+        kwargs: dict,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Sends like _send and records the network phases in event. Connection
+        setup is timed through the trace config of sessions from AsyncSession,
+        sending is not measured separately and counts towards ttfb.
+        """
+        event.bytes_sent = body_size(kwargs.get("data"))
+        phases: Dict[str, float] = {}
+        start = time.perf_counter()
+        async with client_session.request(
+            method.upper(),
+            self.base_url + api_url,
+            headers=headers,
+            trace_request_ctx=phases,
+            **kwargs,
+        ) as response:
+            phases["ttfb"] = time.perf_counter() - start - phases.get("connect", 0.0)
+            with event.phase("download"):
+                event.bytes_received = len(await response.read())
+        for phase, seconds in phases.items():
+            event.add_timing(phase, seconds)
+        event.status = response.status
+
+        return response
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .async_base_client import AsyncAtlassianBaseClient
+from .json_backend import json_headers
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncAtlassianBlogClient(AsyncAtlassianBaseClient):
+    HEADERS = {"Content-Type": "application/json;charset=iso-8859-1"}
+
+    async def post(
+        self, space_id: int, title: str, body: str
+    ) -> "aiohttp.ClientResponse":
+        apiUrl = f"/wiki/api/v2/blogposts"
+
+        d = {
+            "spaceId": space_id,
+            "status": "current",
+            "title": title,
+            "body": {"representation": "storage", "value": body},
+            "createdAt": datetime.now().strftime("%Y-%m-%d"),
+        }
+
+        with self._instrument("post", apiUrl) as event:
+            with event.phase("json_encode"):
+                data = self.json.dumps(d)
+
+            response = await self._request(
+                "post", apiUrl, data=data, headers=json_headers(self.headers, data)
+            )
+
+            await self.check_response(response)
+
+        return response
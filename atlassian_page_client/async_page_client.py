@@ -0,0 +1,145 @@
+import asyncio
+from typing import Callable, Optional, Tuple
+
+from .async_base_client import AsyncAtlassianBaseClient
+from .compact_page import CompactAtlassianPage, Page
+from .exceptions import AtlassianConflictError
+from .hooks import RequestHooks
+from .http_session import AsyncSession
+from .json_backend import json_headers
+from .page import AtlassianPage
+from .page_content import AtlassianPageContent
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import AsyncSingleFlight
+
+
+class AsyncAtlassianPageClient(AsyncAtlassianBaseClient):
+
+    HEADERS = {"Content-Type": "application/json;charset=iso-8859-1"}
+
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        base_url: str,
+        session: Optional[AsyncSession] = None,
+        parser: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[str] = None,
+        compact: bool = False,
+    ):
+        super().__init__(
+            email,
+            token,
+            base_url,
+            session=session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            json_backend=json_backend,
+        )
+        self.parser = parser
+        # return CompactAtlassianPages instead of AtlassianPages
+        self.compact = compact
+        self._in_flight = AsyncSingleFlight()
+
+    async def get(self, page_id: str) -> Page:
+        """
+        Fetches a page. Concurrent gets of the same page share one request, every
+        caller gets its own page decoded from the shared response.
+        """
+        (content, body), shared = await self._in_flight.do(
+            page_id, lambda: self._fetch_content(page_id)
+        )
+        if shared:
+            content = self.json.loads(body)
+
+        return self._page(page_id, content)
+
+    async def get_version(self, page_id: str) -> int:
+        apiUrl = f"/wiki/rest/api/content/{page_id}?expand=version"
+
+        with self._instrument("get", apiUrl, page_id) as event:
+            response = await self._request("get", apiUrl)
+
+            await self.check_response(response)
+
+            body = await response.read()
+            with event.phase("json_decode"):
+                return int(self.json.loads(body)["version"]["number"])
+
+    async def get_if_changed(self, page_id: str, known_version: int) -> Optional[Page]:
+        if await self.get_version(page_id) == known_version:
+            return None
+        return await self.get(page_id)
+
+    async def put(self, page: Page, force: bool = False) -> Page:
+        page_id = page.get_page_id()
+        apiUrl = f"/wiki/rest/api/content/{page_id}"
+
+        with self._instrument("put", apiUrl, page_id) as event:
+            with event.phase("serialize"):
+                content = page.get_page_content_dict()
+            if not force and not page.is_modified(content["body"]["storage"]["value"]):
+                page.put_skipped = True
+                return page
+            page.increase_version()
+            with event.phase("json_encode"):
+                data = self.json.dumps(content)
+
+            response = await self._request(
+                "put", apiUrl, data=data, headers=json_headers(self.headers, data)
+            )
+
+            await self.check_response(response)
+
+            body = await response.read()
+            with event.phase("json_decode"):
+                content = self.json.loads(body)
+
+        return self._page(page_id, content)
+
+    async def put_with_retry(
+        self,
+        page_id: str,
+        mutate_fn: Callable[[AtlassianPageContent], None],
+        max_attempts: int = 5,
+    ) -> Page:
+        """
+        Applies mutate_fn to the current content of a page and puts it, fetching
+        the page again and replaying mutate_fn when the put conflicts (409), see
+        AtlassianPageClient.put_with_retry
+        """
+        attempt = 1
+        while True:
+            page = await self.get(page_id)
+            mutate_fn(page.get_working_page_content())
+            try:
+                return await self.put(page)
+            except AtlassianConflictError:
+                if attempt >= max_attempts:
+                    raise
+            if self.retry_policy is not None:
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+            attempt += 1
+
+    def _page(self, page_id: str, content: dict) -> Page:
+        page_class = CompactAtlassianPage if self.compact else AtlassianPage
+        return page_class(page_id, content, parser=self.parser, hooks=self.hooks)
+
+    async def _fetch_content(self, page_id: str) -> Tuple[dict, bytes]:
+        apiUrl = f"/wiki/rest/api/content/{page_id}?expand=body.storage,version"
+
+        with self._instrument("get", apiUrl, page_id) as event:
+            response = await self._request("get", apiUrl)
+
+            await self.check_response(response)
+
+            body = await response.read()
+            with event.phase("json_decode"):
+                content = self.json.loads(body)
+
+        return content, body
@@ -1,36 +1,125 @@
 # Call JIRA API with HTTPBasicAuth
+import os
+from contextlib import ExitStack
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
+
 import requests
-from requests.auth import HTTPBasicAuth
+
+from .base_client import AtlassianBaseClient
+from .bulk import BulkResult, run_bulk
+from .multipart import FileSource, MultipartEncoder, MultipartField, ProgressCallback
 
 
-class AtlassianAttachmentClient:
+class AtlassianAttachmentClient(AtlassianBaseClient):
     HEADERS = {"X-Atlassian-Token": "no-check"}
 
-    def __init__(self, email: str, token: str, base_url: str):
-        self.base_url = base_url
-        self.email = email
-        self.token = token
-        self.basicAuth = HTTPBasicAuth(self.email, self.token)
+    def post(
+        self,
+        blogpost_id: int,
+        file_path: Union[str, "os.PathLike[str]", FileSource],
+        filename: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> requests.Response:
+        """
+        Uploads an attachment. file_path is either a path, a binary file object
+        or an iterable of bytes; filename defaults to the path or the name of the
+        file object. The body is streamed, so files of any size can be uploaded.
+        """
+        if isinstance(file_path, (str, os.PathLike)):
+            with open(file_path, "rb") as f:
+                return self._post_files(
+                    blogpost_id,
+                    [MultipartField("file", f, filename or os.fspath(file_path))],
+                    progress_callback,
+                )
+
+        if filename is None:
+            filename = os.path.basename(str(getattr(file_path, "name", "file")))
+
+        return self._post_files(
+            blogpost_id,
+            [MultipartField("file", file_path, filename)],
+            progress_callback,
+        )
+
+    def post_many(
+        self,
+        content_id: Optional[int],
+        paths: Iterable[Union[str, Tuple[int, str]]],
+        max_workers: int = 4,
+        batch_size: int = 20,
+        batch_bytes: int = 1024 * 1024,
+    ) -> List[BulkResult]:
+        """
+        Uploads many files concurrently and returns one BulkResult per file, in
+        input order, with the response as result or the exception as error.
+
+        Items of paths are either a path, uploaded to content_id, or a
+        (content_id, path) tuple. Files smaller than batch_bytes going to the
+        same content are packed into one multipart request of at most batch_size
+        files and batch_bytes bytes; larger files are uploaded on their own.
+        """
+        results: List[Optional[BulkResult]] = []
+        open_batches: Dict[Any, List[Tuple[int, Any, str]]] = {}
+        open_sizes: Dict[Any, int] = {}
+        batches: List[Tuple[Any, List[Tuple[int, Any, str]]]] = []
+
+        for index, item in enumerate(paths):
+            target, path = item if isinstance(item, tuple) else (content_id, item)
+            results.append(None)
+            try:
+                size = os.path.getsize(path)
+            except OSError as e:
+                results[index] = BulkResult(item, error=e)
+                continue
+
+            if size >= batch_bytes or batch_size <= 1:
+                batches.append((target, [(index, item, path)]))
+                continue
+
+            batch = open_batches.get(target)
+            if batch and open_sizes[target] + size > batch_bytes:
+                batches.append((target, open_batches.pop(target)))
+                batch = None
+            if not batch:
+                batch = open_batches[target] = []
+                open_sizes[target] = 0
+            batch.append((index, item, path))
+            open_sizes[target] += size
+            if len(batch) >= batch_size:
+                batches.append((target, open_batches.pop(target)))
+
+        batches.extend(open_batches.items())
+
+        def upload(batch: Tuple[Any, List[Tuple[int, Any, str]]]) -> requests.Response:
+            target, entries = batch
+            with ExitStack() as stack:
+                fields = [
+                    MultipartField("file", stack.enter_context(open(path, "rb")), path)
+                    for _, _, path in entries
+                ]
+                return self._post_files(target, fields)
+
+        for outcome in run_bulk(upload, batches, max_workers=max_workers):
+            for index, item, _ in outcome.item[1]:
+                results[index] = BulkResult(item, outcome.result, outcome.error)
 
-    def check_response(self, response: requests.Response) -> None:
-        if response.status_code != 200:
-            raise Exception(
-                f"Failed to get page from url {response.url}: {response.status_code} {response.text}"
-            )
+        return cast(List[BulkResult], results)
 
-    def post(self, blogpost_id: int, file_path: str) -> requests.Response:
+    def _post_files(
+        self,
+        blogpost_id: int,
+        fields: List[MultipartField],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> requests.Response:
         apiUrl = f"/wiki/rest/api/content/{blogpost_id}/child/attachment"
 
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path, f)}
+        encoder = MultipartEncoder(fields, progress_callback=progress_callback)
+        headers = {**self.HEADERS, "Content-Type": encoder.content_type}
 
-            response = requests.post(
-                self.base_url + apiUrl,
-                headers=self.HEADERS,
-                auth=self.basicAuth,
-                files=files,
-            )
+        with self._instrument("post", apiUrl, str(blogpost_id)):
+            response = self._request("post", apiUrl, headers=headers, data=encoder)
 
-        self.check_response(response)
+            self.check_response(response)
 
         return response
@@ -0,0 +1,164 @@
+import time
+from typing import ContextManager, Dict, Optional
+
+import requests
+from requests.auth import HTTPBasicAuth
+
+from .exceptions import error_for_status
+from .hooks import RequestEvent, RequestHooks, body_size, current_event, instrument
+from .http_session import record_phases
+from .json_backend import resolve_json_backend
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, is_replayable, parse_retry_after
+
+
+class AtlassianBaseClient:
+    HEADERS: Dict[str, str] = {}
+
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        base_url: str,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[str] = None,
+    ):
+        self.base_url = base_url
+        self.email = email
+        self.token = token
+        self.basicAuth = HTTPBasicAuth(self.email, self.token)
+        self.session = session
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.hooks = hooks
+        self.json = resolve_json_backend(json_backend)
+
+    def check_response(self, response: requests.Response) -> None:
+        """
+        Raises an AtlassianAPIError subclass matching the status of a non-200 response
+        """
+        if response.status_code != 200:
+            raise error_for_status(
+                response.url,
+                response.status_code,
+                response.text,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+    def _instrument(
+        self, method: str, api_url: str, page_id: Optional[str] = None
+    ) -> ContextManager[RequestEvent]:
+        """
+        Reports the client call in the with block to the hooks, if any
+        """
+        return instrument(self.hooks, method, self.base_url + api_url, page_id)
+
+    def _request(self, method: str, api_url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request relative to base_url. Clients built with a shared session
+        reuse its pooled connections and precomputed Authorization header,
+        standalone clients fall back to the module level requests functions.
+
+        With a retry policy, connection errors and retryable responses are sent
+        again after the policy's backoff. The last response is returned either
+        way, check_response turns it into the matching exception.
+        """
+        headers = kwargs.pop("headers", self.HEADERS)
+
+        if self.retry_policy is None:
+            return self._send(method, api_url, headers, kwargs)
+
+        replayable = is_replayable(kwargs.get("data"))
+        attempt = 1
+        while True:
+            try:
+                response = self._send(method, api_url, headers, kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = self.retry_policy.retry_delay(
+                    method, attempt, replayable=replayable
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry_policy.retry_delay(
+                    method,
+                    attempt,
+                    status=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                    replayable=replayable,
+                )
+                if delay is None:
+                    return response
+                response.close()
+            event = current_event.get()
+            if event is not None:
+                event.retries += 1
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
+        self, method: str, api_url: str, headers: Dict[str, str], kwargs: dict
+    ) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method)
+
+        event = current_event.get()
+        if event is not None:
+            return self._send_timed(event, method, api_url, headers, kwargs)
+
+        if self.session is None:
+            send = getattr(requests, method)
+            return send(
+                self.base_url + api_url, headers=headers, auth=self.basicAuth, **kwargs
+            )
+
+        return self.session.request(
+            method.upper(), self.base_url + api_url, headers=headers, **kwargs
+        )
+
+    def _send_timed(
+        self,
+        event: RequestEvent,
+        method: str,
+        api_url: str,
+        headers: Dict[str, str],
+        kwargs: dict,
+    ) -> requests.Response:
+        """
+        Sends like _send and records the network phases in event. The body is
+        streamed so that waiting for the headers and downloading the body can be
+        told apart; it is read completely before returning.
+        """
+        event.bytes_sent = body_size(kwargs.get("data"))
+        phases: Dict[str, float] = {}
+        start = time.perf_counter()
+        with record_phases(phases):
+            if self.session is None:
+                response = getattr(requests, method)(
+                    self.base_url + api_url,
+                    headers=headers,
+                    auth=self.basicAuth,
+                    stream=True,
+                    **kwargs,
+                )
+            else:
+                response = self.session.request(
+                    method.upper(),
+                    self.base_url + api_url,
+                    headers=headers,
+                    stream=True,
+                    **kwargs,
+                )
+        if "ttfb" not in phases:
+            # session without timed connections, only the total wait is known
+            phases["ttfb"] = time.perf_counter() - start
+        for phase, seconds in phases.items():
+            event.add_timing(phase, seconds)
+
+        with event.phase("download"):
+            event.bytes_received = len(response.content)
+        event.status = response.status_code
+        return response
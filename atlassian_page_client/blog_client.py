@@ -1,27 +1,171 @@
 # Call JIRA API with HTTPBasicAuth
-import json
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
 
 import requests
-from requests.auth import HTTPBasicAuth
 
+from .base_client import AtlassianBaseClient
+from .bulk import BulkResult, run_bulk
+from .exceptions import AtlassianServerError
+from .hooks import RequestHooks
+from .json_backend import json_headers
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 
-class AtlassianBlogClient:
+BlogPostItem = Union[Tuple[str, str], Tuple[str, str, Optional[str]]]
+
+# failures after which the post may or may not have been created
+_AMBIGUOUS_ERRORS = (requests.ConnectionError, requests.Timeout, AtlassianServerError)
+
+# allowed difference between the local clock and Confluence's when looking for
+# a post created by an earlier attempt
+_CLOCK_SKEW = timedelta(minutes=1)
+
+
+def _parse_created_at(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        created = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return created
+
+
+class _KeyLock:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # threads holding or waiting for the lock
+        self.users = 0
+
+
+class AtlassianBlogClient(AtlassianBaseClient):
     HEADERS = {"Content-Type": "application/json;charset=iso-8859-1"}
 
-    def __init__(self, email: str, token: str, base_url: str):
-        self.base_url = base_url
-        self.email = email
-        self.token = token
-        self.basicAuth = HTTPBasicAuth(self.email, self.token)
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        base_url: str,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[str] = None,
+        idempotency_store: Optional[MutableMapping[str, str]] = None,
+        max_attempts: int = 3,
+    ):
+        super().__init__(
+            email,
+            token,
+            base_url,
+            session=session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            json_backend=json_backend,
+        )
+        # idempotency key -> id of the blog post created for it
+        self.idempotency_store: MutableMapping[str, str] = (
+            idempotency_store if idempotency_store is not None else {}
+        )
+        self.max_attempts = max_attempts
+        # only for keys with a post in progress
+        self._key_locks: Dict[str, _KeyLock] = {}
+        self._key_locks_lock = threading.Lock()
 
-    def check_response(self, response: requests.Response) -> None:
-        if response.status_code != 200:
-            raise Exception(
-                f"Failed to get page from url {response.url}: {response.status_code} {response.text}"
-            )
+    def post(
+        self,
+        space_id: int,
+        title: str,
+        body: str,
+        idempotency_key: Optional[str] = None,
+    ) -> requests.Response:
+        """
+        Creates a blog post. With an idempotency_key, a post is created at most
+        once per key: a key that already produced a post returns that post
+        instead, and when the create request fails in a way that leaves its
+        outcome unknown (connection error, timeout, 5xx), the space is searched
+        for a post with the same title created since the first attempt before it
+        is sent again, up to max_attempts times, after the backoff of the retry
+        policy, if any. Older posts with the same title,
+        e.g. earlier issues of a recurring digest, are never taken for it. Keys
+        and post ids are kept in idempotency_store, pass a persistent mapping to
+        make them survive the process.
+        """
+        if idempotency_key is None:
+            return self._create(space_id, title, body)
+
+        with self._key_lock(idempotency_key):
+            post_id = self.idempotency_store.get(idempotency_key)
+            if post_id is not None:
+                return self._get_post(post_id)
+
+            not_before = datetime.now(timezone.utc) - _CLOCK_SKEW
+            attempt = 1
+            while True:
+                try:
+                    response = self._create(space_id, title, body)
+                except _AMBIGUOUS_ERRORS as e:
+                    existing = self._find_post(space_id, title, not_before)
+                    if existing is not None:
+                        self.idempotency_store[idempotency_key] = existing
+                        return self._get_post(existing)
+                    if attempt >= self.max_attempts:
+                        raise
+                    if self.retry_policy is not None:
+                        time.sleep(
+                            self.retry_policy.backoff(
+                                attempt, getattr(e, "retry_after", None)
+                            )
+                        )
+                    attempt += 1
+                    continue
+
+                self.idempotency_store[idempotency_key] = str(
+                    self.json.loads(response.content)["id"]
+                )
+                return response
+
+    def post_many(
+        self,
+        space_id: int,
+        posts: Iterable[BlogPostItem],
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """
+        Creates many blog posts concurrently and returns one BulkResult per post,
+        in input order, with the response as result or the exception as error.
+        Items are (title, body) or (title, body, idempotency_key) tuples, keyed
+        posts are created at most once even when the batch is run again.
+
+        Use a client from AtlassianClientFactory so the posts share pooled
+        connections, and keep max_workers at or below its pool_maxsize.
+        """
 
-    def post(self, space_id: int, title: str, body: str) -> requests.Response:
+        def publish(item: BlogPostItem) -> requests.Response:
+            title, body = item[0], item[1]
+            idempotency_key = item[2] if len(item) > 2 else None
+            return self.post(space_id, title, body, idempotency_key=idempotency_key)
+
+        return list(run_bulk(publish, posts, max_workers=max_workers))
+
+    def _create(self, space_id: int, title: str, body: str) -> requests.Response:
         apiUrl = f"/wiki/api/v2/blogposts"
 
         d = {
@@ -32,12 +176,70 @@ class AtlassianBlogClient:
             "createdAt": datetime.now().strftime("%Y-%m-%d"),
         }
 
-        data = json.dumps(d)
+        with self._instrument("post", apiUrl) as event:
+            with event.phase("json_encode"):
+                data = self.json.dumps(d)
 
-        response = requests.post(
-            self.base_url + apiUrl, headers=self.HEADERS, auth=self.basicAuth, data=data
-        )
+            response = self._request(
+                "post", apiUrl, data=data, headers=json_headers(self.HEADERS, data)
+            )
 
-        self.check_response(response)
+            self.check_response(response)
 
         return response
+
+    def _get_post(self, post_id: str) -> requests.Response:
+        apiUrl = f"/wiki/api/v2/blogposts/{post_id}"
+
+        with self._instrument("get", apiUrl):
+            response = self._request("get", apiUrl)
+
+            self.check_response(response)
+
+        return response
+
+    def _find_post(
+        self, space_id: int, title: str, not_before: datetime
+    ) -> Optional[str]:
+        """
+        Returns the id of the newest blog post with the given title in a space
+        that was created at or after not_before, if any
+        """
+        query = urlencode(
+            {
+                "space-id": space_id,
+                "title": title,
+                "sort": "-created-date",
+                "limit": 25,
+            }
+        )
+        apiUrl = f"/wiki/api/v2/blogposts?{query}"
+
+        with self._instrument("get", apiUrl) as event:
+            response = self._request("get", apiUrl)
+
+            self.check_response(response)
+
+            with event.phase("json_decode"):
+                results = self.json.loads(response.content).get("results", [])
+        for result in results:
+            created = _parse_created_at(result.get("createdAt"))
+            if created is not None and created >= not_before:
+                return str(result["id"])
+        return None
+
+    @contextmanager
+    def _key_lock(self, idempotency_key: str) -> Iterator[None]:
+        with self._key_locks_lock:
+            key_lock = self._key_locks.get(idempotency_key)
+            if key_lock is None:
+                key_lock = self._key_locks[idempotency_key] = _KeyLock()
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                yield
+        finally:
+            with self._key_locks_lock:
+                key_lock.users -= 1
+                if key_lock.users == 0:
+                    del self._key_locks[idempotency_key]
@@ -0,0 +1,75 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+
+class BulkResult:
+    """
+    Outcome of one item of a bulk operation: either result or error is set
+    """
+
+    def __init__(
+        self, item: Any, result: Any = None, error: Optional[BaseException] = None
+    ):
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"BulkResult({self.item!r}, result={self.result!r})"
+        return f"BulkResult({self.item!r}, error={self.error!r})"
+
+
+def run_bulk(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    ordered: bool = True,
+) -> Iterator[BulkResult]:
+    """
+    Calls fn for every item on a thread pool and yields one BulkResult per item.
+
+    At most 2 * max_workers items are scheduled at a time, so arbitrarily long
+    inputs are consumed lazily. With ordered=True results come back in input
+    order, otherwise as soon as each call finishes. Exceptions raised by fn are
+    captured in the result instead of aborting the remaining items.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    def call(item: Any) -> BulkResult:
+        try:
+            return BulkResult(item, result=fn(item))
+        except Exception as e:
+            return BulkResult(item, error=e)
+
+    window = 2 * max_workers
+    pending: Deque[Tuple[Any, "Future[BulkResult]"]] = deque()
+    items = iter(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def fill() -> None:
+            while len(pending) < window:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                pending.append((item, executor.submit(call, item)))
+
+        fill()
+        while pending:
+            if ordered:
+                _, future = pending.popleft()
+                yield future.result()
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                for entry in [entry for entry in pending if entry[1] in done]:
+                    pending.remove(entry)
+                    yield entry[1].result()
+            fill()
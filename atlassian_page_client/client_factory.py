@@ -1,20 +1,201 @@
-from .attachment_client import AtlassianAttachmentClient
-from .blog_client import AtlassianBlogClient
-from .page_client import AtlassianPageClient
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from .hooks import RequestHooks
+from .http_session import AsyncSession, create_session
+from .page_cache import PageCache
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import requests
+
+    from .async_attachment_client import AsyncAtlassianAttachmentClient
+    from .async_blog_client import AsyncAtlassianBlogClient
+    from .async_page_client import AsyncAtlassianPageClient
+    from .attachment_client import AtlassianAttachmentClient
+    from .blog_client import AtlassianBlogClient
+    from .page_client import AtlassianPageClient
 
 
 class AtlassianClientFactory:
+    """
+    Creates clients that share one pooled HTTP session, so connections (and their
+    TLS handshakes) are reused across every client built by the same factory.
+    Async clients share a separate aiohttp session, closed with aclose().
+
+    All clients also share one RetryPolicy, so transient failures (429, 502, 503,
+    504) are retried with backoff and count against a common retry budget. Pass
+    RetryPolicy(max_attempts=1) to disable retries. An optional RateLimiter paces
+    the requests of all clients, sync and async, against one shared budget, and
+    RequestHooks receive the instrumentation events of all clients. json_backend
+    picks the JSON library of all clients, see resolve_json_backend. With
+    compact_pages the page clients return CompactAtlassianPages.
+
+    The client classes are imported by the create methods, and the requests
+    session is created with the first sync client, so a factory used only for
+    blog posts does not import bs4, and one used only for async clients does
+    not import requests.
+    """
 
-    def __init__(self, email: str, token: str, base_url: str):
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        base_url: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        page_cache: Optional[PageCache] = None,
+        parser: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[str] = None,
+        compact_pages: bool = False,
+    ):
         self.base_url = base_url
         self.email = email
         self.token = token
+        self.page_cache = page_cache
+        self.parser = parser
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.hooks = hooks
+        self.json_backend = json_backend
+        self.compact_pages = compact_pages
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        self.async_session = AsyncSession(
+            self.email,
+            self.token,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+        )
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        The requests session shared by the sync clients, created on first use
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_session(
+                        self.email,
+                        self.token,
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        keep_alive=self.keep_alive,
+                    )
+        return self._session
+
+    @session.setter
+    def session(self, session: "requests.Session") -> None:
+        self._session = session
+
+    def __enter__(self) -> "AtlassianClientFactory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    async def aclose(self) -> None:
+        await self.async_session.close()
+
+    def createBlogClient(self) -> "AtlassianBlogClient":
+        from .blog_client import AtlassianBlogClient
+
+        return AtlassianBlogClient(
+            self.email,
+            self.token,
+            self.base_url,
+            session=self.session,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            json_backend=self.json_backend,
+        )
+
+    def createAttachmentClient(self) -> "AtlassianAttachmentClient":
+        from .attachment_client import AtlassianAttachmentClient
+
+        return AtlassianAttachmentClient(
+            self.email,
+            self.token,
+            self.base_url,
+            session=self.session,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            json_backend=self.json_backend,
+        )
+
+    def createPageClient(self) -> "AtlassianPageClient":
+        from .page_client import AtlassianPageClient
+
+        return AtlassianPageClient(
+            self.email,
+            self.token,
+            self.base_url,
+            session=self.session,
+            cache=self.page_cache,
+            parser=self.parser,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            json_backend=self.json_backend,
+            compact=self.compact_pages,
+        )
+
+    def createAsyncBlogClient(self) -> "AsyncAtlassianBlogClient":
+        from .async_blog_client import AsyncAtlassianBlogClient
+
+        return AsyncAtlassianBlogClient(
+            self.email,
+            self.token,
+            self.base_url,
+            session=self.async_session,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            json_backend=self.json_backend,
+        )
+
+    def createAsyncAttachmentClient(self) -> "AsyncAtlassianAttachmentClient":
+        from .async_attachment_client import AsyncAtlassianAttachmentClient
 
-    def createBlogClient(self) -> AtlassianBlogClient:
-        return AtlassianBlogClient(self.email, self.token, self.base_url)
+        return AsyncAtlassianAttachmentClient(
+            self.email,
+            self.token,
+            self.base_url,
+            session=self.async_session,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            json_backend=self.json_backend,
+        )
 
-    def createAttachmentClient(self) -> AtlassianAttachmentClient:
-        return AtlassianAttachmentClient(self.email, self.token, self.base_url)
+    def createAsyncPageClient(self) -> "AsyncAtlassianPageClient":
+        from .async_page_client import AsyncAtlassianPageClient
 
-    def createPageClient(self) -> AtlassianPageClient:
-        return AtlassianPageClient(self.email, self.token, self.base_url)
+        return AsyncAtlassianPageClient(
+            self.email,
+            self.token,
+            self.base_url,
+            session=self.async_session,
+            parser=self.parser,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            json_backend=self.json_backend,
+            compact=self.compact_pages,
+        )
@@ -0,0 +1,203 @@
+import json
+import sys
+from typing import Optional, Union
+
+from .hooks import RequestHooks
+from .page import AtlassianPage, parse_storage, storage_fingerprint
+from .page_content import AtlassianPageContent
+from .storage_stream import StorageStream
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _compact_version(version: dict) -> dict:
+    """
+    Keeps the number and self link of a version, dropping e.g. the author
+    """
+    compact = {"number": int(version.get("number", 0))}
+    link = version.get("_links", {}).get("self")
+    if link is not None:
+        compact["_links"] = {"self": link}
+    return compact
+
+
+class CompactAtlassianPage:
+    """
+    Page with a small memory footprint for keeping many pages in memory at once.
+
+    Only the fields needed to update the page are kept (id, type, status, title,
+    version and links), the response dict itself is not. The storage body is held
+    either as a string or as the parsed content, never both: parsing drops the
+    string, release() serializes the content back to a string and drops the soup.
+
+    The loaded body is only kept as a fingerprint, so a body that parsing
+    rewrote without a tracked edit counts as unmodified. All edits through bs4,
+    tag.name or tag.attrs are tracked; after changing tag.contents in place, call
+    invalidate_index() on the content or put(page, force=True).
+    """
+
+    __slots__ = (
+        "page_id",
+        "type",
+        "status",
+        "title",
+        "links",
+        "parser",
+        "hooks",
+        "put_skipped",
+        "_version",
+        "_storage",
+        "_page_content",
+        "_edited",
+        "_loaded_title",
+        "_loaded_fingerprint",
+    )
+
+    def __init__(
+        self,
+        page_id: str,
+        raw_content: dict,
+        parser: Optional[str] = None,
+        hooks: Optional[RequestHooks] = None,
+    ):
+        self.page_id = page_id
+        self.type = _intern(raw_content.get("type"))
+        self.status = _intern(raw_content.get("status"))
+        self.title: Optional[str] = raw_content.get("title")
+        self.links: Optional[dict] = raw_content.get("_links")
+        self.parser = parser
+        self.hooks = hooks
+        self.put_skipped = False
+        # shared with the dicts of get_page_content_dict, like AtlassianPage's
+        # raw_content, so increase_version also updates an already built dict
+        self._version = _compact_version(raw_content.get("version", {}))
+        self._storage: Optional[str] = (
+            raw_content.get("body", {}).get("storage", {}).get("value")
+        )
+        self._page_content: Optional[AtlassianPageContent] = None
+        # tracked edits of contents released since loading
+        self._edited = False
+        self._loaded_title = self.title
+        self._loaded_fingerprint = storage_fingerprint(self.title, self._storage)
+
+    @classmethod
+    def from_page(cls, page: AtlassianPage) -> "CompactAtlassianPage":
+        """
+        Returns a compact copy of a page as it currently is
+        """
+        return cls(
+            page.get_page_id(),
+            page.get_page_content_dict(),
+            parser=page.parser,
+            hooks=page.hooks,
+        )
+
+    @property
+    def page_content(self) -> AtlassianPageContent:
+        """
+        Parses the storage body on first access and drops the string
+        """
+        if self._page_content is None:
+            self._page_content = parse_storage(
+                self.page_id,
+                self._storage,
+                parser=self.parser,
+                hooks=self.hooks,
+                keep_raw=False,
+            )
+            self._storage = None
+        return self._page_content
+
+    def release(self) -> None:
+        """
+        Serializes the parsed content back to a string and drops the soup. The
+        next access of page_content parses the string again.
+        """
+        if self._page_content is None:
+            return
+        self._storage = self._page_content.serialize()
+        self._edited = self._edited or self._page_content.modified
+        self._page_content = None
+
+    def prettify(self) -> str:
+        return json.dumps(self.get_page_content_dict(), indent=2)
+
+    def get_page_id(self) -> str:
+        return self.page_id
+
+    def get_title(self) -> str:
+        return self.title
+
+    def set_title(self, title: str) -> None:
+        self.title = title
+
+    def get_version(self) -> int:
+        return int(self._version["number"])
+
+    def is_parsed(self) -> bool:
+        return self._page_content is not None
+
+    def get_working_page_content(self) -> AtlassianPageContent:
+        return self.page_content
+
+    def get_storage_stream(self) -> StorageStream:
+        """
+        Read-only queries over the current storage body, without parsing it
+        """
+        return StorageStream(self.get_storage())
+
+    def get_storage(self) -> str:
+        if self._page_content is not None:
+            return self._page_content.serialize()
+        return self._storage
+
+    def get_page_content_dict(self) -> dict:
+        """
+        Returns a new page definition built from the kept fields
+        """
+        content = {
+            "id": self.page_id,
+            "type": self.type,
+            "status": self.status,
+            "title": self.title,
+            "body": {
+                "storage": {"value": self.get_storage(), "representation": "storage"}
+            },
+            "version": self._version,
+        }
+        if self.links is not None:
+            content["_links"] = self.links
+        return {key: value for key, value in content.items() if value is not None}
+
+    def get_loaded_fingerprint(self) -> str:
+        return self._loaded_fingerprint
+
+    def is_modified(self, storage: Optional[str] = None) -> bool:
+        """
+        Returns whether the title or the storage body differ from what was loaded.
+        A body that differs only by how parsing rewrote it, without any tracked
+        edit, is not a modification.
+        """
+        if storage is None:
+            storage = self.get_storage()
+        if storage_fingerprint(self.title, storage) == self._loaded_fingerprint:
+            return False
+        if self.title != self._loaded_title:
+            return True
+        return self._edited or (
+            self._page_content is not None and self._page_content.modified
+        )
+
+    def increase_version(self) -> None:
+        version_number = self.get_version() + 1
+        self._version["number"] = version_number
+        links = self._version.get("_links")
+        if links is not None:
+            link = links["self"]
+            links["self"] = link[: link.rfind("/") + 1] + str(version_number)
+
+
+# pages returned by the page clients, depending on their compact option
+Page = Union[AtlassianPage, CompactAtlassianPage]
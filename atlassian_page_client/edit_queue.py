@@ -0,0 +1,173 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Tuple
+
+from .compact_page import Page
+from .page_content import AtlassianPageContent
+
+if TYPE_CHECKING:
+    from .page_client import AtlassianPageClient
+
+Mutation = Callable[[AtlassianPageContent], None]
+
+
+class _Batch:
+    def __init__(self):
+        self.edits: List[Tuple[Mutation, Future]] = []
+        self.timer: Optional[threading.Timer] = None
+        # resolved once the batch was applied, for flush()
+        self.done: Future = Future()
+
+
+class PageEditQueue:
+    """
+    Collects edits of pages from any number of threads and applies all edits of
+    a page that arrive within window seconds of its first one (or max_edits of
+    them, whichever comes first) with one get and one put, through the client's
+    put_with_retry. Each edit is a mutation of the page content, as for
+    put_with_retry; submit returns a Future resolved with the updated page.
+    Cancelling the Future before its batch is sent drops the edit.
+
+    Edits of a page are applied in the order they were submitted: batches of
+    the same page are sent one after the other, in the order they were closed.
+    """
+
+    def __init__(
+        self,
+        client: "AtlassianPageClient",
+        window: float = 1.0,
+        max_edits: int = 100,
+        max_workers: int = 4,
+        max_attempts: int = 5,
+    ):
+        self.client = client
+        self.window = window
+        self.max_edits = max_edits
+        self.max_attempts = max_attempts
+        self._batches: Dict[str, _Batch] = {}
+        # per page, the batch being sent followed by the batches waiting for it
+        self._sending: Dict[str, Deque[_Batch]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._closed = False
+
+    def __enter__(self) -> "PageEditQueue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, page_id: str, mutate_fn: Mutation) -> "Future[Page]":
+        """
+        Queues mutate_fn for page_id. The Future fails with the exception raised
+        by mutate_fn, or with the error of the put if the whole batch failed.
+        """
+        future: "Future[Page]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PageEditQueue is closed")
+            batch = self._batches.get(page_id)
+            if batch is None:
+                batch = self._batches[page_id] = _Batch()
+                batch.timer = threading.Timer(
+                    self.window, self._dispatch, (page_id, batch)
+                )
+                batch.timer.daemon = True
+                batch.timer.start()
+            batch.edits.append((mutate_fn, future))
+            if len(batch.edits) >= self.max_edits:
+                self._send(page_id, batch)
+        return future
+
+    def flush(self) -> None:
+        """
+        Sends all queued edits now and waits until they are applied
+        """
+        with self._lock:
+            for page_id, batch in list(self._batches.items()):
+                self._send(page_id, batch)
+            sent = [
+                batch.done for batches in self._sending.values() for batch in batches
+            ]
+        wait(sent)
+
+    def close(self) -> None:
+        """
+        Sends the queued edits, waits for all batches and stops accepting edits
+        """
+        with self._lock:
+            self._closed = True
+            for page_id, batch in list(self._batches.items()):
+                self._send(page_id, batch)
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self, page_id: str, batch: _Batch) -> None:
+        with self._lock:
+            if self._batches.get(page_id) is batch:
+                self._send(page_id, batch)
+
+    def _send(self, page_id: str, batch: _Batch) -> None:
+        # called with self._lock held, so close() cannot shut the executor down
+        # between taking the batch and submitting it
+        del self._batches[page_id]
+        batch.timer.cancel()
+        batches = self._sending.get(page_id)
+        if batches is not None:
+            # sent by the worker of the page's current batch once it is done
+            batches.append(batch)
+        else:
+            self._sending[page_id] = deque([batch])
+            self._executor.submit(self._run, page_id, batch)
+
+    def _run(self, page_id: str, batch: Optional[_Batch]) -> None:
+        while batch is not None:
+            try:
+                self._apply(page_id, batch.edits)
+            finally:
+                # whatever happened to this batch, the next one has to be sent
+                batch.done.set_result(None)
+                with self._lock:
+                    batches = self._sending[page_id]
+                    batches.popleft()
+                    if batches:
+                        batch = batches[0]
+                    else:
+                        del self._sending[page_id]
+                        batch = None
+
+    def _apply(self, page_id: str, edits: List[Tuple[Mutation, Future]]) -> None:
+        # edits whose Future was cancelled are dropped, the others can no longer
+        # be cancelled
+        edits = [
+            (mutate_fn, future)
+            for mutate_fn, future in edits
+            if future.set_running_or_notify_cancel()
+        ]
+        if not edits:
+            return
+        errors: Dict[int, Exception] = {}
+
+        def apply_all(content: AtlassianPageContent) -> None:
+            # replayed from scratch on a version conflict
+            errors.clear()
+            for i, (mutate_fn, _) in enumerate(edits):
+                try:
+                    mutate_fn(content)
+                except Exception as e:
+                    errors[i] = e
+
+        try:
+            page = self.client.put_with_retry(
+                page_id, apply_all, max_attempts=self.max_attempts
+            )
+        except BaseException as e:
+            for _, future in edits:
+                future.set_exception(e)
+            return
+
+        for i, (_, future) in enumerate(edits):
+            if i in errors:
+                future.set_exception(errors[i])
+            else:
+                future.set_result(page)
@@ -0,0 +1,62 @@
+from typing import Any, Optional, Type
+
+
+class AtlassianAPIError(Exception):
+    """
+    Raised for a response with an unexpected status code. Subclasses narrow down
+    the status so callers can react to conflicts, rate limits or server errors
+    without parsing the message.
+    """
+
+    def __init__(self, url: Any, status_code: int, text: str):
+        super().__init__(f"Failed to get page from url {url}: {status_code} {text}")
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+
+
+class AtlassianAuthenticationError(AtlassianAPIError):
+    """401 or 403, the credentials are missing, wrong or lack permission"""
+
+
+class AtlassianNotFoundError(AtlassianAPIError):
+    """404"""
+
+
+class AtlassianConflictError(AtlassianAPIError):
+    """409, usually a put based on an outdated page version"""
+
+
+class AtlassianRateLimitError(AtlassianAPIError):
+    """429, retry_after holds the seconds requested by the server if it sent any"""
+
+    def __init__(
+        self, url: Any, status_code: int, text: str, retry_after: Optional[float] = None
+    ):
+        super().__init__(url, status_code, text)
+        self.retry_after = retry_after
+
+
+class AtlassianServerError(AtlassianAPIError):
+    """5xx"""
+
+
+def error_for_status(
+    url: Any, status_code: int, text: str, retry_after: Optional[float] = None
+) -> AtlassianAPIError:
+    """
+    Returns the exception matching a response status
+    """
+    if status_code == 429:
+        return AtlassianRateLimitError(url, status_code, text, retry_after=retry_after)
+
+    error_class: Type[AtlassianAPIError] = AtlassianAPIError
+    if status_code in (401, 403):
+        error_class = AtlassianAuthenticationError
+    elif status_code == 404:
+        error_class = AtlassianNotFoundError
+    elif status_code == 409:
+        error_class = AtlassianConflictError
+    elif status_code >= 500:
+        error_class = AtlassianServerError
+    return error_class(url, status_code, text)
@@ -0,0 +1,141 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class RequestEvent:
+    """
+    One client call, passed to RequestHooks.request_start and request_end.
+
+    timings maps a phase to seconds: connect (DNS lookup and connection setup),
+    send, ttfb (waiting for the response headers), download (reading the body),
+    serialize (get_page_content_dict), json_encode and json_decode. Network phases
+    are summed over all attempts. Phases that did not happen, or cannot be
+    measured for the session in use, are missing.
+    """
+
+    def __init__(self, method: str, url: str, page_id: Optional[str] = None):
+        self.method = method
+        self.url = url
+        self.page_id = page_id
+        self.status: Optional[int] = None
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error: Optional[BaseException] = None
+        self.timings: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.elapsed: Optional[float] = None
+
+    def add_timing(self, phase: str, seconds: float) -> None:
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(phase, time.perf_counter() - start)
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.method} {self.url}, page_id={self.page_id!r}, "
+            f"status={self.status!r}, retries={self.retries}, timings={self.timings!r})"
+        )
+
+
+class ParseEvent:
+    """
+    Parsing of a page's storage body, passed to RequestHooks.content_parsed.
+    Pages are parsed lazily, so this usually happens after the request ended.
+    """
+
+    def __init__(self, page_id: str, parser: str, chars: int, seconds: float):
+        self.page_id = page_id
+        self.parser = parser
+        self.chars = chars
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return f"ParseEvent({self.page_id!r}, {self.parser!r}, seconds={self.seconds})"
+
+
+class RequestHooks:
+    """
+    Receives instrumentation events from the clients. Subclass it and override
+    the methods of interest. They are called on the thread (or in the task) that
+    made the request, so they should return quickly.
+    """
+
+    def request_start(self, event: RequestEvent) -> None:
+        pass
+
+    def request_end(self, event: RequestEvent) -> None:
+        pass
+
+    def content_parsed(self, event: ParseEvent) -> None:
+        pass
+
+
+class _NullEvent(RequestEvent):
+    """
+    Stands in for the event of uninstrumented clients, all records are dropped
+    """
+
+    def __init__(self):
+        super().__init__("", "")
+
+    def add_timing(self, phase: str, seconds: float) -> None:
+        pass
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        yield
+
+
+NULL_EVENT = _NullEvent()
+
+# event of the client call running in the current thread or task
+current_event: "contextvars.ContextVar[Optional[RequestEvent]]" = (
+    contextvars.ContextVar("atlassian_request_event", default=None)
+)
+
+
+@contextmanager
+def instrument(
+    hooks: Optional[RequestHooks], method: str, url: str, page_id: Optional[str] = None
+) -> Iterator[RequestEvent]:
+    """
+    Wraps one client call: emits request_start and request_end around it and
+    makes the event available to the request code through current_event. Without
+    hooks, NULL_EVENT is yielded and nothing is recorded.
+    """
+    if hooks is None:
+        yield NULL_EVENT
+        return
+
+    event = RequestEvent(method.upper(), url, page_id)
+    token = current_event.set(event)
+    hooks.request_start(event)
+    try:
+        yield event
+    except BaseException as e:
+        event.error = e
+        raise
+    finally:
+        current_event.reset(token)
+        event.elapsed = time.perf_counter() - event.started
+        hooks.request_end(event)
+
+
+def body_size(data: Any) -> int:
+    """
+    Size in bytes of a request body, 0 if unknown
+    """
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    return getattr(data, "len", None) or 0
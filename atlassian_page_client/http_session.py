@@ -0,0 +1,151 @@
+import base64
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+
+def basic_auth_header(email: str, token: str) -> str:
+    """
+    Builds the value of the Authorization header once, instead of letting
+    HTTPBasicAuth re-encode the credentials on every request
+    """
+    credentials = f"{email}:{token}".encode("latin1")
+    return "Basic " + base64.b64encode(credentials).decode("ascii")
+
+
+_phases = threading.local()
+
+
+@contextmanager
+def record_phases(timings: Dict[str, float]) -> Iterator[Dict[str, float]]:
+    """
+    Adds the connect, send and ttfb timings of requests sent by the current
+    thread through a session from create_session to timings
+    """
+    previous = getattr(_phases, "timings", None)
+    _phases.timings = timings
+    try:
+        yield timings
+    finally:
+        _phases.timings = previous
+
+
+def record_phase(phase: str, start: float) -> float:
+    """
+    Adds the seconds since start to the timings of the enclosing record_phases
+    """
+    seconds = time.perf_counter() - start
+    timings = getattr(_phases, "timings", None)
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+    return seconds
+
+
+def create_session(
+    email: str,
+    token: str,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    keep_alive: bool = True,
+) -> "requests.Session":
+    """
+    Creates a pooled requests session authenticated for the given credentials.
+
+    pool_connections is the number of per-host pools that are cached,
+    pool_maxsize the number of connections kept open per host.
+    """
+    # imported here so that the async clients never import requests
+    import requests
+
+    from .timed_adapter import TimedHTTPAdapter
+
+    session = requests.Session()
+    adapter = TimedHTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers["Authorization"] = basic_auth_header(email, token)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def _connect_trace(aiohttp) -> "aiohttp.TraceConfig":
+    """
+    Times connection setup (including DNS) of requests that pass a timings dict
+    as trace_request_ctx
+    """
+
+    async def on_start(session, context, params) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def on_end(session, context, params) -> None:
+        timings = context.trace_request_ctx
+        if isinstance(timings, dict):
+            seconds = time.perf_counter() - context.connect_start
+            timings["connect"] = timings.get("connect", 0.0) + seconds
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_start.append(on_start)
+    trace.on_connection_create_end.append(on_end)
+    return trace
+
+
+class AsyncSession:
+    """
+    Holds one aiohttp ClientSession shared by async clients. The ClientSession is
+    created on first use, inside the running event loop, with the same pool and
+    keep-alive settings as create_session. An existing ClientSession can be passed
+    in instead, it is then left open by close().
+    """
+
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        client_session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        self.headers = {"Authorization": basic_auth_header(email, token)}
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.client_session = client_session
+        self._owns_session = client_session is None
+
+    async def get(self) -> "aiohttp.ClientSession":
+        if self.client_session is None or self.client_session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError(
+                    "The async clients require aiohttp, install it with "
+                    "'pip install atlassian-page-client[async]'"
+                ) from e
+
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_connections * self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+                force_close=not self.keep_alive,
+            )
+            self.client_session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[_connect_trace(aiohttp)]
+            )
+            self._owns_session = True
+
+        return self.client_session
+
+    async def close(self) -> None:
+        if self._owns_session and self.client_session is not None:
+            await self.client_session.close()
+        self.client_session = None
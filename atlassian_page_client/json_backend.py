@@ -0,0 +1,99 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+AUTO_BACKEND = "auto"
+
+# tried in this order by resolve_json_backend(None)
+PREFERRED_BACKENDS = ("orjson", "ujson", "json")
+
+
+class JsonBackend:
+    """
+    Decodes JSON from bytes (or str) and encodes it straight to UTF-8 bytes, so
+    response bodies are parsed without decoding them to a str first and request
+    bodies are sent without an intermediate str where the library allows it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], bytes],
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonBackend({self.name!r})"
+
+
+def _orjson() -> JsonBackend:
+    import orjson
+
+    return JsonBackend("orjson", orjson.loads, orjson.dumps)
+
+
+def _ujson() -> JsonBackend:
+    import ujson
+
+    return JsonBackend(
+        "ujson", ujson.loads, lambda obj: ujson.dumps(obj).encode("utf-8")
+    )
+
+
+def _stdlib() -> JsonBackend:
+    return JsonBackend("json", json.loads, lambda obj: json.dumps(obj).encode("ascii"))
+
+
+_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    "orjson": _orjson,
+    "ujson": _ujson,
+    "json": _stdlib,
+}
+_resolved: Dict[str, JsonBackend] = {}
+
+
+def resolve_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Returns the JSON backend with the given name: "orjson", "ujson", "json" (the
+    standard library), or "auto"/None for the fastest one that is installed
+    """
+    name = name or AUTO_BACKEND
+    if name in _resolved:
+        return _resolved[name]
+
+    if name == AUTO_BACKEND:
+        for candidate in PREFERRED_BACKENDS:
+            try:
+                backend = _FACTORIES[candidate]()
+            except ImportError:
+                continue
+            break
+    elif name in _FACTORIES:
+        try:
+            backend = _FACTORIES[name]()
+        except ImportError as e:
+            raise ImportError(
+                f"JSON backend '{name}' is not installed, install it with "
+                f"'pip install {name}' or use the 'json' backend"
+            ) from e
+    else:
+        raise ValueError(
+            f"Unknown JSON backend '{name}', use one of "
+            f"{', '.join(_FACTORIES)} or '{AUTO_BACKEND}'"
+        )
+
+    _resolved[name] = backend
+    return backend
+
+
+def json_headers(headers: Dict[str, str], body: bytes) -> Dict[str, str]:
+    """
+    Returns the headers for a JSON request body. The clients declare
+    charset=iso-8859-1, which is only accurate for ASCII bodies (all non-ASCII
+    characters escaped); bodies with raw UTF-8 declare utf-8 instead.
+    """
+    if body.isascii():
+        return headers
+    return {**headers, "Content-Type": "application/json;charset=utf-8"}
@@ -0,0 +1,178 @@
+import io
+import os
+import uuid
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Union
+
+FileSource = Union[bytes, BinaryIO, Iterable[bytes]]
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def _quote(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+def _remaining_size(source: FileSource) -> Optional[int]:
+    """
+    Number of bytes left in source, or None when it cannot be known up front
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if not hasattr(source, "read"):
+        return None
+
+    try:
+        return os.fstat(source.fileno()).st_size - source.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+
+    try:
+        position = source.tell()
+        end = source.seek(0, os.SEEK_END)
+        source.seek(position)
+        return end - position
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+class MultipartField:
+    def __init__(
+        self,
+        name: str,
+        source: FileSource,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ):
+        self.name = name
+        self.source = source
+        self.filename = filename
+        self.content_type = content_type
+
+    def header(self, boundary: str) -> bytes:
+        disposition = f'form-data; name="{_quote(self.name)}"'
+        if self.filename is not None:
+            disposition += f'; filename="{_quote(self.filename)}"'
+
+        lines = [f"--{boundary}", f"Content-Disposition: {disposition}"]
+        if self.content_type is not None:
+            lines.append(f"Content-Type: {self.content_type}")
+
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+
+class MultipartEncoder:
+    """
+    Streams a multipart/form-data body without loading the files into memory.
+
+    Files are read chunk_size bytes at a time while the request is being sent,
+    so memory use does not depend on the file size. Sources can be bytes,
+    binary file objects or iterables of bytes. When all sizes are known the
+    encoder reports its length and requests sends a Content-Length header,
+    otherwise the body is sent with chunked transfer encoding.
+
+    progress_callback is called with the number of bytes produced so far and
+    the total length (or None) every time a chunk is read.
+    """
+
+    def __init__(
+        self,
+        fields: List[MultipartField],
+        boundary: Optional[str] = None,
+        chunk_size: int = 64 * 1024,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        self.fields = fields
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.bytes_read = 0
+        self._length_computed = False
+        self._length: Optional[int] = None
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = bytearray()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def len(self) -> Optional[int]:
+        """
+        Total body length, read by requests to set the Content-Length header
+        """
+        self._ensure_length()
+        return self._length
+
+    def _ensure_length(self) -> None:
+        # file sources only know their remaining size before they are read
+        if not self._length_computed:
+            self._length = self._compute_length()
+            self._length_computed = True
+
+    def _compute_length(self) -> Optional[int]:
+        total = len(self._closing())
+        for field in self.fields:
+            size = _remaining_size(field.source)
+            if size is None:
+                return None
+            total += len(field.header(self.boundary)) + size + 2
+        return total
+
+    def _closing(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode("ascii")
+
+    def _iter_source(self, source: FileSource) -> Iterator[bytes]:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            yield bytes(source)
+        elif hasattr(source, "read"):
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        else:
+            for chunk in source:
+                if chunk:
+                    yield chunk
+
+    def _generate(self) -> Iterator[bytes]:
+        for field in self.fields:
+            yield field.header(self.boundary)
+            yield from self._iter_source(field.source)
+            yield b"\r\n"
+        yield self._closing()
+
+    def _next_chunk(self) -> bytes:
+        if self._chunks is None:
+            self._ensure_length()
+            self._chunks = self._generate()
+        chunk = next(self._chunks, b"")
+        if chunk:
+            self.bytes_read += len(chunk)
+            if self.progress_callback is not None:
+                self.progress_callback(self.bytes_read, self.len)
+        return chunk
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
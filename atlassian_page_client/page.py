@@ -1,15 +1,80 @@
+import hashlib
 import json
+import time
+from typing import Optional
 
+from .hooks import ParseEvent, RequestHooks
 from .page_content import AtlassianPageContent
+from .storage_stream import StorageStream
+
+
+def storage_fingerprint(title: Optional[str], storage: Optional[str]) -> str:
+    """
+    Returns a digest of a page title and storage body
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (title, storage):
+        digest.update((part or "").encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def parse_storage(
+    page_id: str,
+    storage: str,
+    parser: Optional[str] = None,
+    hooks: Optional[RequestHooks] = None,
+    keep_raw: bool = True,
+) -> AtlassianPageContent:
+    """
+    Parses a storage body and reports the parse to the hooks, if any
+    """
+    start = time.perf_counter()
+    content = AtlassianPageContent(storage, parser=parser, keep_raw=keep_raw)
+    if hooks is not None:
+        hooks.content_parsed(
+            ParseEvent(
+                page_id, content.parser, len(storage), time.perf_counter() - start
+            )
+        )
+    return content
 
 
 class AtlassianPage:
-    def __init__(self, page_id: str, raw_content: dict):
+    def __init__(
+        self,
+        page_id: str,
+        raw_content: dict,
+        parser: Optional[str] = None,
+        hooks: Optional[RequestHooks] = None,
+    ):
         self.page_id = page_id
         self.raw_content = raw_content
-        self.page_content = AtlassianPageContent(
-            self.raw_content["body"]["storage"]["value"]
+        self.parser = parser
+        self.hooks = hooks
+        self._page_content: Optional[AtlassianPageContent] = None
+        # set by the page clients when put found nothing to send
+        self.put_skipped = False
+        self._loaded_title = raw_content.get("title")
+        self._loaded_storage = (
+            raw_content.get("body", {}).get("storage", {}).get("value")
         )
+        self._loaded_fingerprint: Optional[str] = None
+
+    @property
+    def page_content(self) -> AtlassianPageContent:
+        """
+        The storage body is only parsed when the content is first accessed, so
+        reading metadata or the raw body never pays for building the soup
+        """
+        if self._page_content is None:
+            self._page_content = parse_storage(
+                self.page_id,
+                self.raw_content["body"]["storage"]["value"],
+                parser=self.parser,
+                hooks=self.hooks,
+            )
+        return self._page_content
 
     def prettify(self) -> str:
         return json.dumps(self.get_page_content_dict(), indent=2)
@@ -17,15 +82,73 @@ class AtlassianPage:
     def get_page_id(self) -> str:
         return self.page_id
 
+    def get_title(self) -> str:
+        return self.raw_content["title"]
+
+    def get_version(self) -> int:
+        return int(self.raw_content["version"]["number"])
+
+    def is_parsed(self) -> bool:
+        return self._page_content is not None
+
     def get_working_page_content(self) -> AtlassianPageContent:
         return self.page_content
 
+    def get_storage_stream(self) -> StorageStream:
+        """
+        Read-only queries over the current storage body, without parsing it
+        """
+        return StorageStream(self.get_page_content_dict()["body"]["storage"]["value"])
+
     def get_page_content_dict(self) -> dict:
+        """
+        Returns the page definition. If the working content was never requested,
+        the storage body is the original string exactly as it was received.
+        """
         content = self.raw_content
-        content["body"]["storage"]["value"] = self.page_content.soup.__str__()
+        if self._page_content is not None:
+            content["body"]["storage"]["value"] = self._page_content.serialize()
 
         return content
 
+    def get_loaded_fingerprint(self) -> str:
+        """
+        Returns the fingerprint of the title and storage body as the page was loaded.
+        It is computed on first use, the loaded strings are kept until then anyway.
+        """
+        if self._loaded_fingerprint is None:
+            self._loaded_fingerprint = storage_fingerprint(
+                self._loaded_title, self._loaded_storage
+            )
+        return self._loaded_fingerprint
+
+    def is_modified(self, storage: Optional[str] = None) -> bool:
+        """
+        Returns whether the title or the storage body differ from what was loaded.
+        storage is the serialized body if the caller already has it from
+        get_page_content_dict, otherwise the page is serialized here.
+
+        Parsing and serializing can rewrite markup that was never touched (e.g.
+        self-closing tags), so when the serialized body differs from the loaded
+        string without any tracked edit, it is compared with an unedited parse of
+        the loaded body before the page counts as modified.
+        """
+        title = self.raw_content.get("title")
+        if storage is None:
+            storage = self.get_page_content_dict()["body"]["storage"]["value"]
+        if title == self._loaded_title and storage is self._loaded_storage:
+            return False
+        if storage_fingerprint(title, storage) == self.get_loaded_fingerprint():
+            return False
+        if (
+            self._page_content is None
+            or self._page_content.modified
+            or title != self._loaded_title
+        ):
+            return True
+        unedited = AtlassianPageContent(self._loaded_storage, parser=self.parser)
+        return storage != str(unedited.soup)
+
     def increase_version(self) -> None:
         """
         Takes a confluence page definition, extracts the version number and increases it
@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+
+class PageCache:
+    """
+    In-memory LRU cache of page responses keyed by page id and version number.
+
+    Entries are stored as the raw JSON body of the response (bytes as received,
+    or text), every hit is decoded again so callers never share (and never leak
+    edits into) the same page dict. The cache is bounded by max_entries and/or
+    max_bytes, where the size of an entry is the length of its JSON body. Only
+    the newest version of each page is kept. Safe to share between threads and
+    clients.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None
+    ):
+        if max_entries is None and max_bytes is None:
+            raise ValueError("PageCache needs max_entries or max_bytes")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, int], Union[bytes, str]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self._versions
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def get_version(self, page_id: str) -> Optional[int]:
+        """
+        Returns the version number cached for page_id without counting a lookup
+        """
+        return self._versions.get(page_id)
+
+    def get(
+        self, page_id: str, version: Optional[int] = None
+    ) -> Optional[Union[bytes, str]]:
+        """
+        Returns the cached response body of page_id, or None. Without version the
+        newest cached version is returned, otherwise only that exact version.
+        """
+        with self._lock:
+            cached_version = self._versions.get(page_id)
+            if cached_version is None or (
+                version is not None and version != cached_version
+            ):
+                self.misses += 1
+                return None
+
+            key = (page_id, cached_version)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, page_id: str, version: int, raw: Union[bytes, str]) -> None:
+        with self._lock:
+            cached_version = self._versions.get(page_id)
+            if cached_version is not None:
+                if cached_version > version:
+                    return
+                self._remove((page_id, cached_version))
+
+            if self.max_bytes is not None and len(raw) > self.max_bytes:
+                return
+
+            self._entries[(page_id, version)] = raw
+            self._versions[page_id] = version
+            self._bytes += len(raw)
+            self._evict()
+
+    def invalidate(self, page_id: str) -> None:
+        with self._lock:
+            cached_version = self._versions.get(page_id)
+            if cached_version is not None:
+                self._remove((page_id, cached_version))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Tuple[str, int]) -> None:
+        raw = self._entries.pop(key)
+        del self._versions[key[0]]
+        self._bytes -= len(raw)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
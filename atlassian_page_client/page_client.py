@@ -1,48 +1,259 @@
 # Call JIRA API with HTTPBasicAuth
-import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
 import requests
-from requests.auth import HTTPBasicAuth
 
+from .base_client import AtlassianBaseClient
+from .bulk import BulkResult, run_bulk
+from .compact_page import CompactAtlassianPage, Page
+from .exceptions import AtlassianConflictError
+from .hooks import RequestHooks
+from .json_backend import json_headers
 from .page import AtlassianPage
+from .page_cache import PageCache
+from .page_content import AtlassianPageContent
+from .page_summary import PageSummary
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
 
 
-class AtlassianPageClient:
+class AtlassianPageClient(AtlassianBaseClient):
 
     HEADERS = {"Content-Type": "application/json;charset=iso-8859-1"}
 
-    def __init__(self, email: str, token: str, base_url: str):
-        self.base_url = base_url
-        self.email = email
-        self.token = token
-        self.basicAuth = HTTPBasicAuth(self.email, self.token)
+    def __init__(
+        self,
+        email: str,
+        token: str,
+        base_url: str,
+        session: Optional[requests.Session] = None,
+        cache: Optional[PageCache] = None,
+        parser: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        json_backend: Optional[str] = None,
+        compact: bool = False,
+    ):
+        super().__init__(
+            email,
+            token,
+            base_url,
+            session=session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            json_backend=json_backend,
+        )
+        self.cache = cache
+        self.parser = parser
+        # return CompactAtlassianPages instead of AtlassianPages
+        self.compact = compact
+        self._in_flight = SingleFlight()
+
+    def get(self, page_id: str) -> Page:
+        """
+        Fetches a page. With a cache configured and the page cached, only the
+        current version number is requested (see get_version) and the body is
+        taken from the cache if that version is cached, so a page edited
+        elsewhere is never returned stale.
+        """
+        if self.cache is not None:
+            version = self.get_version(page_id) if page_id in self.cache else None
+            cached = self.cache.get(page_id, version=version)
+            if cached is not None:
+                return self._page(page_id, self.json.loads(cached))
+
+        return self._fetch(page_id)
+
+    def get_version(self, page_id: str) -> int:
+        """
+        Returns the current version number of a page. Only the version is
+        expanded, the storage body is not transferred.
+        """
+        apiUrl = f"/wiki/rest/api/content/{page_id}?expand=version"
+
+        with self._instrument("get", apiUrl, page_id) as event:
+            response: requests.Response = self._request("get", apiUrl)
+
+            self.check_response(response)
+
+            with event.phase("json_decode"):
+                return int(self.json.loads(response.content)["version"]["number"])
+
+    def get_if_changed(self, page_id: str, known_version: int) -> Optional[Page]:
+        """
+        Returns None if the page is still at known_version, otherwise the current
+        page. Checks the version first and only downloads the body when it moved,
+        taking it from the cache when that exact version is cached.
+        """
+        version = self.get_version(page_id)
+        if version == known_version:
+            return None
+
+        if self.cache is not None:
+            cached = self.cache.get(page_id, version=version)
+            if cached is not None:
+                return self._page(page_id, self.json.loads(cached))
+
+        return self._fetch(page_id)
+
+    def get_many(
+        self, page_ids: Iterable[str], max_workers: int = 8, ordered: bool = True
+    ) -> Iterator[BulkResult]:
+        """
+        Fetches pages concurrently with at most max_workers requests in flight.
+        Yields one BulkResult per page id, with the AtlassianPage as result or the
+        exception raised for that page as error. Results follow the input order
+        unless ordered is False, in which case they are yielded as they finish.
+
+        When the client uses a shared session, keep max_workers at or below the
+        session's pool_maxsize so every worker gets a pooled connection.
+        """
+        return run_bulk(self.get, page_ids, max_workers=max_workers, ordered=ordered)
+
+    def iter_space_pages(
+        self, space_id: str, limit: int = 250, prefetch: bool = True
+    ) -> Iterator[PageSummary]:
+        """
+        Yields a PageSummary for every page of a space, following the cursor of
+        the v2 listing API one result page (of up to limit entries) at a time.
+        Only the current result page is held in memory. With prefetch, the next
+        result page is requested in the background while the current one is
+        being consumed.
+        """
+        apiUrl = f"/wiki/api/v2/spaces/{space_id}/pages?limit={limit}"
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        try:
+            listing = self._get_json(apiUrl)
+            while True:
+                next_url = listing.get("_links", {}).get("next")
+                pending: Optional[Future] = None
+                if next_url and executor is not None:
+                    pending = executor.submit(self._get_json, next_url)
+
+                for result in listing["results"]:
+                    yield PageSummary.from_dict(result)
 
-    def check_response(self, response: requests.Response) -> None:
-        if response.status_code != 200:
-            raise Exception(
-                f"Failed to get page from url {response.url}: {response.status_code} {response.text}"
+                if not next_url:
+                    return
+                listing = (
+                    pending.result()
+                    if pending is not None
+                    else self._get_json(next_url)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def put(self, page: Page, force: bool = False) -> Page:
+        """
+        Updates a page and returns the page sent back by Confluence. A page whose
+        title and storage body still match what was loaded is not sent: no request
+        is made, the version is left alone and the page itself is returned with
+        put_skipped set. Pass force=True to always send the page.
+        """
+        page_id = page.get_page_id()
+        apiUrl = f"/wiki/rest/api/content/{page_id}"
+
+        with self._instrument("put", apiUrl, page_id) as event:
+            with event.phase("serialize"):
+                content = page.get_page_content_dict()
+            if not force and not page.is_modified(content["body"]["storage"]["value"]):
+                page.put_skipped = True
+                return page
+            page.increase_version()
+            with event.phase("json_encode"):
+                data = self.json.dumps(content)
+
+            response: requests.Response = self._request(
+                "put", apiUrl, data=data, headers=json_headers(self.HEADERS, data)
             )
 
-    def get(self, page_id: str) -> AtlassianPage:
-        apiUrl = f"/wiki/rest/api/content/{page_id}?expand=body.storage,version"
+            self.check_response(response)
 
-        response = requests.get(
-            self.base_url + apiUrl, headers=self.HEADERS, auth=self.basicAuth
-        )
+            with event.phase("json_decode"):
+                content = self.json.loads(response.content)
+            self._cache_response(page_id, content, response.content)
+
+        return self._page(page_id, content)
+
+    def put_with_retry(
+        self,
+        page_id: str,
+        mutate_fn: Callable[[AtlassianPageContent], None],
+        max_attempts: int = 5,
+    ) -> Page:
+        """
+        Applies mutate_fn to the content of the current version of a page and puts
+        it. When the put conflicts (409) because the page was edited in between,
+        the page is fetched again and mutate_fn is replayed on the fresh content,
+        at most max_attempts times in total. With a retry policy, attempts are
+        spaced by its backoff. mutate_fn must only depend on the content it gets,
+        as it may run more than once.
+        """
+        attempt = 1
+        while True:
+            page = self._fetch(page_id)
+            mutate_fn(page.get_working_page_content())
+            try:
+                return self.put(page)
+            except AtlassianConflictError:
+                if attempt >= max_attempts:
+                    raise
+            if self.retry_policy is not None:
+                time.sleep(self.retry_policy.backoff(attempt))
+            attempt += 1
+
+    def _get_json(self, api_url: str) -> dict:
+        if api_url.startswith(self.base_url):
+            api_url = api_url[len(self.base_url) :]
 
-        self.check_response(response)
+        with self._instrument("get", api_url) as event:
+            response: requests.Response = self._request("get", api_url)
 
-        return AtlassianPage(page_id, json.loads(response.text))
+            self.check_response(response)
 
-    def put(self, page: AtlassianPage) -> AtlassianPage:
-        apiUrl = f"/wiki/rest/api/content/{page.get_page_id()}"
-        page.increase_version()
-        data = json.dumps(page.get_page_content_dict())
+            with event.phase("json_decode"):
+                return self.json.loads(response.content)
 
-        response = requests.put(
-            self.base_url + apiUrl, data=data, headers=self.HEADERS, auth=self.basicAuth
+    def _fetch(self, page_id: str) -> Page:
+        """
+        Downloads a page. Concurrent calls for the same page share one request:
+        the first caller sends it, the others wait for its response and decode
+        their own copy of it, so every caller gets an independent page.
+        """
+        (content, raw), shared = self._in_flight.do(
+            page_id, lambda: self._fetch_content(page_id)
         )
+        if shared:
+            content = self.json.loads(raw)
+
+        return self._page(page_id, content)
+
+    def _fetch_content(self, page_id: str) -> Tuple[dict, bytes]:
+        apiUrl = f"/wiki/rest/api/content/{page_id}?expand=body.storage,version"
+
+        with self._instrument("get", apiUrl, page_id) as event:
+            response: requests.Response = self._request("get", apiUrl)
+
+            self.check_response(response)
+
+            with event.phase("json_decode"):
+                content = self.json.loads(response.content)
+            self._cache_response(page_id, content, response.content)
+
+        return content, response.content
 
-        self.check_response(response)
+    def _page(self, page_id: str, content: dict) -> Page:
+        page_class = CompactAtlassianPage if self.compact else AtlassianPage
+        return page_class(page_id, content, parser=self.parser, hooks=self.hooks)
 
-        return AtlassianPage(page.get_page_id(), json.loads(response.text))
+    def _cache_response(self, page_id: str, content: dict, raw: bytes) -> None:
+        if self.cache is None or "storage" not in content.get("body", {}):
+            return
+        self.cache.put(page_id, int(content["version"]["number"]), raw)
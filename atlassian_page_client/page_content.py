@@ -1,11 +1,542 @@
+import re
+import uuid
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
 import bs4
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+DEFAULT_PARSER = "html.parser"
+FAST_PARSER = "fast"
+
+_CDATA_RE = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.DOTALL)
+_SELF_CLOSING_RE = re.compile(
+    r"<([a-zA-Z][\w:.-]*)((?:\s+[^\s=/>]+(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'>]+))?)*)\s*/>"
+)
+_VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+class _TrackingMixin:
+    """
+    Reports changes of a tag (children added or removed, a new name or attrs
+    dict) to the AtlassianPageContent owning the document (edits of the attrs
+    dict are reported by _TrackedAttributes), so derived data such as the
+    attribute index stays valid while callers edit the tree.
+    """
+
+    def __setattr__(self, name, value):
+        # called for every field set on a tracked element, e.g. by new_tag, so
+        # the untracked ones take the shortest path
+        if name not in _TRACKED_FIELDS:
+            object.__setattr__(self, name, value)
+        elif name == "contents":
+            object.__setattr__(self, name, _TrackedContents(self, value))
+        else:
+            _set_rendered_field(self, name, value)
+
+    def insert(self, position, *new_children):
+        # wrapped here as bs4 would, so that the inserted elements are known
+        # also with bs4 < 4.13, where insert returns None
+        new_children = tuple(
+            (
+                bs4.element.NavigableString(child)
+                if isinstance(child, str)
+                and not isinstance(child, bs4.element.NavigableString)
+                else child
+            )
+            for child in new_children
+        )
+        content = _owning_content(self)
+        if content is not None:
+            content._before_change()
+        inserted = super().insert(position, *new_children)
+        if content is not None:
+            added = inserted if isinstance(inserted, list) else new_children
+            for child in added:
+                content._on_added(child)
+        return inserted
+
+
+class _TrackedContents(list):
+    """
+    Children of a tracked tag. bs4 removes an element (tag or string) from its
+    parent with del parent.contents[i], which is reported here.
+    """
+
+    __slots__ = ("tag",)
+
+    def __init__(self, tag: bs4.element.Tag, children=()):
+        super().__init__(children)
+        self.tag = tag
+
+    def __delitem__(self, index):
+        content = _owning_content(self.tag)
+        if content is not None:
+            removed = self[index] if isinstance(index, slice) else [self[index]]
+            for element in removed:
+                content._on_removed(element)
+        super().__delitem__(index)
+
+
+def _tag_content(tag: bs4.element.Tag) -> Optional["AtlassianPageContent"]:
+    # reads parent from __dict__: while bs4 sets up a tag it has no parent yet
+    # and Tag.__getattr__ would turn the lookup into a find()
+    if tag.__dict__.get("parent") is None:
+        return None
+    return _owning_content(tag)
+
+
+def _reports_attribute_change(method):
+    def tracked(self, *args, **kwargs):
+        tag = self.tag
+        content = None
+        if tag is not None and tag.attrs.get(self.key) is self:
+            content = _tag_content(tag)
+        if content is not None:
+            content._on_removed_attribute(tag, self.key)
+        result = method(self, *args, **kwargs)
+        if content is not None:
+            content._on_added_attribute(tag, self.key)
+        return result
+
+    return tracked
+
+
+class _TrackedAttributeList(list):
+    """
+    Value of a multi-valued attribute (e.g. class) of a tracked tag, reports
+    in-place edits such as tag["class"].append(...)
+    """
+
+    __slots__ = ("tag", "key")
+
+    def __init__(
+        self,
+        values=(),
+        tag: Optional[bs4.element.Tag] = None,
+        key: Optional[str] = None,
+    ):
+        super().__init__(values)
+        self.tag = tag
+        self.key = key
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(
+        _TrackedAttributeList,
+        _name,
+        _reports_attribute_change(getattr(list, _name)),
+    )
+
+
+class _TrackedAttributes(dict):
+    """
+    Attribute dict of a tracked tag. Reports changes to the owning
+    AtlassianPageContent, for tag[key] as well as for edits of tag.attrs.
+    """
+
+    __slots__ = ("tag",)
+
+    def __init__(self, tag: bs4.element.Tag, attributes: Dict[str, str]):
+        super().__init__(attributes)
+        self.tag = tag
+        for key, value in attributes.items():
+            if isinstance(value, list):
+                dict.__setitem__(self, key, self._value(tag, key, value))
+
+    @staticmethod
+    def _value(tag: bs4.element.Tag, key: str, value):
+        if isinstance(value, list) and not (
+            isinstance(value, _TrackedAttributeList)
+            and value.tag is tag
+            and value.key == key
+        ):
+            return _TrackedAttributeList(value, tag, key)
+        return value
+
+    def __setitem__(self, key, value):
+        content = _tag_content(self.tag)
+        if content is not None:
+            content._on_removed_attribute(self.tag, key)
+        super().__setitem__(key, self._value(self.tag, key, value))
+        if content is not None:
+            content._on_added_attribute(self.tag, key)
+
+    def __delitem__(self, key):
+        content = _tag_content(self.tag)
+        if content is not None:
+            content._on_removed_attribute(self.tag, key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            content = _tag_content(self.tag)
+            if content is not None:
+                content._on_removed_attribute(self.tag, key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
+
+
+# tag fields that change how a tag is rendered, and its children
+_TRACKED_FIELDS = frozenset(
+    {"name", "prefix", "attrs", "hidden", "can_be_empty_element", "contents"}
+)
+
+
+def _set_rendered_field(tag: bs4.element.Tag, name: str, value) -> None:
+    if name == "attrs":
+        value = _TrackedAttributes(tag, value)
+    # the first assignment is bs4 setting up the tag
+    content = _tag_content(tag) if name in tag.__dict__ else None
+    if content is None:
+        object.__setattr__(tag, name, value)
+        return
+    content._before_change()
+    if name == "attrs":
+        for key in tag.attrs:
+            content._on_removed_attribute(tag, key)
+        object.__setattr__(tag, name, value)
+        for key in value:
+            content._on_added_attribute(tag, key)
+    else:
+        content._on_changed(tag)
+        object.__setattr__(tag, name, value)
+
+
+class _TrackedTag(_TrackingMixin, bs4.element.Tag):
+    pass
+
+
+class _TrackedSoup(_TrackingMixin, BeautifulSoup):
+    _atlassian_content: Optional["AtlassianPageContent"] = None
+
+
+def _owning_content(
+    element: bs4.element.PageElement,
+) -> Optional["AtlassianPageContent"]:
+    root = element
+    while root.parent is not None:
+        root = root.parent
+    if isinstance(root, _TrackedSoup):
+        return root._atlassian_content
+    return None
+
+
+def _iter_tags(element: bs4.element.PageElement) -> Iterator[bs4.element.Tag]:
+    if isinstance(element, bs4.element.Tag):
+        yield element
+        yield from element.find_all(True)
+
+
+def _index_value(tag: bs4.element.Tag, attribute_name: str) -> Optional[str]:
+    # same matching rule as find_by_Attribute: the first value of the attribute
+    values = tag.get_attribute_list(attribute_name)
+    if not values or values[0] is None:
+        return None
+    return values[0]
+
+
+def resolve_parser(parser: Optional[str] = None) -> str:
+    """
+    Maps a parser choice to a bs4 tree builder name. None selects the default
+    "html.parser", "fast" selects lxml when it is installed.
+    """
+    if parser is None:
+        return DEFAULT_PARSER
+    if parser == FAST_PARSER:
+        return "lxml" if builder_registry.lookup("lxml") is not None else DEFAULT_PARSER
+    return parser
+
+
+def _parse(raw_html: str, parser: str) -> _TrackedSoup:
+    """
+    Parses storage format with the given backend. lxml and html5lib are HTML
+    document parsers, so the markup is prepared for them and the result is
+    brought back to the same fragment tree html.parser builds: CDATA sections
+    (code macros) are swapped for placeholder comments, self-closing storage
+    tags are expanded for html5lib, and the implied html/body wrapper is removed.
+    """
+    if parser == DEFAULT_PARSER:
+        return _track(BeautifulSoup(raw_html, parser))
+
+    cdata: List[str] = []
+    marker = f"atlassian-cdata-{uuid.uuid4().hex}-"
+
+    def to_placeholder(match: "re.Match[str]") -> str:
+        cdata.append(match.group(1))
+        return f"<!--{marker}{len(cdata) - 1}-->"
+
+    def expand_self_closing(match: "re.Match[str]") -> str:
+        if match.group(1).lower() in _VOID_ELEMENTS:
+            return match.group(0)
+        return f"<{match.group(1)}{match.group(2)}></{match.group(1)}>"
+
+    markup = _CDATA_RE.sub(to_placeholder, raw_html)
+    if parser == "html5lib":
+        markup = _SELF_CLOSING_RE.sub(expand_self_closing, markup)
+
+    soup = BeautifulSoup(markup, parser)
+    _unwrap_document(soup)
+
+    if cdata:
+        for comment in soup.find_all(
+            string=lambda s: isinstance(s, bs4.element.Comment) and s.startswith(marker)
+        ):
+            comment.replace_with(bs4.element.CData(cdata[int(comment[len(marker) :])]))
+
+    return _track(soup)
+
+
+def _track(soup: BeautifulSoup) -> _TrackedSoup:
+    """
+    Turns a parsed soup into a tracked one. The tree is built from the plain bs4
+    classes and converted once parsed, since the __setattr__ of the tracked ones
+    would run for every field bs4 sets while building it.
+    """
+    soup.__class__ = _TrackedSoup
+    # tags created later, e.g. by new_tag, are tracked from the start
+    soup.element_classes = {**soup.element_classes, bs4.element.Tag: _TrackedTag}
+    object.__setattr__(soup, "contents", _TrackedContents(soup, soup.contents))
+    for tag in soup.descendants:
+        if isinstance(tag, bs4.element.Tag):
+            tag.__class__ = _TrackedTag
+            object.__setattr__(tag, "contents", _TrackedContents(tag, tag.contents))
+            object.__setattr__(tag, "attrs", _TrackedAttributes(tag, tag.attrs))
+    return soup
+
+
+def _unwrap_document(soup: BeautifulSoup) -> None:
+    document = soup.find("html", recursive=False)
+    if document is None:
+        return
+
+    children: List[bs4.element.PageElement] = []
+    for part in document.find_all(["head", "body"], recursive=False):
+        children.extend(part.contents)
+
+    # relink the nodes directly, moving them one by one with append() would
+    # look up every node's index in its old parent
+    soup.contents = children
+    previous = None
+    for child in children:
+        child.parent = soup
+        child.previous_sibling = previous
+        if previous is not None:
+            previous.next_sibling = child
+            previous._last_descendant().next_element = child
+            child.previous_element = previous._last_descendant()
+        previous = child
+
+    if children:
+        soup.next_element = children[0]
+        children[0].previous_element = soup
+        children[-1].next_sibling = None
+        children[-1]._last_descendant().next_element = None
+    else:
+        soup.next_element = None
+
+
+_Run = Tuple[Tuple[bs4.element.PageElement, ...], int, int]
+
+
+def _closing_position(
+    raw_html: str,
+    tag: bs4.element.Tag,
+    trailing: List[bs4.element.PageElement],
+    start: int,
+    end: int,
+) -> Optional[int]:
+    """
+    Returns where the contents of tag end in raw_html[start:end], the source of
+    tag and the strings in trailing, or None unless the tag is closed there
+    (explicitly or as an empty element) with nothing but those strings after it
+    """
+    if any(type(node) is not bs4.element.NavigableString for node in trailing):
+        return None
+
+    closing = raw_html.rfind("</", start, end)
+    after = raw_html.find(">", closing, end) if closing > start else -1
+    if after >= 0 and raw_html[closing + 2 : after].strip().lower() == tag.name:
+        position = closing
+    elif not tag.contents:
+        after = raw_html.find(">", start, end)
+        if (
+            after < 0
+            or "<" in raw_html[start + 1 : after]
+            or not (raw_html[after - 1] == "/" or tag.name in _VOID_ELEMENTS)
+        ):
+            return None
+        position = after
+    else:
+        return None
+
+    tail = raw_html[after + 1 : end]
+    if ("<" in tail) if trailing else tail:
+        return None
+    return position
+
+
+def _source_runs(soup: BeautifulSoup, raw_html: str) -> Dict[int, _Run]:
+    """
+    Maps tags of a document parsed by html.parser to the span of raw_html they
+    were parsed from, together with the strings following them up to the next
+    tag. Each run is keyed by the id of its tag (or of its first string, for the
+    strings before the first tag of the document) and only recorded if its
+    source is self-contained, i.e. parses to the same nodes wherever it is put.
+    """
+    line_starts = [0]
+    line_starts.extend(match.end() for match in re.finditer("\n", raw_html))
+
+    runs: Dict[int, _Run] = {}
+    # tags with a run, every tag after its parent
+    ordered: List[bs4.element.Tag] = []
+    # a parent and where its contents end in raw_html, if known
+    pending: List[Tuple[bs4.element.Tag, Optional[int]]] = [(soup, len(raw_html))]
+    while pending:
+        parent, end = pending.pop()
+        contents = parent.contents
+        indexes = [
+            i for i, node in enumerate(contents) if isinstance(node, bs4.element.Tag)
+        ]
+        starts = []
+        for i in indexes:
+            tag = contents[i]
+            if tag.sourceline is None:
+                break
+            start = line_starts[tag.sourceline - 1] + tag.sourcepos
+            if not raw_html.startswith("<", start):
+                break
+            starts.append(start)
+        if len(starts) != len(indexes):
+            continue
+
+        if parent is soup and contents and indexes[:1] != [0]:
+            leading = contents[: indexes[0]] if indexes else contents
+            leading_end = starts[0] if starts else len(raw_html)
+            if "<" not in raw_html[:leading_end] and all(
+                type(node) is bs4.element.NavigableString for node in leading
+            ):
+                runs[id(leading[0])] = (tuple(leading), 0, leading_end)
+
+        for k, i in enumerate(indexes):
+            tag = contents[i]
+            last = k + 1 == len(indexes)
+            run_end = end if last else starts[k + 1]
+            closing = None
+            if run_end is not None:
+                following = len(contents) if last else indexes[k + 1]
+                trailing = contents[i + 1 : following]
+                closing = _closing_position(raw_html, tag, trailing, starts[k], run_end)
+                if closing is not None:
+                    runs[id(tag)] = (tuple(contents[i:following]), starts[k], run_end)
+                    ordered.append(tag)
+            if tag.contents:
+                pending.append((tag, closing))
+
+    # the closing tag found for a tag is its own only if its last child tag is
+    # closed before it, children are checked before their parents here
+    for tag in reversed(ordered):
+        for node in reversed(tag.contents):
+            if isinstance(node, bs4.element.Tag):
+                if id(node) not in runs:
+                    del runs[id(tag)]
+                break
+    return runs
+
+
+def _tag_markup(tag: bs4.element.Tag) -> Tuple[str, str]:
+    """
+    The opening and closing tag of a tag with contents, as Tag.decode writes them
+    """
+    formatter = tag.formatter_for_name("minimal")
+    markup = [tag.prefix + ":" + tag.name if tag.prefix else tag.name]
+    for key, value in formatter.attributes(tag):
+        if value is None:
+            markup.append(key)
+            continue
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        value = formatter.attribute_value(str(value))
+        markup.append(f"{key}={formatter.quoted_attribute_value(value)}")
+    return "<" + " ".join(markup) + ">", f"</{markup[0]}>"
+
+
+def _render(node: bs4.element.PageElement) -> str:
+    if isinstance(node, bs4.element.Tag):
+        return node.decode()
+    return node.output_ready()
+
+
+def _is_run(
+    contents: List[bs4.element.PageElement],
+    i: int,
+    nodes: Tuple[bs4.element.PageElement, ...],
+) -> bool:
+    # by identity, bs4 elements compare equal by markup
+    if i + len(nodes) > len(contents):
+        return False
+    return all(contents[i + k] is node for k, node in enumerate(nodes))
 
 
 class AtlassianPageContent:
-    def __init__(self, raw_html: str):
-        self.raw_html = raw_html
-        self.soup = BeautifulSoup(raw_html, "html.parser")
+    def __init__(
+        self, raw_html: str, parser: Optional[str] = None, keep_raw: bool = True
+    ):
+        # without keep_raw only the soup holds the content once it is parsed
+        self.raw_html: Optional[str] = raw_html if keep_raw else None
+        self.parser = resolve_parser(parser)
+        self.soup = _parse(raw_html, self.parser)
+        self.soup._atlassian_content = self
+        # set by any tracked change of the tree, see _TrackingMixin
+        self.modified = False
+        # attribute name -> attribute value -> tags in document order
+        self._index: Dict[str, Dict[str, List[bs4.element.Tag]]] = {}
+        self._unordered: Set[Tuple[str, str]] = set()
+        # source text of the subtrees that were not changed, see serialize;
+        # found on the first change (_before_change), so that read-only use of
+        # the content does not pay for it
+        self._reuse_source = keep_raw and self.parser == DEFAULT_PARSER
+        self._sources: Optional[Dict[int, _Run]] = None if self._reuse_source else {}
 
     def get_root(self) -> bs4.element.Tag:
         return self.soup
@@ -13,15 +544,174 @@ class AtlassianPageContent:
     def prettify(self) -> str:
         return self.soup.prettify()
 
+    def serialize(self) -> str:
+        """
+        Returns the content as storage format, like str(soup). Subtrees that were
+        not changed since parsing are copied from the source text, only the
+        changed tags are rendered again, so editing one row of a large table does
+        not re-serialize the whole page. Only available for the default parser
+        and with the source kept (keep_raw), otherwise the whole soup is rendered.
+        """
+        if not self._reuse_source:
+            return str(self.soup)
+        if not self.modified:
+            return self.raw_html
+
+        pieces: List[str] = []
+        self._serialize_contents(self.soup, pieces)
+        return "".join(pieces)
+
     def find_by_Attribute(self, attribute_name: str, value: str) -> bs4.element.Tag:
-        # callback to find by
-        def byAttribute(tag: bs4.element.Tag) -> bool:
-            return (
-                tag.has_attr(attribute_name)
-                and tag.get_attribute_list(attribute_name)[0] == value
-            )
+        """
+        Returns the first tag whose attribute has the given (first) value, or None.
+        Lookups go through an index that is built for an attribute on its first
+        lookup and kept up to date when the tree is modified.
+        """
+        tags = self._lookup(attribute_name, value)
+        return tags[0] if tags else None
+
+    def find_all_by_attribute(
+        self, attribute_name: str, value: str
+    ) -> List[bs4.element.Tag]:
+        """
+        Returns all tags whose attribute has the given (first) value, in
+        document order
+        """
+        return list(self._lookup(attribute_name, value))
 
-        return self.soup.find(byAttribute)
+    def invalidate_index(self) -> None:
+        """
+        Drops the attribute index and the source text reused by serialize. Only
+        needed after changing tag.contents in place instead of through the bs4
+        methods, all other modifications of the tree are tracked.
+        """
+        self._index.clear()
+        self._unordered.clear()
+        self._sources = {}
+        self._reuse_source = False
+        self.modified = True
 
     def new_tag(self, tag_name: str, **kwargs) -> bs4.element.Tag:
-        return self.soup.new_tag(tag_name, **kwargs)
+        # string is only an argument of new_tag from bs4 4.13 on
+        string = kwargs.pop("string", None)
+        tag = self.soup.new_tag(tag_name, **kwargs)
+        if string is not None:
+            tag.string = string
+        return tag
+
+    def _lookup(self, attribute_name: str, value: str) -> List[bs4.element.Tag]:
+        if (attribute_name, value) in self._unordered:
+            del self._index[attribute_name]
+        if attribute_name not in self._index:
+            self._build_index(attribute_name)
+        return self._index[attribute_name].get(value, [])
+
+    def _build_index(self, attribute_name: str) -> None:
+        index: Dict[str, List[bs4.element.Tag]] = {}
+        for tag in self.soup.find_all(True):
+            value = _index_value(tag, attribute_name)
+            if value is not None:
+                index.setdefault(value, []).append(tag)
+        self._index[attribute_name] = index
+        self._unordered = {key for key in self._unordered if key[0] != attribute_name}
+
+    def _add_to_index(self, tag: bs4.element.Tag, attribute_name: str) -> None:
+        value = _index_value(tag, attribute_name)
+        if value is None:
+            return
+        tags = self._index[attribute_name].setdefault(value, [])
+        if any(indexed is tag for indexed in tags):
+            return
+        if tags:
+            # position in document order unknown, resolved by the next lookup
+            self._unordered.add((attribute_name, value))
+        tags.append(tag)
+
+    def _remove_from_index(self, tag: bs4.element.Tag, attribute_name: str) -> None:
+        value = _index_value(tag, attribute_name)
+        tags = self._index[attribute_name].get(value) if value is not None else None
+        if not tags:
+            return
+        for i, indexed in enumerate(tags):
+            # bs4 tags compare by markup, removal has to go by identity
+            if indexed is tag:
+                del tags[i]
+                break
+        if not tags:
+            del self._index[attribute_name][value]
+
+    def _serialize_contents(self, parent: bs4.element.Tag, pieces: List[str]) -> None:
+        contents = parent.contents
+        i = 0
+        while i < len(contents):
+            node = contents[i]
+            source = self._sources.get(id(node))
+            if source is not None and _is_run(contents, i, source[0]):
+                nodes, start, end = source
+                pieces.append(self.raw_html[start:end])
+                i += len(nodes)
+                continue
+            # only parsed tags can contain subtrees with source text
+            if (
+                isinstance(node, bs4.element.Tag)
+                and node.contents
+                and node.sourceline is not None
+            ):
+                if node.hidden:
+                    # rendered without its own tags, like Tag.decode does
+                    self._serialize_contents(node, pieces)
+                else:
+                    opening, closing = _tag_markup(node)
+                    pieces.append(opening)
+                    self._serialize_contents(node, pieces)
+                    pieces.append(closing)
+            else:
+                pieces.append(_render(node))
+            i += 1
+
+    def _before_change(self) -> None:
+        # called before the tree is changed, while it still matches raw_html
+        if self._sources is None:
+            self._sources = _source_runs(self.soup, self.raw_html)
+
+    def _mark_changed(self, element: bs4.element.PageElement) -> None:
+        # the source text of the element and all its ancestors is outdated
+        while element is not None and self._sources:
+            self._sources.pop(id(element), None)
+            element = element.parent
+
+    def _on_changed(self, tag: bs4.element.Tag) -> None:
+        # renamed or hidden, the attributes are unchanged
+        self._before_change()
+        self.modified = True
+        self._mark_changed(tag)
+
+    def _on_added(self, element: bs4.element.PageElement) -> None:
+        self.modified = True
+        self._mark_changed(element)
+        if self._index:
+            for tag in _iter_tags(element):
+                for attribute_name in self._index:
+                    self._add_to_index(tag, attribute_name)
+
+    def _on_removed(self, element: bs4.element.PageElement) -> None:
+        self._before_change()
+        self.modified = True
+        self._mark_changed(element)
+        if self._index:
+            for tag in _iter_tags(element):
+                for attribute_name in self._index:
+                    self._remove_from_index(tag, attribute_name)
+
+    def _on_added_attribute(self, tag: bs4.element.Tag, attribute_name: str) -> None:
+        self.modified = True
+        self._mark_changed(tag)
+        if attribute_name in self._index:
+            self._add_to_index(tag, attribute_name)
+
+    def _on_removed_attribute(self, tag: bs4.element.Tag, attribute_name: str) -> None:
+        self._before_change()
+        self.modified = True
+        self._mark_changed(tag)
+        if attribute_name in self._index:
+            self._remove_from_index(tag, attribute_name)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+
+class PageSummary:
+    """
+    Listing entry of a page: its metadata without the storage body. Fetch the
+    full page with AtlassianPageClient.get(summary.id).
+    """
+
+    __slots__ = ("id", "title", "status", "space_id", "parent_id", "version")
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        status: Optional[str] = None,
+        space_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ):
+        self.id = id
+        self.title = title
+        self.status = status
+        self.space_id = space_id
+        self.parent_id = parent_id
+        self.version = version
+
+    @classmethod
+    def from_dict(cls, result: dict) -> "PageSummary":
+        """
+        Builds a summary from one entry of a v2 page listing
+        """
+        version = result.get("version") or {}
+        return cls(
+            str(result["id"]),
+            result.get("title"),
+            status=result.get("status"),
+            space_id=result.get("spaceId"),
+            parent_id=result.get("parentId"),
+            version=version.get("number"),
+        )
+
+    def __repr__(self) -> str:
+        return f"PageSummary({self.id!r}, {self.title!r}, version={self.version!r})"
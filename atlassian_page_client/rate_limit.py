@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class TokenBucket:
+    """
+    Allows rate requests per second on average, with bursts of up to burst
+    requests after a quiet period.
+
+    Every caller reserves its token up front and then waits for its own slot, so
+    waiting happens outside the lock, callers are served in order and threads and
+    coroutines (in any event loop) can share one bucket.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns the seconds to wait before it may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Client side rate limit with separate buckets for reads (GET) and writes (all
+    other methods), so a bulk update cannot starve lookups and the other way round.
+    A rate of None leaves that kind of request unlimited. Shared by all clients of
+    an AtlassianClientFactory, retries are limited like any other request.
+    """
+
+    def __init__(
+        self,
+        read_rate: Optional[float] = None,
+        write_rate: Optional[float] = None,
+        read_burst: Optional[float] = None,
+        write_burst: Optional[float] = None,
+    ):
+        self.read_bucket = (
+            TokenBucket(read_rate, read_burst) if read_rate is not None else None
+        )
+        self.write_bucket = (
+            TokenBucket(write_rate, write_burst) if write_rate is not None else None
+        )
+
+    def bucket_for(self, method: str) -> Optional[TokenBucket]:
+        if method.upper() in READ_METHODS:
+            return self.read_bucket
+        return self.write_bucket
+
+    def acquire(self, method: str) -> None:
+        """
+        Blocks until a request with the given method may be sent
+        """
+        bucket = self.bucket_for(method)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, method: str) -> None:
+        """
+        Waits until a request with the given method may be sent, without blocking
+        the event loop
+        """
+        bucket = self.bucket_for(method)
+        if bucket is not None:
+            await bucket.acquire_async()
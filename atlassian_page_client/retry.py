@@ -0,0 +1,125 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT"})
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Returns the seconds to wait from a Retry-After header, given either as
+    delay-seconds or as an HTTP date, or None if there is no usable value
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def is_replayable(data: Any) -> bool:
+    """
+    Whether a request body can be sent again. Streams and encoders are consumed
+    by the first attempt.
+    """
+    return data is None or isinstance(data, (str, bytes, dict))
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    GET and PUT are retried on connection errors and on 429, 502, 503 and 504
+    responses. Other methods are only retried on 429, which the server sends
+    before doing any work. Requests whose body is a stream are never retried.
+    The wait before attempt n+1 is a random value between 0 and
+    backoff_factor * 2 ** (n - 1), capped at max_backoff, unless the response
+    carries a Retry-After header, which is honored up to max_retry_after seconds.
+
+    retry_budget limits the total number of retries of all requests sharing the
+    policy, so a struggling server is not hit with retries forever. Once it is
+    used up, failures are returned immediately. Safe to share between threads
+    and clients.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        retry_budget: Optional[int] = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if retry_budget is not None and retry_budget < 0:
+            raise ValueError("retry_budget must not be negative")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_budget = retry_budget
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining_budget(self) -> Optional[int]:
+        if self.retry_budget is None:
+            return None
+        return max(0, self.retry_budget - self.retries)
+
+    def is_retryable(
+        self, method: str, status: Optional[int] = None, replayable: bool = True
+    ) -> bool:
+        """
+        status is None for a request that failed without a response
+        """
+        if not replayable:
+            return False
+        if method.upper() in IDEMPOTENT_METHODS:
+            return status is None or status in RETRY_STATUSES
+        return status == 429
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the seconds to wait after the given (1-based) attempt failed
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        ceiling = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        retry_after: Any = None,
+        replayable: bool = True,
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait before sending the request again, or None if
+        it must not be retried. A returned delay counts against the retry budget.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, status, replayable):
+            return None
+        with self._lock:
+            if self.retry_budget is not None and self.retries >= self.retry_budget:
+                return None
+            self.retries += 1
+        return self.backoff(attempt, parse_retry_after(retry_after))
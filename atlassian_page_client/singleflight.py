@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Threads calling do() with a key
+    whose call is still running wait for it and get its result (or exception)
+    instead of running their own.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Returns the result of fn() and whether it was shared with (computed
+        by) another caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+
+        if not leader:
+            return call.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines. The call runs as its own task, so cancelling
+    one of the waiting callers does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        call = self._calls.get(key)
+        shared = call is not None
+        if not shared:
+            call = self._calls[key] = asyncio.ensure_future(fn())
+            call.add_done_callback(lambda _: self._forget(key, call))
+
+        return await asyncio.shield(call), shared
+
+    def _forget(self, key: Hashable, call: "asyncio.Task") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
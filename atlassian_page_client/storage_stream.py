@@ -0,0 +1,253 @@
+import codecs
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+Chunk = Union[str, bytes]
+
+# tags html.parser never has contents for, as in page_content (not imported
+# from there, so that streaming does not import bs4)
+_VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+class StorageElement:
+    """
+    A tag found by StorageStream: its name, attributes, the names of the tags
+    enclosing it and, if requested, its text. A snapshot, not part of a tree.
+    """
+
+    __slots__ = ("name", "attrs", "parents", "text")
+
+    def __init__(
+        self,
+        name: str,
+        attrs: Dict[str, Optional[str]],
+        parents: Tuple[str, ...] = (),
+        text: Optional[str] = None,
+    ):
+        self.name = name
+        self.attrs = attrs
+        self.parents = parents
+        self.text = text
+
+    def get(self, attribute_name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.attrs.get(attribute_name, default)
+
+    def __repr__(self) -> str:
+        return f"StorageElement({self.name!r}, {self.attrs!r})"
+
+
+class _Match:
+    __slots__ = ("element", "depth", "text")
+
+    def __init__(self, element: StorageElement, depth: int):
+        self.element = element
+        self.depth = depth
+        self.text: List[str] = []
+
+
+class _QueryParser(HTMLParser):
+    """
+    Tokenizes storage format with the same parser as bs4's html.parser and
+    collects the tags matching one query in found. Only the names of the open
+    tags and the text of open matches are kept.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str],
+        attrs: Optional[Dict[str, Union[str, bool]]],
+        text: bool,
+    ):
+        super().__init__(convert_charrefs=True)
+        self.name = name
+        self.attrs = attrs or {}
+        self.text = text
+        self.open: List[str] = []
+        self.matches: List[_Match] = []
+        self.found: List[StorageElement] = []
+
+    def _matches(self, tag: str, attrs: Dict[str, Optional[str]]) -> bool:
+        if self.name is not None and tag != self.name:
+            return False
+        for attribute_name, value in self.attrs.items():
+            if value is True:
+                if attribute_name not in attrs:
+                    return False
+            elif value is False:
+                if attribute_name in attrs:
+                    return False
+            elif attrs.get(attribute_name) != value:
+                return False
+        return True
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag, attrs, tag in _VOID_ELEMENTS)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag, attrs, True)
+
+    def _start(self, tag: str, attr_list, empty: bool) -> None:
+        attrs = dict(attr_list)
+        if self._matches(tag, attrs):
+            element = StorageElement(tag, attrs, tuple(self.open))
+            if not self.text:
+                self.found.append(element)
+            elif empty:
+                element.text = ""
+                self.found.append(element)
+            else:
+                self.matches.append(_Match(element, len(self.open)))
+        if not empty:
+            self.open.append(tag)
+
+    def handle_endtag(self, tag):
+        # like bs4, an end tag closes the innermost open tag of that name and
+        # everything opened inside it, stray end tags are ignored
+        for depth in range(len(self.open) - 1, -1, -1):
+            if self.open[depth] == tag:
+                self._close(depth)
+                return
+
+    def _close(self, depth: int) -> None:
+        del self.open[depth:]
+        while self.matches and self.matches[-1].depth >= depth:
+            match = self.matches.pop()
+            match.element.text = "".join(match.text)
+            self.found.append(match.element)
+            if self.matches:
+                # text of a match is also text of the matches enclosing it
+                self.matches[-1].text.append(match.element.text)
+
+    def handle_data(self, data):
+        if self.matches:
+            self.matches[-1].text.append(data)
+
+    def unknown_decl(self, data):
+        # CDATA sections, e.g. the body of code macros
+        if data.startswith("CDATA["):
+            self.handle_data(data[len("CDATA[") :])
+
+    def handle_comment(self, data):
+        # newer Pythons report CDATA outside of svg/math as a bogus comment
+        if data.startswith("[CDATA[") and data.endswith("]]"):
+            self.handle_data(data[len("[CDATA[") : -len("]]")])
+
+    def close(self):
+        super().close()
+        self._close(0)
+
+
+class StorageStream:
+    """
+    Read-only queries over a storage body without building a BeautifulSoup
+    tree. Each query reads the body once from the start, keeps only the names of
+    the open tags (and the text of open matches) in memory and stops reading as
+    soon as the caller stops iterating, so find() on a large page returns once
+    the first match is read.
+
+    The body can be a str, bytes or an iterable of str or bytes chunks, e.g.
+    response.iter_content(). Bytes are decoded incrementally with encoding. An
+    iterator of chunks can only be read by one query.
+    """
+
+    def __init__(
+        self,
+        body: Union[Chunk, Iterable[Chunk]],
+        encoding: str = "utf-8",
+        chunk_size: int = 64 * 1024,
+    ):
+        self.body = body
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self._read = False
+
+    def find_all(
+        self,
+        name: Optional[str] = None,
+        attrs: Optional[Dict[str, Union[str, bool]]] = None,
+        text: bool = False,
+    ) -> Iterator[StorageElement]:
+        """
+        Yields the tags with the given name (any if None) whose attributes have
+        the given values (True/False: present/absent), in document order.
+
+        With text=True, each tag comes with its text and is yielded when its end
+        tag is read, so a match nested in another match is yielded first.
+        """
+        parser = _QueryParser(name, attrs, text)
+        for chunk in self._chunks():
+            parser.feed(chunk)
+            yield from self._drain(parser)
+        parser.close()
+        yield from self._drain(parser)
+
+    def find(
+        self,
+        name: Optional[str] = None,
+        attrs: Optional[Dict[str, Union[str, bool]]] = None,
+        text: bool = False,
+    ) -> Optional[StorageElement]:
+        """
+        Returns the first tag matching find_all, or None
+        """
+        return next(self.find_all(name, attrs, text=text), None)
+
+    def find_by_Attribute(
+        self, attribute_name: str, value: str
+    ) -> Optional[StorageElement]:
+        """
+        Returns the first tag whose attribute has the given value, or None
+        """
+        return self.find(attrs={attribute_name: value})
+
+    def find_all_by_attribute(
+        self, attribute_name: str, value: str
+    ) -> Iterator[StorageElement]:
+        return self.find_all(attrs={attribute_name: value})
+
+    @staticmethod
+    def _drain(parser: _QueryParser) -> List[StorageElement]:
+        found = parser.found
+        parser.found = []
+        return found
+
+    def _chunks(self) -> Iterator[str]:
+        body = self.body
+        if isinstance(body, (str, bytes)):
+            # fed in slices so that a query can stop before parsing the rest
+            chunks: Iterable[Chunk] = (
+                body[start : start + self.chunk_size]
+                for start in range(0, len(body), self.chunk_size)
+            )
+        else:
+            if iter(body) is body:
+                if self._read:
+                    raise RuntimeError(
+                        "The chunks of this StorageStream were already read"
+                    )
+                self._read = True
+            chunks = body
+
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        for chunk in chunks:
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
@@ -0,0 +1,64 @@
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .http_session import record_phase
+
+
+class _TimedConnectionMixin:
+    connect_seconds = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.connect_seconds += record_phase("connect", start)
+
+    def request(self, *args, **kwargs):
+        # connecting may happen inside request, it is not part of sending
+        start = time.perf_counter()
+        connected = self.connect_seconds
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            record_phase("send", start + self.connect_seconds - connected)
+
+    def getresponse(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().getresponse(*args, **kwargs)
+        finally:
+            record_phase("ttfb", start)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections report their phase timings to record_phases.
+    Outside of record_phases it behaves exactly like HTTPAdapter.
+    """
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
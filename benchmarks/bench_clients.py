@@ -0,0 +1,178 @@
+"""
+Throughput and latency of the page, blog and attachment clients against a local
+stand-in Confluence server, at several concurrency levels, page sizes and
+attachment sizes.
+
+    python -m benchmarks.bench_clients --requests 200 --concurrency 1,4,16
+    python -m benchmarks.bench_clients --page-kib 10,100,1000 --latency-ms 20 --json out.json
+"""
+
+import argparse
+import copy
+import io
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from atlassian_page_client.client_factory import AtlassianClientFactory
+from atlassian_page_client.page import AtlassianPage
+from atlassian_page_client.retry import RetryPolicy
+
+from .server import FakeConfluenceServer
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(operation: Callable[[int], object], requests: int, concurrency: int) -> dict:
+    """
+    Calls operation(i) for i in range(requests) on concurrency threads and
+    returns throughput and latency percentiles in milliseconds
+    """
+    latencies: List[float] = []
+
+    def timed(i: int) -> None:
+        start = time.perf_counter()
+        operation(i)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "ops_per_s": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+    }
+
+
+def bench_pages(
+    page_kib: int, requests: int, concurrency: int, latency: float
+) -> Dict[str, dict]:
+    with FakeConfluenceServer(page_kib=page_kib, latency=latency) as server:
+        with _factory(server, concurrency) as factory:
+            client = factory.createPageClient()
+            # a handful of ids, so concurrent puts do not all hit the same page
+            ids = [str(i) for i in range(1, 33)]
+            loaded = {page_id: client.get(page_id).raw_content for page_id in ids}
+
+            def get(i: int) -> None:
+                client.get(ids[i % len(ids)])
+
+            def put(i: int) -> None:
+                page_id = ids[i % len(ids)]
+                page = AtlassianPage(page_id, copy.deepcopy(loaded[page_id]))
+                client.put(page, force=True)
+
+            return {
+                "get": run(get, requests, concurrency),
+                "put": run(put, requests, concurrency),
+            }
+
+
+def bench_blog_posts(
+    requests: int, concurrency: int, latency: float, page_kib: int
+) -> dict:
+    with FakeConfluenceServer(latency=latency) as server:
+        body = server.page("1")["body"]["storage"]["value"][: page_kib * 1024]
+        with _factory(server, concurrency) as factory:
+            client = factory.createBlogClient()
+            return run(
+                lambda i: client.post(1, f"Digest {i}", body), requests, concurrency
+            )
+
+
+def bench_attachments(
+    attachment_kib: int, requests: int, concurrency: int, latency: float
+) -> dict:
+    data = b"x" * (attachment_kib * 1024)
+    with FakeConfluenceServer(latency=latency) as server:
+        with _factory(server, concurrency) as factory:
+            client = factory.createAttachmentClient()
+            return run(
+                lambda i: client.post(1, io.BytesIO(data), filename=f"file{i}.bin"),
+                requests,
+                concurrency,
+            )
+
+
+def _factory(server: FakeConfluenceServer, concurrency: int) -> AtlassianClientFactory:
+    return AtlassianClientFactory(
+        "bench@example.com",
+        "token",
+        server.base_url,
+        pool_maxsize=max(10, concurrency),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+
+def _sizes(value: str) -> List[int]:
+    return [int(size) for size in value.split(",")]
+
+
+def _print(name: str, result: dict) -> None:
+    print(
+        f"{name:<32} {result['concurrency']:>4} {result['ops_per_s']:>10.1f} "
+        f"{result['p50_ms']:>9.2f} {result['p90_ms']:>9.2f} {result['p99_ms']:>9.2f}"
+    )
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument("--requests", type=int, default=200)
+    arguments.add_argument("--concurrency", type=_sizes, default=[1, 4, 16])
+    arguments.add_argument("--page-kib", type=_sizes, default=[10, 100, 1000])
+    arguments.add_argument("--attachment-kib", type=_sizes, default=[64, 1024, 16384])
+    arguments.add_argument("--blog-kib", type=int, default=10)
+    arguments.add_argument(
+        "--latency-ms", type=float, default=0.0, help="delay added by the server"
+    )
+    arguments.add_argument("--json", help="also write the results to this file")
+    options = arguments.parse_args()
+    latency = options.latency_ms / 1000
+
+    results: List[dict] = []
+
+    def record(name: str, result: dict) -> None:
+        _print(name, result)
+        results.append({"benchmark": name, **result})
+
+    print(
+        f"{'benchmark':<32} {'conc':>4} {'ops/s':>10} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}"
+    )
+    for concurrency in options.concurrency:
+        for page_kib in options.page_kib:
+            pages = bench_pages(page_kib, options.requests, concurrency, latency)
+            for operation, result in pages.items():
+                record(f"page {operation} {page_kib} KiB", result)
+        record(
+            f"blog post {options.blog_kib} KiB",
+            bench_blog_posts(options.requests, concurrency, latency, options.blog_kib),
+        )
+        for attachment_kib in options.attachment_kib:
+            record(
+                f"attachment post {attachment_kib} KiB",
+                bench_attachments(
+                    attachment_kib, options.requests, concurrency, latency
+                ),
+            )
+
+    if options.json:
+        with open(options.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Parse and serialize timings of AtlassianPageContent for each parser backend.
+"1 edit ms" is serialize() after changing one table row, which reuses the
+source text of the unchanged top level elements where the parser allows it.
+
+    python -m benchmarks.bench_parsers --rows 2000 --repeat 5
+    python -m benchmarks.bench_parsers --rows 50,500,5000
+"""
+
+import argparse
+import statistics
+import time
+
+from bs4.builder import builder_registry
+
+from atlassian_page_client.page_content import AtlassianPageContent
+
+PARSERS = ["html.parser", "lxml", "html5lib"]
+
+
+def storage_document(rows: int) -> str:
+    """A storage format page with a large table, macros and links"""
+    parts = [
+        "<h1>Runbook</h1><p>Intro&nbsp;text with <strong>markup</strong></p>",
+        '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">'
+        "python</ac:parameter><ac:plain-text-body><![CDATA[if a > b:\n"
+        "    print(a)]]></ac:plain-text-body></ac:structured-macro>",
+        '<table ac:local-id="table"><tbody>',
+    ]
+    for i in range(rows):
+        parts.append(
+            f'<tr ac:local-id="row-{i}"><td><p>Cell {i}</p></td>'
+            f'<td><ac:link><ri:page ri:content-title="Page {i}" /></ac:link></td>'
+            f'<td><ac:emoticon ac:name="tick" /> ok</td></tr>'
+        )
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def measure(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument(
+        "--rows",
+        type=lambda value: [int(rows) for rows in value.split(",")],
+        default=[2000],
+    )
+    arguments.add_argument("--repeat", type=int, default=5)
+    options = arguments.parse_args()
+
+    for rows in options.rows:
+        bench_document(storage_document(rows), options.repeat)
+
+
+def bench_document(document: str, repeat: int) -> None:
+    print(f"document size: {len(document) / 1024:.0f} KiB")
+    print(
+        f"{'parser':<12} {'parse ms':>10} {'serialize ms':>14} {'1 edit ms':>10} "
+        f"{'round trip':>11}"
+    )
+
+    reference = str(AtlassianPageContent(document).soup)
+    for parser in PARSERS:
+        if builder_registry.lookup(parser) is None:
+            print(f"{parser:<12} {'not installed':>10}")
+            continue
+
+        parse = measure(lambda: AtlassianPageContent(document, parser), repeat)
+        content = AtlassianPageContent(document, parser)
+        serialize = measure(lambda: str(content.soup), repeat)
+        round_trip = "ok" if str(content.soup) == reference else "DIFFERS"
+
+        content.get_root().find("td").string = "edited"
+        edited = measure(content.serialize, repeat)
+        if str(AtlassianPageContent(content.serialize()).soup) != str(content.soup):
+            round_trip = "DIFFERS"
+
+        print(
+            f"{parser:<12} {parse * 1000:>10.1f} {serialize * 1000:>14.1f} "
+            f"{edited * 1000:>10.1f} {round_trip:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+In-process stand-in for the Confluence endpoints used by the clients, so the
+benchmarks measure the library (and the local HTTP stack) instead of a tenant.
+
+    with FakeConfluenceServer(page_kib=100) as server:
+        client = AtlassianPageClient(email, token, server.base_url)
+"""
+
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from .bench_parsers import storage_document
+
+_PAGE_URL = re.compile(r"^/wiki/rest/api/content/(\w+)$")
+_ATTACHMENT_URL = re.compile(r"^/wiki/rest/api/content/(\w+)/child/attachment$")
+_BLOGPOST_URL = "/wiki/api/v2/blogposts"
+
+# length of one table row of storage_document
+_ROW_BYTES = len(storage_document(1)) - len(storage_document(0))
+
+
+def storage_body(kib: int) -> str:
+    """A storage format body of roughly kib KiB"""
+    return storage_document(max(1, kib * 1024 // _ROW_BYTES))
+
+
+class FakeConfluenceServer:
+    """
+    Serves pages (GET/PUT /wiki/rest/api/content/{id}), blog posts (POST
+    /wiki/api/v2/blogposts) and attachments (POST .../child/attachment) from a
+    background thread. Every page starts with a storage body of page_kib KiB;
+    latency adds a fixed delay to each response to mimic a network round trip.
+    """
+
+    def __init__(self, page_kib: int = 10, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self.bytes_received = 0
+        self._body = storage_body(page_kib)
+        self._pages: Dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeConfluenceServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeConfluenceServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def page(self, page_id: str) -> dict:
+        with self._lock:
+            if page_id not in self._pages:
+                self._pages[page_id] = {
+                    "id": page_id,
+                    "type": "page",
+                    "status": "current",
+                    "title": f"Page {page_id}",
+                    "body": {
+                        "storage": {"value": self._body, "representation": "storage"}
+                    },
+                    "version": {"number": 1},
+                }
+            return self._pages[page_id]
+
+    def _page_response(self, page: dict, expand: str) -> dict:
+        version = page["version"]["number"]
+        content = {
+            **page,
+            "version": {
+                "number": version,
+                "_links": {
+                    "self": f"{self.base_url}/wiki/rest/api/content/"
+                    f"{page['id']}/version/{version}"
+                },
+            },
+        }
+        if "body.storage" not in expand:
+            del content["body"]
+        return content
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are written separately, with Nagle every small
+            # response would wait for the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                match = _PAGE_URL.match(url.path)
+                if match is None:
+                    return self._reply(404, {"message": "not found"})
+                page = server.page(match.group(1))
+                self._reply(200, server._page_response(page, url.query))
+
+            def do_PUT(self) -> None:
+                match = _PAGE_URL.match(urlsplit(self.path).path)
+                body = self._read_body()
+                if match is None:
+                    return self._reply(404, {"message": "not found"})
+                sent = json.loads(body)
+                page = server.page(match.group(1))
+                with server._lock:
+                    page["title"] = sent["title"]
+                    page["body"] = sent["body"]
+                    page["version"] = {"number": int(sent["version"]["number"])}
+                self._reply(200, server._page_response(page, "body.storage"))
+
+            def do_POST(self) -> None:
+                path = urlsplit(self.path).path
+                body = self._read_body()
+                if path == _BLOGPOST_URL:
+                    sent = json.loads(body)
+                    post_id = str(next(server._ids))
+                    return self._reply(200, {"id": post_id, "title": sent["title"]})
+                match = _ATTACHMENT_URL.match(path)
+                if match is None:
+                    return self._reply(404, {"message": "not found"})
+                self._reply(200, {"results": [{"id": f"att{next(server._ids)}"}]})
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0], 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            break
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                    body = b"".join(chunks)
+                else:
+                    body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server._lock:
+                    server.bytes_received += len(body)
+                return body
+
+            def _reply(self, status: int, content: dict) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                data = json.dumps(content).encode()
+                with server._lock:
+                    server.requests += 1
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
@@ -47,10 +47,23 @@ def sample_html_content():
     """
 
 
+class MockResponse(Mock):
+    """Mock requests response whose content follows the text it is given."""
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self.content = value.encode()
+
+
 @pytest.fixture
 def mock_requests_response():
     """Mock requests response."""
-    response = Mock()
+    response = MockResponse()
     response.status_code = 200
     response.url = "https://example.atlassian.net/api/test"
     return response
@@ -64,3 +77,58 @@ def client_config():
         "token": "test_token_123",
         "base_url": "https://example.atlassian.net",
     }
+
+
+class FakeAsyncResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(
+        self, status=200, text="", url="https://example.atlassian.net/api", headers=None
+    ):
+        self.status = status
+        self.url = url
+        self.headers = headers or {}
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def read(self):
+        return self._text.encode()
+
+    async def text(self):
+        return self._text
+
+
+class FakeClientSession:
+    """Records requests and answers them with queued FakeAsyncResponses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_async_session(client_config):
+    """Build an AsyncSession that answers with the given fake responses."""
+    from atlassian_page_client.http_session import AsyncSession
+
+    def build(*responses):
+        return AsyncSession(
+            client_config["email"],
+            client_config["token"],
+            client_session=FakeClientSession(*responses),
+        )
+
+    return build
@@ -0,0 +1,45 @@
+"""Tests for AsyncAtlassianAttachmentClient."""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from atlassian_page_client.async_attachment_client import AsyncAtlassianAttachmentClient
+from tests.conftest import FakeAsyncResponse
+
+aiohttp = pytest.importorskip("aiohttp")
+
+
+class TestAsyncAtlassianAttachmentClient:
+    """Test cases for AsyncAtlassianAttachmentClient class."""
+
+    def test_post_attachment_success(self, client_config, fake_async_session):
+        """Test successful async attachment upload."""
+        session = fake_async_session(FakeAsyncResponse(text='{"id": "att1"}'))
+        client = AsyncAtlassianAttachmentClient(**client_config, session=session)
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"content")
+        try:
+            response = asyncio.run(client.post(67890, f.name))
+        finally:
+            os.unlink(f.name)
+
+        assert response.status == 200
+        method, url, kwargs = session.client_session.calls[0]
+        assert method == "POST"
+        assert url == client.base_url + "/wiki/rest/api/content/67890/child/attachment"
+        assert kwargs["headers"]["X-Atlassian-Token"] == "no-check"
+        assert isinstance(kwargs["data"], aiohttp.FormData)
+
+    def test_post_attachment_file_not_found(self, client_config, fake_async_session):
+        """Test async attachment upload when file doesn't exist."""
+        session = fake_async_session()
+        client = AsyncAtlassianAttachmentClient(**client_config, session=session)
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(client.post(67890, "/path/to/nonexistent_file.txt"))
+
+        assert session.client_session.calls == []
@@ -0,0 +1,42 @@
+"""Tests for AsyncAtlassianBlogClient."""
+
+import asyncio
+import json
+
+import pytest
+
+from atlassian_page_client.async_blog_client import AsyncAtlassianBlogClient
+from tests.conftest import FakeAsyncResponse
+
+
+class TestAsyncAtlassianBlogClient:
+    """Test cases for AsyncAtlassianBlogClient class."""
+
+    def test_post_blog_success(self, client_config, fake_async_session):
+        """Test successful async blog post creation."""
+        session = fake_async_session(FakeAsyncResponse(text=json.dumps({"id": "1"})))
+        client = AsyncAtlassianBlogClient(**client_config, session=session)
+
+        response = asyncio.run(client.post(123456, "Title", "<p>Body</p>"))
+
+        assert response.status == 200
+        method, url, kwargs = session.client_session.calls[0]
+        assert method == "POST"
+        assert url == client.base_url + "/wiki/api/v2/blogposts"
+        sent_data = json.loads(kwargs["data"])
+        assert sent_data["spaceId"] == 123456
+        assert sent_data["title"] == "Title"
+        assert sent_data["body"] == {
+            "representation": "storage",
+            "value": "<p>Body</p>",
+        }
+
+    def test_post_blog_failure(self, client_config, fake_async_session):
+        """Test failed async blog post creation."""
+        session = fake_async_session(FakeAsyncResponse(status=403, text="Forbidden"))
+        client = AsyncAtlassianBlogClient(**client_config, session=session)
+
+        with pytest.raises(Exception) as exc_info:
+            asyncio.run(client.post(123456, "Title", "<p>Body</p>"))
+
+        assert "403" in str(exc_info.value)
@@ -0,0 +1,205 @@
+"""Tests for AsyncAtlassianPageClient."""
+
+import asyncio
+import copy
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from atlassian_page_client.async_page_client import AsyncAtlassianPageClient
+from atlassian_page_client.http_session import AsyncSession, basic_auth_header
+from atlassian_page_client.page import AtlassianPage
+from tests.conftest import FakeAsyncResponse
+
+
+class TestAsyncAtlassianPageClient:
+    """Test cases for AsyncAtlassianPageClient class."""
+
+    def test_initialization(self, client_config):
+        """Test client initialization."""
+        client = AsyncAtlassianPageClient(**client_config)
+
+        assert client.email == client_config["email"]
+        assert client.base_url == client_config["base_url"]
+        assert isinstance(client.session, AsyncSession)
+        assert client.headers == {
+            "Authorization": basic_auth_header(
+                client_config["email"], client_config["token"]
+            ),
+            "Content-Type": "application/json;charset=iso-8859-1",
+        }
+
+    def test_get_page_success(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test successful async page retrieval."""
+        session = fake_async_session(
+            FakeAsyncResponse(text=json.dumps(sample_page_data))
+        )
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+
+        page = asyncio.run(client.get("12345"))
+
+        assert isinstance(page, AtlassianPage)
+        assert page.get_page_id() == "12345"
+        method, url, kwargs = session.client_session.calls[0]
+        assert method == "GET"
+        assert url == (
+            client.base_url + "/wiki/rest/api/content/12345?expand=body.storage,version"
+        )
+        assert kwargs["headers"] == client.headers
+
+    def test_get_page_failure(self, client_config, fake_async_session):
+        """Test failed async page retrieval."""
+        session = fake_async_session(FakeAsyncResponse(status=404, text="Not Found"))
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+
+        with pytest.raises(Exception) as exc_info:
+            asyncio.run(client.get("nonexistent"))
+
+        assert "Failed to get page from url" in str(exc_info.value)
+        assert "404" in str(exc_info.value)
+        assert "Not Found" in str(exc_info.value)
+
+    def test_put_page_success(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test successful async page update."""
+        updated_data = copy.deepcopy(sample_page_data)
+        updated_data["version"]["number"] = 2
+        session = fake_async_session(FakeAsyncResponse(text=json.dumps(updated_data)))
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.raw_content["title"] = "Renamed Page"
+
+        updated_page = asyncio.run(client.put(page))
+
+        method, url, kwargs = session.client_session.calls[0]
+        assert method == "PUT"
+        assert url == client.base_url + "/wiki/rest/api/content/12345"
+        assert json.loads(kwargs["data"])["version"]["number"] == 2
+        assert isinstance(updated_page, AtlassianPage)
+        assert updated_page.raw_content["version"]["number"] == 2
+
+    def test_many_requests_in_flight(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test that many gets can be awaited concurrently on one client."""
+        responses = [
+            FakeAsyncResponse(text=json.dumps(sample_page_data)) for _ in range(50)
+        ]
+        session = fake_async_session(*responses)
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+
+        async def fetch_all():
+            return await asyncio.gather(*(client.get(str(i)) for i in range(50)))
+
+        pages = asyncio.run(fetch_all())
+
+        assert [page.get_page_id() for page in pages] == [str(i) for i in range(50)]
+
+    def test_concurrent_gets_share_one_request(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test that concurrent gets of one page send one request."""
+        session = fake_async_session(
+            FakeAsyncResponse(text=json.dumps(sample_page_data))
+        )
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+
+        async def fetch_all():
+            return await asyncio.gather(*(client.get("12345") for _ in range(5)))
+
+        pages = asyncio.run(fetch_all())
+
+        assert len(session.client_session.calls) == 1
+        assert len({id(page.raw_content) for page in pages}) == 5
+
+    def test_put_with_retry_replays_on_conflict(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test that the async client rebases a conflicting put."""
+        latest = copy.deepcopy(sample_page_data)
+        latest["version"]["number"] = 2
+        updated = copy.deepcopy(sample_page_data)
+        updated["version"]["number"] = 3
+        session = fake_async_session(
+            FakeAsyncResponse(text=json.dumps(sample_page_data)),
+            FakeAsyncResponse(status=409, text="Version conflict"),
+            FakeAsyncResponse(text=json.dumps(latest)),
+            FakeAsyncResponse(text=json.dumps(updated)),
+        )
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+
+        page = asyncio.run(
+            client.put_with_retry(
+                "12345", lambda content: content.get_root().append("x")
+            )
+        )
+
+        methods = [method for method, _, _ in session.client_session.calls]
+        assert methods == ["GET", "PUT", "GET", "PUT"]
+        sent = json.loads(session.client_session.calls[3][2]["data"])
+        assert sent["version"]["number"] == 3
+        assert page.get_version() == 3
+
+    def test_close_keeps_external_session_open(self, client_config, fake_async_session):
+        """Test that a passed in ClientSession is not closed by the client."""
+        session = fake_async_session()
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+        client_session = session.client_session
+
+        asyncio.run(client.close())
+
+        assert client_session.closed is False
+
+    def test_close_only_closes_own_session(self, client_config, fake_async_session):
+        """Test that a shared AsyncSession is left open and an own one is closed."""
+        shared = fake_async_session()
+        shared.close = AsyncMock()
+        own = AsyncAtlassianPageClient(**client_config)
+        own.session.close = AsyncMock()
+
+        async def use_clients():
+            async with AsyncAtlassianPageClient(**client_config, session=shared):
+                pass
+            async with own:
+                pass
+
+        asyncio.run(use_clients())
+
+        shared.close.assert_not_called()
+        own.session.close.assert_awaited_once()
+
+    def test_get_if_changed(self, client_config, sample_page_data, fake_async_session):
+        """Test the async version-only staleness check."""
+        session = fake_async_session(
+            FakeAsyncResponse(text=json.dumps({"version": {"number": 1}})),
+            FakeAsyncResponse(text=json.dumps({"version": {"number": 2}})),
+            FakeAsyncResponse(text=json.dumps(sample_page_data)),
+        )
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+
+        assert asyncio.run(client.get_if_changed("12345", 1)) is None
+        page = asyncio.run(client.get_if_changed("12345", 1))
+
+        assert isinstance(page, AtlassianPage)
+        urls = [url for _, url, _ in session.client_session.calls]
+        assert urls[0].endswith("/wiki/rest/api/content/12345?expand=version")
+        assert urls[2].endswith("?expand=body.storage,version")
+
+    def test_put_skips_unchanged_page(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test that an unchanged page is not sent by the async client."""
+        session = fake_async_session()
+        client = AsyncAtlassianPageClient(**client_config, session=session)
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+
+        result = asyncio.run(client.put(page))
+
+        assert session.client_session.calls == []
+        assert result is page
+        assert result.put_skipped is True
+        assert page.get_version() == 1
@@ -1,5 +1,6 @@
 """Tests for AtlassianAttachmentClient."""
 
+import io
 import os
 import tempfile
 from unittest.mock import MagicMock, Mock, mock_open, patch
@@ -8,6 +9,7 @@ import pytest
 from requests.auth import HTTPBasicAuth
 
 from atlassian_page_client.attachment_client import AtlassianAttachmentClient
+from atlassian_page_client.multipart import MultipartEncoder
 
 
 class TestAtlassianAttachmentClient:
@@ -79,9 +81,12 @@ class TestAtlassianAttachmentClient:
         call_args = mock_post.call_args
 
         assert call_args[0][0] == expected_url
-        assert call_args[1]["headers"] == client.HEADERS
+        assert call_args[1]["headers"]["X-Atlassian-Token"] == "no-check"
+        assert call_args[1]["headers"]["Content-Type"].startswith(
+            "multipart/form-data; boundary="
+        )
         assert call_args[1]["auth"] == client.basicAuth
-        assert "files" in call_args[1]
+        assert isinstance(call_args[1]["data"], MultipartEncoder)
 
         # Verify the response
         assert response.status_code == 200
@@ -253,3 +258,151 @@ class TestAtlassianAttachmentClient:
         )
         call_args = mock_post.call_args
         assert call_args[0][0] == expected_url
+
+    @patch("atlassian_page_client.attachment_client.requests.post")
+    def test_post_streams_file_from_disk(
+        self, mock_post, client_config, mock_requests_response
+    ):
+        """Test that a file on disk is streamed with a Content-Length."""
+        client = AtlassianAttachmentClient(**client_config)
+        sent = {}
+
+        def consume(url, data=None, **kwargs):
+            sent["length"] = data.len
+            sent["chunks"] = [len(chunk) for chunk in data]
+            sent["headers"] = kwargs["headers"]
+            return mock_requests_response
+
+        mock_post.side_effect = consume
+        progress = []
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"x" * 300000)
+        try:
+            response = client.post(
+                67890, f.name, progress_callback=lambda n, total: progress.append(n)
+            )
+        finally:
+            os.unlink(f.name)
+
+        assert response.status_code == 200
+        assert sent["length"] > 300000
+        assert sum(sent["chunks"]) == sent["length"]
+        assert max(sent["chunks"]) <= 64 * 1024
+        assert progress[-1] == sent["length"]
+
+    @patch("atlassian_page_client.attachment_client.requests.post")
+    def test_post_file_object_and_iterator(
+        self, mock_post, client_config, mock_requests_response
+    ):
+        """Test uploading from a file object and from an iterator of bytes."""
+        client = AtlassianAttachmentClient(**client_config)
+        bodies = []
+
+        def consume(url, data=None, **kwargs):
+            bodies.append((data.len, data.read()))
+            return mock_requests_response
+
+        mock_post.side_effect = consume
+
+        file_object = io.BytesIO(b"from a file object")
+        file_object.name = "/tmp/report.txt"
+        client.post(67890, file_object)
+        client.post(67890, iter([b"from ", b"an ", b"iterator"]), filename="gen.bin")
+
+        length, body = bodies[0]
+        assert length == len(body)
+        assert b'filename="report.txt"' in body
+        assert b"from a file object" in body
+
+        length, body = bodies[1]
+        assert length is None
+        assert b'filename="gen.bin"' in body
+        assert b"from an iterator" in body
+
+    @patch("atlassian_page_client.attachment_client.requests.post")
+    def test_post_many_packs_small_files(
+        self, mock_post, client_config, mock_requests_response, tmp_path
+    ):
+        """Test that small files for one content share multipart requests."""
+        client = AtlassianAttachmentClient(**client_config)
+        bodies = []
+
+        def consume(url, data=None, **kwargs):
+            bodies.append((url, data.read()))
+            return mock_requests_response
+
+        mock_post.side_effect = consume
+
+        paths = []
+        for n in range(5):
+            path = tmp_path / f"report{n}.txt"
+            path.write_bytes(b"r" * 10)
+            paths.append(str(path))
+
+        results = client.post_many(67890, paths, batch_size=2)
+
+        assert mock_post.call_count == 3
+        assert [r.item for r in results] == paths
+        assert all(r.ok and r.result is mock_requests_response for r in results)
+        assert sorted(body.count(b'name="file"') for _, body in bodies) == [1, 2, 2]
+        assert all(url.endswith("/content/67890/child/attachment") for url, _ in bodies)
+
+    @patch("atlassian_page_client.attachment_client.requests.post")
+    def test_post_many_respects_batch_bytes(
+        self, mock_post, client_config, mock_requests_response, tmp_path
+    ):
+        """Test that large files are sent alone and batches stay under budget."""
+        client = AtlassianAttachmentClient(**client_config)
+        counts = []
+
+        def consume(url, data=None, **kwargs):
+            counts.append(data.read().count(b'name="file"'))
+            return mock_requests_response
+
+        mock_post.side_effect = consume
+
+        sizes = [60, 60, 200, 30]
+        paths = []
+        for n, size in enumerate(sizes):
+            path = tmp_path / f"f{n}.bin"
+            path.write_bytes(b"b" * size)
+            paths.append(str(path))
+
+        results = client.post_many(67890, paths, batch_bytes=100)
+
+        assert all(r.ok for r in results)
+        assert sorted(counts) == [1, 1, 2]
+
+    @patch("atlassian_page_client.attachment_client.requests.post")
+    def test_post_many_multiple_targets_and_errors(
+        self, mock_post, client_config, tmp_path
+    ):
+        """Test per file results across content ids with failures."""
+        client = AtlassianAttachmentClient(**client_config)
+
+        def consume(url, data=None, **kwargs):
+            data.read()
+            response = Mock()
+            response.url = url
+            response.status_code = 404 if "/content/2/" in url else 200
+            response.text = "Not Found"
+            return response
+
+        mock_post.side_effect = consume
+
+        first = tmp_path / "a.txt"
+        first.write_bytes(b"a")
+        second = tmp_path / "b.txt"
+        second.write_bytes(b"b")
+        missing = str(tmp_path / "missing.txt")
+
+        results = client.post_many(
+            1, [str(first), (2, str(second)), missing], max_workers=2
+        )
+
+        assert mock_post.call_count == 2
+        assert results[0].ok
+        assert results[1].item == (2, str(second))
+        assert "404" in str(results[1].error)
+        assert isinstance(results[2].error, FileNotFoundError)
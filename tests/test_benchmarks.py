@@ -0,0 +1,43 @@
+"""Smoke tests for the benchmark stand-in server and runner."""
+
+import io
+
+from atlassian_page_client.client_factory import AtlassianClientFactory
+from benchmarks.bench_clients import run
+from benchmarks.server import FakeConfluenceServer
+
+
+class TestFakeConfluenceServer:
+    """Test cases for the stand-in Confluence server used by the benchmarks."""
+
+    def test_clients_round_trip(self):
+        """Test that all clients work against the server over real HTTP."""
+        with FakeConfluenceServer(page_kib=4) as server:
+            with AtlassianClientFactory("a@b.c", "token", server.base_url) as factory:
+                pages = factory.createPageClient()
+                page = pages.get("7")
+                assert page.get_version() == 1
+                assert len(page.raw_content["body"]["storage"]["value"]) > 3000
+                assert pages.get_version("7") == 1
+
+                page.raw_content["title"] = "Renamed"
+                updated = pages.put(page)
+                assert updated.get_version() == 2
+                assert pages.get("7").get_title() == "Renamed"
+
+                blog = factory.createBlogClient().post(1, "Digest", "<p>x</p>")
+                assert blog.json()["title"] == "Digest"
+
+                attachment = factory.createAttachmentClient().post(
+                    1, io.BytesIO(b"x" * 100000), filename="a.bin"
+                )
+                assert attachment.status_code == 200
+                assert server.bytes_received > 100000
+
+    def test_run_reports_percentiles(self):
+        """Test that the runner reports throughput and ordered percentiles."""
+        result = run(lambda i: None, requests=20, concurrency=4)
+
+        assert result["requests"] == 20
+        assert result["ops_per_s"] > 0
+        assert result["p50_ms"] <= result["p90_ms"] <= result["p99_ms"]
@@ -1,12 +1,16 @@
 """Tests for AtlassianBlogClient."""
 
 import json
+from datetime import datetime, timezone
 from unittest.mock import ANY, Mock, patch
 
 import pytest
+import requests
 from requests.auth import HTTPBasicAuth
 
 from atlassian_page_client.blog_client import AtlassianBlogClient
+from atlassian_page_client.retry import RetryPolicy
+from tests.conftest import MockResponse
 
 
 class TestAtlassianBlogClient:
@@ -213,3 +217,167 @@ class TestAtlassianBlogClient:
         assert isinstance(client.basicAuth, HTTPBasicAuth)
         assert client.basicAuth.username == client_config["email"]
         assert client.basicAuth.password == client_config["token"]
+
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_with_idempotency_key_is_created_once(
+        self, mock_post, mock_get, client_config
+    ):
+        """Test that a key that already produced a post is not posted again."""
+        mock_post.return_value = MockResponse(status_code=200, text='{"id": "111"}')
+        mock_get.return_value = MockResponse(status_code=200, text='{"id": "111"}')
+        store = {}
+        client = AtlassianBlogClient(**client_config, idempotency_store=store)
+
+        first = client.post(1, "Digest", "<p>a</p>", idempotency_key="team-a/w42")
+        second = client.post(1, "Digest", "<p>a</p>", idempotency_key="team-a/w42")
+
+        mock_post.assert_called_once()
+        assert store == {"team-a/w42": "111"}
+        assert first is mock_post.return_value
+        assert second is mock_get.return_value
+        assert mock_get.call_args[0][0] == (
+            client.base_url + "/wiki/api/v2/blogposts/111"
+        )
+
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_after_timeout_finds_created_post(
+        self, mock_post, mock_get, client_config
+    ):
+        """Test that a post created before a timeout is not created twice."""
+        mock_post.side_effect = requests.Timeout("read timed out")
+        created_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        results = {"results": [{"id": "222", "createdAt": created_at}]}
+        mock_get.side_effect = [
+            MockResponse(status_code=200, text=json.dumps(results)),
+            MockResponse(status_code=200, text='{"id": "222"}'),
+        ]
+        client = AtlassianBlogClient(**client_config)
+
+        response = client.post(1, "Digest & more", "<p>a</p>", idempotency_key="k")
+
+        mock_post.assert_called_once()
+        assert json.loads(response.text)["id"] == "222"
+        assert client.idempotency_store == {"k": "222"}
+        lookup_url = mock_get.call_args_list[0][0][0]
+        assert "/wiki/api/v2/blogposts?" in lookup_url
+        assert "space-id=1" in lookup_url
+        assert "title=Digest+%26+more" in lookup_url
+
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_after_timeout_ignores_older_posts(
+        self, mock_post, mock_get, client_config
+    ):
+        """Test that an earlier post with a recurring title is not recovered."""
+        mock_post.side_effect = [
+            requests.Timeout("read timed out"),
+            MockResponse(status_code=200, text='{"id": "333"}'),
+        ]
+        results = {"results": [{"id": "111", "createdAt": "2024-01-01T09:00:00.000Z"}]}
+        mock_get.return_value = MockResponse(status_code=200, text=json.dumps(results))
+        client = AtlassianBlogClient(**client_config)
+
+        client.post(1, "Weekly digest", "<p>a</p>", idempotency_key="k")
+
+        assert mock_post.call_count == 2
+        assert client.idempotency_store == {"k": "333"}
+        assert "sort=-created-date" in mock_get.call_args[0][0]
+
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_is_sent_again_when_not_created(
+        self, mock_post, mock_get, client_config
+    ):
+        """Test that a failed create is retried when no post exists yet."""
+        mock_post.side_effect = [
+            MockResponse(status_code=503, text="Unavailable", headers={}),
+            MockResponse(status_code=200, text='{"id": "333"}'),
+        ]
+        mock_get.return_value = MockResponse(status_code=200, text='{"results": []}')
+        client = AtlassianBlogClient(**client_config)
+
+        client.post(1, "Digest", "<p>a</p>", idempotency_key="k")
+
+        assert mock_post.call_count == 2
+        assert client.idempotency_store == {"k": "333"}
+
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_gives_up_after_max_attempts(self, mock_post, mock_get, client_config):
+        """Test that ambiguous failures are bounded by max_attempts."""
+        mock_post.side_effect = requests.ConnectionError("reset")
+        mock_get.return_value = MockResponse(status_code=200, text='{"results": []}')
+        client = AtlassianBlogClient(**client_config, max_attempts=2)
+
+        with pytest.raises(requests.ConnectionError):
+            client.post(1, "Digest", "<p>a</p>", idempotency_key="k")
+
+        assert mock_post.call_count == 2
+        assert client.idempotency_store == {}
+
+    @patch("atlassian_page_client.blog_client.time.sleep")
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_is_sent_again_after_backoff(
+        self, mock_post, mock_get, mock_sleep, client_config
+    ):
+        """Test that re-sending a create waits for the retry policy's backoff."""
+        mock_post.side_effect = [
+            MockResponse(status_code=503, text="Unavailable", headers={}),
+            MockResponse(status_code=200, text='{"id": "333"}'),
+        ]
+        mock_get.return_value = MockResponse(status_code=200, text='{"results": []}')
+        policy = RetryPolicy(max_attempts=1)
+        client = AtlassianBlogClient(**client_config, retry_policy=policy)
+
+        with patch.object(policy, "backoff", return_value=0.25) as backoff:
+            client.post(1, "Digest", "<p>a</p>", idempotency_key="k")
+
+        backoff.assert_called_once_with(1, None)
+        mock_sleep.assert_called_once_with(0.25)
+        assert mock_post.call_count == 2
+
+    @patch("atlassian_page_client.blog_client.requests.get")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_key_locks_are_dropped(self, mock_post, mock_get, client_config):
+        """Test that no lock is kept for keys whose post has finished."""
+        mock_post.side_effect = [
+            MockResponse(status_code=200, text='{"id": "111"}'),
+            requests.ConnectionError("reset"),
+        ]
+        mock_get.return_value = MockResponse(status_code=200, text='{"results": []}')
+        client = AtlassianBlogClient(**client_config, max_attempts=1)
+
+        client.post(1, "Digest", "<p>a</p>", idempotency_key="a")
+        with pytest.raises(requests.ConnectionError):
+            client.post(1, "Digest", "<p>b</p>", idempotency_key="b")
+
+        assert client._key_locks == {}
+
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_many(self, mock_post, client_config):
+        """Test that every post gets a result, in input order."""
+
+        def respond(url, data=None, **kwargs):
+            title = json.loads(data)["title"]
+            if title == "bad":
+                return MockResponse(status_code=400, text="Bad Request", headers={})
+            return MockResponse(status_code=200, text=json.dumps({"id": title}))
+
+        mock_post.side_effect = respond
+        client = AtlassianBlogClient(**client_config)
+        posts = [(f"post {i}", "<p>x</p>", f"key-{i}") for i in range(20)]
+        posts.insert(5, ("bad", "<p>x</p>"))
+
+        results = client.post_many(1, posts, max_workers=4)
+
+        assert [result.item for result in results] == posts
+        assert results[5].ok is False
+        assert "400" in str(results[5].error)
+        ok = [result for result in results if result.ok]
+        assert len(ok) == 20
+        assert json.loads(ok[0].result.text)["id"] == "post 0"
+        assert client.idempotency_store["key-19"] == "post 19"
+        assert mock_post.call_count == 21
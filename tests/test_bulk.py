@@ -0,0 +1,97 @@
+"""Tests for the bulk helpers."""
+
+import threading
+import time
+
+import pytest
+
+from atlassian_page_client.bulk import BulkResult, run_bulk
+
+
+class TestRunBulk:
+    """Test cases for run_bulk and BulkResult."""
+
+    def test_ordered_results(self):
+        """Test that ordered results follow the input order."""
+
+        def slow_for_small(n):
+            time.sleep(0.01 * (5 - n))
+            return n * 2
+
+        results = list(run_bulk(slow_for_small, range(5), max_workers=5))
+
+        assert [r.item for r in results] == [0, 1, 2, 3, 4]
+        assert [r.result for r in results] == [0, 2, 4, 6, 8]
+        assert all(r.ok for r in results)
+
+    def test_unordered_results_yield_as_completed(self):
+        """Test that unordered results come back as soon as they finish."""
+
+        def slow_for_small(n):
+            time.sleep(0.02 * (3 - n))
+            return n
+
+        results = list(run_bulk(slow_for_small, range(3), max_workers=3, ordered=False))
+
+        assert [r.item for r in results] == [2, 1, 0]
+
+    def test_errors_are_reported_per_item(self):
+        """Test that a failing item does not abort the batch."""
+
+        def fail_on_odd(n):
+            if n % 2:
+                raise Exception(f"failed {n}")
+            return n
+
+        results = list(run_bulk(fail_on_odd, range(4), max_workers=2))
+
+        assert [r.ok for r in results] == [True, False, True, False]
+        assert str(results[1].error) == "failed 1"
+        assert results[1].result is None
+        assert results[2].result == 2
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_workers calls run at the same time."""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def track(n):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+            return n
+
+        results = list(run_bulk(track, range(30), max_workers=3))
+
+        assert len(results) == 30
+        assert peak[0] <= 3
+
+    def test_input_is_consumed_lazily(self):
+        """Test that only a bounded window of the input is scheduled ahead."""
+        consumed = []
+
+        def items():
+            for n in range(1000):
+                consumed.append(n)
+                yield n
+
+        results = run_bulk(lambda n: n, items(), max_workers=2)
+        first = next(results)
+        results.close()
+
+        assert first.item == 0
+        assert len(consumed) <= 6
+
+    def test_invalid_max_workers(self):
+        """Test that max_workers must be positive."""
+        with pytest.raises(ValueError):
+            list(run_bulk(lambda n: n, [1], max_workers=0))
+
+    def test_bulk_result_repr(self):
+        """Test BulkResult representation."""
+        assert repr(BulkResult("a", result=1)) == "BulkResult('a', result=1)"
+        assert "error=" in repr(BulkResult("a", error=ValueError("x")))
@@ -1,11 +1,21 @@
 """Tests for AtlassianClientFactory."""
 
+import json
+from unittest.mock import Mock
+
 import pytest
+import requests
 
+from atlassian_page_client.async_attachment_client import AsyncAtlassianAttachmentClient
+from atlassian_page_client.async_blog_client import AsyncAtlassianBlogClient
+from atlassian_page_client.async_page_client import AsyncAtlassianPageClient
 from atlassian_page_client.attachment_client import AtlassianAttachmentClient
 from atlassian_page_client.blog_client import AtlassianBlogClient
 from atlassian_page_client.client_factory import AtlassianClientFactory
+from atlassian_page_client.http_session import basic_auth_header
+from atlassian_page_client.page_cache import PageCache
 from atlassian_page_client.page_client import AtlassianPageClient
+from atlassian_page_client.retry import RetryPolicy
 
 
 class TestAtlassianClientFactory:
@@ -199,3 +209,111 @@ class TestAtlassianClientFactory:
         assert page_client.email == config["email"]
         assert page_client.token == config["token"]
         assert page_client.base_url == config["base_url"]
+
+    def test_clients_share_one_session(self, client_config):
+        """Test that every client built by the factory shares its session."""
+        factory = AtlassianClientFactory(**client_config)
+
+        clients = [
+            factory.createBlogClient(),
+            factory.createAttachmentClient(),
+            factory.createPageClient(),
+        ]
+
+        assert isinstance(factory.session, requests.Session)
+        for client in clients:
+            assert client.session is factory.session
+
+    def test_factory_session_configuration(self, client_config):
+        """Test that pool settings are passed to the shared session."""
+        factory = AtlassianClientFactory(
+            **client_config, pool_connections=2, pool_maxsize=32, keep_alive=False
+        )
+
+        adapter = factory.session.get_adapter(client_config["base_url"])
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert factory.session.headers["Connection"] == "close"
+        assert factory.session.headers["Authorization"] == basic_auth_header(
+            client_config["email"], client_config["token"]
+        )
+
+    def test_factory_client_requests_use_session(
+        self, client_config, sample_page_data, mock_requests_response
+    ):
+        """Test that factory clients send requests through the shared session."""
+        factory = AtlassianClientFactory(**client_config)
+        factory.session = Mock()
+        mock_requests_response.text = json.dumps(sample_page_data)
+        factory.session.request.return_value = mock_requests_response
+
+        page_client = factory.createPageClient()
+        page_client.get("12345")
+
+        factory.session.request.assert_called_once_with(
+            "GET",
+            client_config["base_url"]
+            + "/wiki/rest/api/content/12345?expand=body.storage,version",
+            headers=page_client.HEADERS,
+        )
+
+    def test_factory_context_manager_closes_session(self, client_config):
+        """Test that leaving the context closes the shared session."""
+        with AtlassianClientFactory(**client_config) as factory:
+            factory.session = Mock()
+
+        factory.session.close.assert_called_once()
+
+    def test_create_async_clients_share_session(self, client_config):
+        """Test that async clients built by the factory share one AsyncSession."""
+        factory = AtlassianClientFactory(**client_config, pool_maxsize=50)
+
+        clients = [
+            factory.createAsyncBlogClient(),
+            factory.createAsyncAttachmentClient(),
+            factory.createAsyncPageClient(),
+        ]
+
+        assert isinstance(clients[0], AsyncAtlassianBlogClient)
+        assert isinstance(clients[1], AsyncAtlassianAttachmentClient)
+        assert isinstance(clients[2], AsyncAtlassianPageClient)
+        for client in clients:
+            assert client.session is factory.async_session
+            assert client.base_url == client_config["base_url"]
+        assert factory.async_session.pool_maxsize == 50
+
+    def test_factory_shares_page_cache(self, client_config):
+        """Test that page clients share the factory's page cache."""
+        cache = PageCache(max_entries=10)
+        factory = AtlassianClientFactory(**client_config, page_cache=cache)
+
+        assert factory.createPageClient().cache is cache
+        assert factory.createPageClient().cache is cache
+        assert AtlassianClientFactory(**client_config).createPageClient().cache is None
+
+    def test_factory_passes_parser(self, client_config):
+        """Test that page clients use the factory's parser."""
+        factory = AtlassianClientFactory(**client_config, parser="fast")
+
+        assert factory.createPageClient().parser == "fast"
+        assert factory.createAsyncPageClient().parser == "fast"
+
+    def test_factory_shares_retry_policy(self, client_config):
+        """Test that every client uses the factory's retry policy."""
+        policy = RetryPolicy(max_attempts=3, retry_budget=10)
+        factory = AtlassianClientFactory(**client_config, retry_policy=policy)
+
+        clients = [
+            factory.createPageClient(),
+            factory.createBlogClient(),
+            factory.createAttachmentClient(),
+            factory.createAsyncPageClient(),
+            factory.createAsyncBlogClient(),
+            factory.createAsyncAttachmentClient(),
+        ]
+
+        assert all(client.retry_policy is policy for client in clients)
+        assert isinstance(
+            AtlassianClientFactory(**client_config).createPageClient().retry_policy,
+            RetryPolicy,
+        )
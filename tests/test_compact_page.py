@@ -0,0 +1,159 @@
+"""Tests for CompactAtlassianPage."""
+
+import copy
+import json
+from unittest.mock import patch
+
+import pytest
+
+from atlassian_page_client.compact_page import CompactAtlassianPage
+from atlassian_page_client.page import AtlassianPage
+from atlassian_page_client.page_client import AtlassianPageClient
+from tests.conftest import MockResponse
+
+
+class TestCompactAtlassianPage:
+    """Test cases for CompactAtlassianPage class."""
+
+    def test_keeps_only_needed_fields(self, sample_page_data):
+        """Test that the page has no __dict__ and does not keep the response."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+
+        assert not hasattr(page, "__dict__")
+        assert not hasattr(page, "raw_content")
+        assert page.get_title() == "Test Page"
+        assert page.get_version() == 1
+        assert page.links == sample_page_data["_links"]
+
+    def test_get_page_content_dict(self, sample_page_data):
+        """Test that the page definition matches the one of AtlassianPage."""
+        page = CompactAtlassianPage("12345", copy.deepcopy(sample_page_data))
+        full = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+
+        assert page.get_page_content_dict() == full.get_page_content_dict()
+
+    def test_parsing_drops_the_storage_string(self, sample_page_data):
+        """Test that only the soup holds the body once it is parsed."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+
+        content = page.get_working_page_content()
+
+        assert page.is_parsed() is True
+        assert page._storage is None
+        assert content.raw_html is None
+
+    def test_release_keeps_edits(self, sample_page_data):
+        """Test that release serializes the content and drops the soup."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+        content = page.page_content
+        content.find_by_Attribute("ac:local-id", "test-table").append(
+            content.new_tag("tr")
+        )
+
+        page.release()
+
+        assert page.is_parsed() is False
+        assert "<tr></tr>" in page.get_page_content_dict()["body"]["storage"]["value"]
+        assert page.is_modified() is True
+        assert "<tr></tr>" in str(page.page_content.soup)
+
+    def test_release_without_parsing_is_a_no_op(self, sample_page_data):
+        """Test that releasing an unparsed page keeps the original body."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+
+        page.release()
+
+        assert page.get_storage() is sample_page_data["body"]["storage"]["value"]
+
+    def test_parsed_page_without_edits_is_not_modified(self):
+        """Test that markup rewritten by the parser is not a modification."""
+        page = CompactAtlassianPage(
+            "1",
+            {"title": "T", "body": {"storage": {"value": "<p class='a'>b</p>"}}},
+        )
+        page.page_content
+        page.release()
+
+        assert page.get_storage() == '<p class="a">b</p>'
+        assert page.is_modified() is False
+
+    def test_direct_tag_edits_are_modifications(self):
+        """Test that renames and new attrs dicts count, also after release."""
+        storage = "<p class='a'>b</p>"
+        page = CompactAtlassianPage(
+            "1", {"title": "T", "body": {"storage": {"value": storage}}}
+        )
+        page.page_content.get_root().find("p").name = "h1"
+        assert page.is_modified() is True
+
+        page = CompactAtlassianPage(
+            "1", {"title": "T", "body": {"storage": {"value": storage}}}
+        )
+        page.page_content.get_root().find("p").attrs = {"class": "b"}
+        page.release()
+        assert page.is_modified() is True
+        assert page.get_storage() == '<p class="b">b</p>'
+
+    def test_title_change_is_a_modification(self, sample_page_data):
+        """Test that set_title makes the page modified."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+
+        page.set_title("Renamed Page")
+
+        assert page.is_modified() is True
+        assert page.get_page_content_dict()["title"] == "Renamed Page"
+
+    def test_increase_version(self, sample_page_data):
+        """Test that the version number and link are increased."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+
+        page.increase_version()
+
+        version = page.get_page_content_dict()["version"]
+        assert version["number"] == 2
+        assert version["_links"]["self"].endswith("/content/12345/version/2")
+
+    def test_from_page(self, sample_page_data):
+        """Test that an AtlassianPage is converted with its edits."""
+        full = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        full.raw_content["title"] = "Renamed Page"
+
+        page = CompactAtlassianPage.from_page(full)
+
+        assert page.get_title() == "Renamed Page"
+        assert page.is_modified() is False
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_client_returns_compact_pages(
+        self, mock_get, mock_put, client_config, sample_page_data
+    ):
+        """Test that a compact page client gets and puts compact pages."""
+        updated_data = copy.deepcopy(sample_page_data)
+        updated_data["version"]["number"] = 2
+        mock_get.return_value = MockResponse(
+            status_code=200, text=json.dumps(sample_page_data)
+        )
+        mock_put.return_value = MockResponse(
+            status_code=200, text=json.dumps(updated_data)
+        )
+        client = AtlassianPageClient(**client_config, compact=True)
+
+        page = client.get("12345")
+        assert client.put(page) is page
+        page.set_title("Renamed Page")
+        updated_page = client.put(page)
+
+        assert isinstance(page, CompactAtlassianPage)
+        assert isinstance(updated_page, CompactAtlassianPage)
+        sent = json.loads(mock_put.call_args[1]["data"])
+        assert sent["title"] == "Renamed Page"
+        assert sent["version"]["number"] == 2
+        assert updated_page.get_version() == 2
+
+    def test_slots_reject_new_attributes(self, sample_page_data):
+        """Test that attributes outside the slots cannot be added."""
+        page = CompactAtlassianPage("12345", sample_page_data)
+
+        with pytest.raises(AttributeError):
+            page.raw_content = sample_page_data
@@ -0,0 +1,183 @@
+"""Tests for PageEditQueue."""
+
+import copy
+import threading
+import time
+
+import pytest
+
+from atlassian_page_client.edit_queue import PageEditQueue
+from atlassian_page_client.exceptions import AtlassianServerError
+from atlassian_page_client.page import AtlassianPage
+
+
+class FakePageClient:
+    """Applies put_with_retry to local copies of sample_page_data."""
+
+    def __init__(self, page_data, error=None):
+        self.page_data = page_data
+        self.error = error
+        self.puts = []
+
+    def put_with_retry(self, page_id, mutate_fn, max_attempts=5):
+        page = AtlassianPage(page_id, copy.deepcopy(self.page_data))
+        mutate_fn(page.get_working_page_content())
+        if self.error is not None:
+            raise self.error
+        self.puts.append((page_id, page.get_page_content_dict()))
+        return page
+
+
+def add_paragraph(text):
+    def mutate(content):
+        content.get_root().append(content.new_tag("p", string=text))
+
+    return mutate
+
+
+class TestPageEditQueue:
+    """Test cases for PageEditQueue class."""
+
+    def test_edits_within_window_are_one_put(self, sample_page_data):
+        """Test that edits from many threads end up in a single put."""
+        client = FakePageClient(sample_page_data)
+        queue = PageEditQueue(client, window=0.2)
+        futures = []
+
+        def produce(i):
+            futures.append(queue.submit("12345", add_paragraph(f"event {i}")))
+
+        threads = [threading.Thread(target=produce, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pages = {id(future.result(timeout=5)) for future in futures}
+        queue.close()
+
+        assert len(client.puts) == 1
+        assert len(pages) == 1
+        storage = client.puts[0][1]["body"]["storage"]["value"]
+        assert all(f"<p>event {i}</p>" in storage for i in range(10))
+
+    def test_edits_are_applied_in_order(self, sample_page_data):
+        """Test that the edits of one producer keep their order."""
+        client = FakePageClient(sample_page_data)
+
+        with PageEditQueue(client, window=0.05) as queue:
+            for text in ["first", "second", "third"]:
+                queue.submit("12345", add_paragraph(text))
+
+        storage = client.puts[0][1]["body"]["storage"]["value"]
+        assert storage.endswith("<p>first</p><p>second</p><p>third</p>")
+
+    def test_max_edits_sends_before_the_window(self, sample_page_data):
+        """Test that a full batch is sent without waiting for the window."""
+        client = FakePageClient(sample_page_data)
+        queue = PageEditQueue(client, window=60, max_edits=3)
+
+        start = time.perf_counter()
+        futures = [queue.submit("12345", add_paragraph(str(i))) for i in range(3)]
+        futures[0].result(timeout=5)
+
+        assert time.perf_counter() - start < 5
+        assert len(client.puts) == 1
+        queue.close()
+
+    def test_batches_of_a_page_are_sent_in_order(self, sample_page_data):
+        """Test that batches of one page are put one by one, in order."""
+        client = FakePageClient(sample_page_data)
+
+        with PageEditQueue(client, window=60, max_edits=1, max_workers=8) as queue:
+            for i in range(300):
+                queue.submit("12345", add_paragraph(f"event {i}"))
+            queue.flush()
+
+        assert queue._sending == {}
+        sent = [
+            content["body"]["storage"]["value"].rsplit("<p>", 1)[1]
+            for _, content in client.puts
+        ]
+        assert sent == [f"event {i}</p>" for i in range(300)]
+
+    def test_pages_are_batched_separately(self, sample_page_data):
+        """Test that edits of different pages go into different puts."""
+        client = FakePageClient(sample_page_data)
+
+        with PageEditQueue(client, window=60) as queue:
+            queue.submit("1", add_paragraph("a"))
+            queue.submit("2", add_paragraph("b"))
+            queue.submit("1", add_paragraph("c"))
+            queue.flush()
+
+            assert sorted(page_id for page_id, _ in client.puts) == ["1", "2"]
+
+    def test_failing_edit_does_not_fail_the_batch(self, sample_page_data):
+        """Test that an edit raising only fails its own future."""
+        client = FakePageClient(sample_page_data)
+
+        def failing(content):
+            raise KeyError("missing row")
+
+        with PageEditQueue(client, window=60) as queue:
+            good = queue.submit("12345", add_paragraph("kept"))
+            bad = queue.submit("12345", failing)
+
+        with pytest.raises(KeyError):
+            bad.result()
+        assert isinstance(good.result(), AtlassianPage)
+        assert "<p>kept</p>" in client.puts[0][1]["body"]["storage"]["value"]
+
+    def test_cancelled_edit_is_dropped(self, sample_page_data):
+        """Test that a cancelled edit is not applied and later batches are sent."""
+        client = FakePageClient(sample_page_data)
+
+        with PageEditQueue(client, window=60, max_workers=1) as queue:
+            cancelled = queue.submit("12345", add_paragraph("cancelled"))
+            kept = queue.submit("12345", add_paragraph("kept"))
+            assert cancelled.cancel() is True
+            queue.flush()
+            later = queue.submit("12345", add_paragraph("later"))
+            queue.flush()
+
+        assert isinstance(kept.result(timeout=5), AtlassianPage)
+        assert isinstance(later.result(timeout=5), AtlassianPage)
+        storages = [content["body"]["storage"]["value"] for _, content in client.puts]
+        assert len(storages) == 2
+        assert "cancelled" not in storages[0]
+        assert "<p>kept</p>" in storages[0]
+
+    def test_cancelled_batch_does_not_block_the_page(self, sample_page_data):
+        """Test that a batch whose edits were all cancelled is skipped."""
+        client = FakePageClient(sample_page_data)
+
+        with PageEditQueue(client, window=60) as queue:
+            queue.submit("12345", add_paragraph("cancelled")).cancel()
+            queue.flush()
+            later = queue.submit("12345", add_paragraph("later"))
+            queue.flush()
+
+            assert later.done()
+        assert len(client.puts) == 1
+        assert queue._sending == {}
+
+    def test_failed_put_fails_all_edits(self, sample_page_data):
+        """Test that every edit of a batch gets the error of its put."""
+        client = FakePageClient(
+            sample_page_data, error=AtlassianServerError("url", 500, "Error")
+        )
+
+        with PageEditQueue(client, window=60) as queue:
+            futures = [queue.submit("12345", add_paragraph(str(i))) for i in range(3)]
+
+        for future in futures:
+            with pytest.raises(AtlassianServerError):
+                future.result()
+
+    def test_submit_after_close(self, sample_page_data):
+        """Test that a closed queue rejects new edits."""
+        queue = PageEditQueue(FakePageClient(sample_page_data))
+        queue.close()
+
+        with pytest.raises(RuntimeError):
+            queue.submit("12345", add_paragraph("late"))
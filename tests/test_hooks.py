@@ -0,0 +1,150 @@
+"""Tests for the request lifecycle hooks."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from atlassian_page_client.async_page_client import AsyncAtlassianPageClient
+from atlassian_page_client.client_factory import AtlassianClientFactory
+from atlassian_page_client.exceptions import AtlassianNotFoundError
+from atlassian_page_client.hooks import RequestHooks
+from atlassian_page_client.page_client import AtlassianPageClient
+from atlassian_page_client.retry import RetryPolicy
+from benchmarks.server import FakeConfluenceServer
+from tests.conftest import FakeAsyncResponse, MockResponse
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+        self.parsed = []
+
+    def request_start(self, event):
+        self.started.append(event)
+
+    def request_end(self, event):
+        self.ended.append(event)
+
+    def content_parsed(self, event):
+        self.parsed.append(event)
+
+
+class TestRequestHooks:
+    """Test cases for RequestHooks and the events emitted by the clients."""
+
+    def test_get_and_put_phases_over_http(self):
+        """Test the phases of real requests through a factory session."""
+        hooks = RecordingHooks()
+        with FakeConfluenceServer(page_kib=20) as server:
+            with AtlassianClientFactory(
+                "a@b.c", "token", server.base_url, hooks=hooks
+            ) as factory:
+                client = factory.createPageClient()
+                page = client.get("5")
+                page.get_working_page_content()
+                client.get("5")
+                page.raw_content["title"] = "Renamed"
+                client.put(page)
+
+        first_get, second_get, put = hooks.ended
+        assert hooks.started == hooks.ended
+        assert first_get.method == "GET"
+        assert first_get.page_id == "5"
+        assert first_get.status == 200
+        assert first_get.retries == 0
+        assert first_get.bytes_received > 20 * 1024
+        assert {"connect", "send", "ttfb", "download", "json_decode"} <= set(
+            first_get.timings
+        )
+        assert all(seconds >= 0 for seconds in first_get.timings.values())
+        assert first_get.elapsed >= first_get.timings["ttfb"]
+        # the second request reuses the pooled connection
+        assert "connect" not in second_get.timings
+
+        assert put.method == "PUT"
+        assert put.bytes_sent > 20 * 1024
+        assert {"serialize", "json_encode", "send", "ttfb", "json_decode"} <= set(
+            put.timings
+        )
+
+        (parsed,) = hooks.parsed
+        assert parsed.page_id == "5"
+        assert parsed.parser == "html.parser"
+        assert parsed.chars > 20 * 1024
+        assert parsed.seconds > 0
+
+    @patch("atlassian_page_client.base_client.time.sleep")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_retries_and_errors_are_reported(self, mock_get, mock_sleep, client_config):
+        """Test that the retry count and the raised error end up in the event."""
+        mock_get.side_effect = [
+            MockResponse(status_code=503, content=b"", headers={}),
+            MockResponse(
+                status_code=404, content=b"Not Found", text="Not Found", headers={}
+            ),
+        ]
+        hooks = RecordingHooks()
+        client = AtlassianPageClient(
+            **client_config, retry_policy=RetryPolicy(), hooks=hooks
+        )
+
+        with pytest.raises(AtlassianNotFoundError):
+            client.get("9")
+
+        (event,) = hooks.ended
+        assert event.retries == 1
+        assert event.status == 404
+        assert isinstance(event.error, AtlassianNotFoundError)
+        assert event.bytes_received == len(b"Not Found")
+        assert mock_get.call_args[1]["stream"] is True
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_no_hooks_no_streaming(self, mock_get, client_config, sample_page_data):
+        """Test that clients without hooks send requests unchanged."""
+        mock_get.return_value = MockResponse(
+            status_code=200, text=json.dumps(sample_page_data)
+        )
+        client = AtlassianPageClient(**client_config)
+
+        client.get("12345")
+
+        assert "stream" not in mock_get.call_args[1]
+
+    def test_async_events(self, client_config, sample_page_data, fake_async_session):
+        """Test that async clients report the same events."""
+        hooks = RecordingHooks()
+        session = fake_async_session(
+            FakeAsyncResponse(text=json.dumps(sample_page_data))
+        )
+        client = AsyncAtlassianPageClient(**client_config, session=session, hooks=hooks)
+
+        page = asyncio.run(client.get("12345"))
+        page.get_working_page_content()
+
+        (event,) = hooks.ended
+        assert event.page_id == "12345"
+        assert event.status == 200
+        assert event.bytes_received == len(json.dumps(sample_page_data))
+        assert {"ttfb", "download", "json_decode"} <= set(event.timings)
+        _, _, kwargs = session.client_session.calls[0]
+        assert isinstance(kwargs["trace_request_ctx"], dict)
+        assert len(hooks.parsed) == 1
+
+    def test_factory_shares_hooks(self, client_config):
+        """Test that every client of a factory reports to its hooks."""
+        hooks = RequestHooks()
+        factory = AtlassianClientFactory(**client_config, hooks=hooks)
+
+        clients = [
+            factory.createPageClient(),
+            factory.createBlogClient(),
+            factory.createAttachmentClient(),
+            factory.createAsyncPageClient(),
+            factory.createAsyncBlogClient(),
+            factory.createAsyncAttachmentClient(),
+        ]
+
+        assert all(client.hooks is hooks for client in clients)
@@ -0,0 +1,102 @@
+"""Tests for the pooled HTTP session helpers."""
+
+import asyncio
+import base64
+
+import pytest
+import requests
+
+from atlassian_page_client.http_session import (
+    AsyncSession,
+    basic_auth_header,
+    create_session,
+)
+
+
+class TestHttpSession:
+    """Test cases for create_session and basic_auth_header."""
+
+    def test_basic_auth_header(self):
+        """Test the precomputed Authorization header value."""
+        header = basic_auth_header("test@example.com", "token")
+
+        assert header.startswith("Basic ")
+        decoded = base64.b64decode(header[len("Basic ") :]).decode()
+        assert decoded == "test@example.com:token"
+
+    def test_basic_auth_header_matches_requests(self):
+        """Test that the header matches what HTTPBasicAuth would send."""
+        request = requests.Request(
+            "GET",
+            "https://example.atlassian.net",
+            auth=requests.auth.HTTPBasicAuth("test+user@example.com", "t!@#$%"),
+        ).prepare()
+
+        assert request.headers["Authorization"] == basic_auth_header(
+            "test+user@example.com", "t!@#$%"
+        )
+
+    def test_create_session_sets_auth_header(self, client_config):
+        """Test that the session carries the Authorization header."""
+        session = create_session(client_config["email"], client_config["token"])
+
+        assert isinstance(session, requests.Session)
+        assert session.headers["Authorization"] == basic_auth_header(
+            client_config["email"], client_config["token"]
+        )
+        assert "Connection" not in session.headers or (
+            session.headers["Connection"] == "keep-alive"
+        )
+
+    def test_create_session_pool_configuration(self, client_config):
+        """Test that pool size and per host connections are applied."""
+        session = create_session(
+            client_config["email"],
+            client_config["token"],
+            pool_connections=3,
+            pool_maxsize=25,
+        )
+
+        for prefix in ("https://", "http://"):
+            adapter = session.get_adapter(prefix + "example.atlassian.net")
+            assert adapter._pool_connections == 3
+            assert adapter._pool_maxsize == 25
+
+    def test_create_session_without_keep_alive(self, client_config):
+        """Test that keep-alive can be disabled."""
+        session = create_session(
+            client_config["email"], client_config["token"], keep_alive=False
+        )
+
+        assert session.headers["Connection"] == "close"
+
+    def test_async_session_creates_client_session_lazily(self, client_config):
+        """Test that the aiohttp session is created in the running loop."""
+        aiohttp = pytest.importorskip("aiohttp")
+        session = AsyncSession(
+            client_config["email"],
+            client_config["token"],
+            pool_connections=2,
+            pool_maxsize=8,
+            keep_alive=False,
+        )
+        assert session.client_session is None
+
+        async def open_and_close():
+            client_session = await session.get()
+            assert await session.get() is client_session
+            connector = client_session.connector
+            result = (
+                isinstance(client_session, aiohttp.ClientSession),
+                connector.limit,
+                connector.limit_per_host,
+                connector.force_close,
+            )
+            await session.close()
+            return result, client_session.closed
+
+        result, closed = asyncio.run(open_and_close())
+
+        assert result == (True, 16, 8, True)
+        assert closed is True
+        assert session.client_session is None
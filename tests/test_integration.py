@@ -1,12 +1,13 @@
 """Integration tests for atlassian-page-client."""
 
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from atlassian_page_client import (AtlassianPage, AtlassianPageClient,
                                    AtlassianPageContent)
+from tests.conftest import MockResponse
 
 
 class TestIntegration:
@@ -22,13 +23,13 @@ class TestIntegration:
         client = AtlassianPageClient(**client_config)
 
         # Mock GET request
-        get_response = Mock()
+        get_response = MockResponse()
         get_response.status_code = 200
         get_response.text = json.dumps(sample_page_data)
         mock_get.return_value = get_response
 
         # Mock PUT request
-        put_response = Mock()
+        put_response = MockResponse()
         put_response.status_code = 200
         updated_data = sample_page_data.copy()
         updated_data["version"]["number"] = sample_page_data["version"]["number"] + 1
@@ -76,7 +77,7 @@ class TestIntegration:
         client = AtlassianPageClient(**client_config)
 
         # Mock GET request
-        response = Mock()
+        response = MockResponse()
         response.status_code = 200
         response.text = json.dumps(sample_page_data)
         mock_get.return_value = response
@@ -181,7 +182,7 @@ class TestIntegration:
 
         # Test that client errors propagate properly
         with patch("atlassian_page_client.page_client.requests.get") as mock_get:
-            response = Mock()
+            response = MockResponse()
             response.status_code = 500
             response.text = "Internal Server Error"
             response.url = "http://test.com/api"
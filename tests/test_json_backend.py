@@ -0,0 +1,96 @@
+"""Tests for the pluggable JSON backends."""
+
+import copy
+import json
+from unittest.mock import patch
+
+import pytest
+
+from atlassian_page_client.json_backend import json_headers, resolve_json_backend
+from atlassian_page_client.page import AtlassianPage
+from atlassian_page_client.page_client import AtlassianPageClient
+from tests.conftest import MockResponse
+
+HEADERS = {"Content-Type": "application/json;charset=iso-8859-1"}
+
+
+class TestResolveJsonBackend:
+    """Test cases for resolve_json_backend."""
+
+    def test_auto_prefers_installed_fast_backend(self):
+        """Test that auto picks orjson when it is installed."""
+        pytest.importorskip("orjson")
+
+        assert resolve_json_backend().name == "orjson"
+        assert resolve_json_backend("auto") is resolve_json_backend(None)
+
+    def test_stdlib_backend_works_on_bytes(self):
+        """Test that the standard library backend decodes and encodes bytes."""
+        backend = resolve_json_backend("json")
+
+        assert backend.loads(b'{"title": "T\\u00e4st"}') == {"title": "Täst"}
+        assert backend.dumps({"title": "Täst"}) == b'{"title": "T\\u00e4st"}'
+
+    def test_orjson_backend(self):
+        """Test that the orjson backend encodes to UTF-8 bytes."""
+        pytest.importorskip("orjson")
+        backend = resolve_json_backend("orjson")
+
+        assert backend.dumps({"title": "Täst"}) == '{"title":"Täst"}'.encode("utf-8")
+        assert backend.loads(backend.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend 'simplejson'"):
+            resolve_json_backend("simplejson")
+
+    def test_missing_backend(self):
+        """Test that a named backend that is not installed raises ImportError."""
+        with patch.dict("sys.modules", {"ujson": None}), patch.dict(
+            "atlassian_page_client.json_backend._resolved", clear=True
+        ):
+            with pytest.raises(ImportError, match="'ujson' is not installed"):
+                resolve_json_backend("ujson")
+
+
+class TestJsonHeaders:
+    """Test cases for json_headers."""
+
+    def test_ascii_body_keeps_headers(self):
+        """Test that an ASCII body is sent with the client's headers."""
+        assert json_headers(HEADERS, b'{"title": "T\\u00e4st"}') is HEADERS
+
+    def test_utf8_body_declares_utf8(self):
+        """Test that a body with raw UTF-8 declares the utf-8 charset."""
+        headers = json_headers(HEADERS, '{"title":"Täst"}'.encode("utf-8"))
+
+        assert headers["Content-Type"] == "application/json;charset=utf-8"
+        assert HEADERS["Content-Type"] == "application/json;charset=iso-8859-1"
+
+
+class TestClientJsonBackend:
+    """Test cases for clients using a JSON backend."""
+
+    @pytest.mark.parametrize("backend", ["json", "orjson"])
+    @patch("atlassian_page_client.page_client.requests.put")
+    def test_put_sends_bytes(self, mock_put, backend, client_config, sample_page_data):
+        """Test that the page client sends and decodes bytes with each backend."""
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+        updated_data = copy.deepcopy(sample_page_data)
+        updated_data["title"] = "Täst"
+        updated_data["version"]["number"] = 2
+        mock_put.return_value = MockResponse(
+            status_code=200, text=json.dumps(updated_data)
+        )
+        client = AtlassianPageClient(**client_config, json_backend=backend)
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.raw_content["title"] = "Täst"
+
+        updated_page = client.put(page)
+
+        kwargs = mock_put.call_args[1]
+        assert isinstance(kwargs["data"], bytes)
+        assert json.loads(kwargs["data"])["title"] == "Täst"
+        assert kwargs["headers"] == json_headers(client.HEADERS, kwargs["data"])
+        assert updated_page.raw_content["title"] == "Täst"
@@ -0,0 +1,137 @@
+"""Tests for the streaming multipart encoder."""
+
+import io
+
+import requests
+
+from atlassian_page_client.multipart import MultipartEncoder, MultipartField
+
+
+def parse_with_requests_reference(fields):
+    """Encode the same fields with requests to compare the wire format."""
+    files = {
+        name: (filename, data.getvalue() if hasattr(data, "getvalue") else data)
+        for name, filename, data in fields
+    }
+    return requests.Request("POST", "http://x", files=files).prepare()
+
+
+class TestMultipartEncoder:
+    """Test cases for MultipartEncoder class."""
+
+    def test_body_matches_requests_encoding(self):
+        """Test that the streamed body equals what requests would build."""
+        reference = parse_with_requests_reference(
+            [("file", "report.txt", b"hello world")]
+        )
+        boundary = reference.headers["Content-Type"].split("boundary=")[1]
+
+        encoder = MultipartEncoder(
+            [MultipartField("file", io.BytesIO(b"hello world"), "report.txt")],
+            boundary=boundary,
+        )
+
+        assert encoder.content_type == reference.headers["Content-Type"]
+        assert encoder.read() == reference.body
+        assert encoder.len == len(reference.body)
+
+    def test_multiple_fields(self):
+        """Test that several file parts are encoded in order."""
+        encoder = MultipartEncoder(
+            [
+                MultipartField("file", b"first", "a.txt"),
+                MultipartField("file", io.BytesIO(b"second"), "b.txt", "text/plain"),
+            ],
+            boundary="b",
+        )
+
+        body = encoder.read()
+
+        assert body == (
+            b'--b\r\nContent-Disposition: form-data; name="file"; filename="a.txt"'
+            b"\r\n\r\nfirst\r\n"
+            b'--b\r\nContent-Disposition: form-data; name="file"; filename="b.txt"'
+            b"\r\nContent-Type: text/plain\r\n\r\nsecond\r\n"
+            b"--b--\r\n"
+        )
+        assert encoder.len == len(body)
+
+    def test_reads_in_bounded_chunks(self):
+        """Test that files are read chunk by chunk instead of all at once."""
+        reads = []
+
+        class RecordingFile(io.BytesIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        encoder = MultipartEncoder(
+            [MultipartField("file", RecordingFile(b"x" * 10000), "big.bin")],
+            chunk_size=1024,
+        )
+
+        chunks = list(encoder)
+
+        assert all(size == 1024 for size in reads)
+        assert max(len(chunk) for chunk in chunks) <= 1024
+        assert sum(len(chunk) for chunk in chunks) == encoder.len
+
+    def test_read_with_size(self):
+        """Test that read honours the requested size."""
+        encoder = MultipartEncoder([MultipartField("file", b"abcdef", "f")])
+        total = encoder.len
+
+        parts = []
+        while True:
+            part = encoder.read(7)
+            if not part:
+                break
+            assert len(part) <= 7
+            parts.append(part)
+
+        assert sum(len(p) for p in parts) == total
+
+    def test_unknown_length_for_iterators(self):
+        """Test that iterator sources report no length."""
+        encoder = MultipartEncoder([MultipartField("file", iter([b"a", b"b"]), "f")])
+
+        assert encoder.len is None
+        assert b"\r\n\r\nab\r\n" in encoder.read()
+
+    def test_progress_callback(self):
+        """Test that progress is reported with the running total."""
+        progress = []
+        encoder = MultipartEncoder(
+            [MultipartField("file", b"x" * 5000, "f")],
+            chunk_size=1000,
+            progress_callback=lambda sent, total: progress.append((sent, total)),
+        )
+
+        encoder.read()
+
+        assert progress[-1] == (encoder.len, encoder.len)
+        assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+    def test_filename_is_escaped(self):
+        """Test that quotes and newlines in file names are escaped."""
+        encoder = MultipartEncoder([MultipartField("file", b"", 'a"b\nc.txt')])
+
+        assert b'filename="a%22b%0Ac.txt"' in encoder.read()
+
+    def test_requests_streams_the_encoder(self):
+        """Test that requests treats the encoder as a streamed body."""
+        encoder = MultipartEncoder([MultipartField("file", b"data", "f")])
+        prepared = requests.Request(
+            "POST",
+            "http://x",
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+        ).prepare()
+
+        assert prepared.body is encoder
+        assert prepared.headers["Content-Length"] == str(encoder.len)
+
+        chunked = MultipartEncoder([MultipartField("file", iter([b"data"]), "f")])
+        prepared = requests.Request("POST", "http://x", data=chunked).prepare()
+
+        assert prepared.headers["Transfer-Encoding"] == "chunked"
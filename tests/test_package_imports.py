@@ -1,7 +1,29 @@
 """Test package imports and basic functionality."""
 
+import json
+import subprocess
+import sys
+
 import pytest
 
+HEAVY_MODULES = ["aiohttp", "bs4", "requests"]
+
+
+def _import_in_subprocess(statement):
+    """Run statement in a fresh interpreter, return its time and heavy imports."""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "seconds = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'seconds': seconds, 'heavy': heavy}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output)
+
 
 def test_package_imports():
     """Test that all main classes can be imported from the package."""
@@ -100,3 +122,59 @@ def test_class_instantiation():
     )
     assert attachment_client is not None
     assert attachment_client.email == "test@example.com"
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package imports none of the heavy dependencies."""
+    result = _import_in_subprocess("import atlassian_page_client")
+
+    assert result["heavy"] == []
+    assert result["seconds"] < 0.25
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("AtlassianBlogClient", ["requests"]),
+        ("AtlassianAttachmentClient", ["requests"]),
+        ("AsyncAtlassianBlogClient", []),
+        ("AtlassianPageContent", ["bs4"]),
+        ("StorageStream", []),
+        ("RetryPolicy", []),
+        ("AtlassianAPIError", []),
+        ("AtlassianClientFactory", []),
+    ],
+)
+def test_classes_import_only_what_they_need(name, expected):
+    """Test that a class only imports the heavy dependencies it uses."""
+    result = _import_in_subprocess(f"from atlassian_page_client import {name}")
+
+    assert result["heavy"] == expected
+
+
+@pytest.mark.parametrize(
+    "create, expected",
+    [
+        ("createBlogClient", ["requests"]),
+        ("createAttachmentClient", ["requests"]),
+        ("createPageClient", ["bs4", "requests"]),
+        ("createAsyncBlogClient", []),
+        ("createAsyncAttachmentClient", []),
+    ],
+)
+def test_factory_clients_import_only_what_they_need(create, expected):
+    """Test that factory clients only import the dependencies they use."""
+    result = _import_in_subprocess(
+        "from atlassian_page_client import AtlassianClientFactory\n"
+        f"AtlassianClientFactory('a@b.c', 'token', 'https://x').{create}()"
+    )
+
+    assert result["heavy"] == expected
+
+
+def test_unknown_attribute():
+    """Test that unknown package attributes still raise AttributeError."""
+    import atlassian_page_client
+
+    with pytest.raises(AttributeError):
+        atlassian_page_client.NoSuchClient
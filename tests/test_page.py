@@ -2,10 +2,11 @@
 
 import copy
 import json
+from unittest.mock import patch
 
 import pytest
 
-from atlassian_page_client.page import AtlassianPage
+from atlassian_page_client.page import AtlassianPage, storage_fingerprint
 from atlassian_page_client.page_content import AtlassianPageContent
 
 
@@ -70,6 +71,28 @@ class TestAtlassianPage:
         # Should include the modification
         assert "Added paragraph" in html_value
 
+    def test_get_page_content_dict_keeps_unedited_markup(self, sample_page_data):
+        """Test that parts of the body that were not edited keep their source."""
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+
+        page.get_working_page_content().get_root().find("p").string = "Edited"
+
+        html_value = page.get_page_content_dict()["body"]["storage"]["value"]
+        assert html_value == (
+            "<p>Edited</p><table ac:local-id='test-table'><tr><td>Cell 1</td></tr></table>"
+        )
+
+    def test_get_storage_stream(self, sample_page_data):
+        """Test that the stream reads the body without parsing, edits included."""
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+
+        cell = page.get_storage_stream().find("td", text=True)
+        assert cell.text == "Cell 1"
+        assert page.is_parsed() is False
+
+        page.get_working_page_content().get_root().find("td").string = "Edited"
+        assert page.get_storage_stream().find("td", text=True).text == "Edited"
+
     def test_increase_version(self, sample_page_data):
         """Test increase_version method."""
         page_data = copy.deepcopy(sample_page_data)
@@ -136,3 +159,93 @@ class TestAtlassianPage:
         # Page2 content should be unchanged
         content2_html = page2.get_page_content_dict()["body"]["storage"]["value"]
         assert "Page 1 modification" not in content2_html
+
+    def test_storage_body_is_parsed_lazily(self, sample_page_data):
+        """Test that the storage body is not parsed until it is requested."""
+        with patch("atlassian_page_client.page.AtlassianPageContent") as content_cls:
+            page = AtlassianPage("12345", sample_page_data)
+
+            assert page.get_page_id() == "12345"
+            assert page.get_version() == 1
+            assert page.get_title() == "Test Page"
+            assert page.is_parsed() is False
+            content_cls.assert_not_called()
+
+            content = page.get_working_page_content()
+
+            content_cls.assert_called_once_with(
+                sample_page_data["body"]["storage"]["value"], parser=None, keep_raw=True
+            )
+            assert page.get_working_page_content() is content
+            assert page.is_parsed() is True
+
+    def test_get_page_content_dict_without_parsing(self, sample_page_data):
+        """Test that an untouched page returns the original storage string."""
+        page_data = copy.deepcopy(sample_page_data)
+        original = '<p>Link <ac:link><ri:page ri:content-title="Foo" /></ac:link></p>'
+        page_data["body"]["storage"]["value"] = original
+        page = AtlassianPage("12345", page_data)
+
+        content_dict = page.get_page_content_dict()
+
+        assert content_dict["body"]["storage"]["value"] is original
+        assert page.is_parsed() is False
+        assert json.loads(page.prettify())["body"]["storage"]["value"] == original
+
+    def test_parser_is_passed_to_content(self, sample_page_data):
+        """Test that the page parses its body with the configured backend."""
+        page = AtlassianPage("12345", sample_page_data, parser="html.parser")
+
+        assert page.get_working_page_content().parser == "html.parser"
+
+    def test_untouched_page_is_not_modified(self, sample_page_data):
+        """Test that a page that was only loaded reports no modification."""
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+
+        assert page.is_modified() is False
+        assert page.is_parsed() is False
+
+    def test_parsed_page_without_edits_is_not_modified(self, sample_page_data):
+        """Test that markup rewritten by the parser alone is not a modification."""
+        page_data = copy.deepcopy(sample_page_data)
+        page_data["body"]["storage"][
+            "value"
+        ] = "<p><ac:link><ri:page ri:content-title='Foo' /></ac:link></p>"
+        page = AtlassianPage("12345", page_data)
+        page.get_working_page_content().find_by_Attribute("ri:content-title", "Foo")
+
+        assert page.is_modified() is False
+
+    def test_edits_are_modifications(self, sample_page_data):
+        """Test that tree edits, attribute edits and title changes are detected."""
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        content = page.get_working_page_content()
+        content.get_root().append(content.new_tag("p", string="new"))
+        assert page.is_modified() is True
+
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.get_working_page_content().get_root().find("td").attrs["class"] = "x"
+        assert page.is_modified() is True
+
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.raw_content["title"] = "Renamed"
+        assert page.is_modified() is True
+
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.raw_content["body"]["storage"]["value"] = "<p>replaced</p>"
+        assert page.is_modified() is True
+
+    def test_reverted_edit_is_not_modified(self, sample_page_data):
+        """Test that the fingerprint matches again once an edit is undone."""
+        page_data = copy.deepcopy(sample_page_data)
+        page_data["body"]["storage"]["value"] = "<p>Test content</p>"
+        page = AtlassianPage("12345", page_data)
+        content = page.get_working_page_content()
+        added = content.new_tag("p", string="new")
+        content.get_root().append(added)
+        added.extract()
+
+        assert page.is_modified() is False
+        assert page.get_loaded_fingerprint() == storage_fingerprint(
+            "Test Page", "<p>Test content</p>"
+        )
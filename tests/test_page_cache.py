@@ -0,0 +1,132 @@
+"""Tests for PageCache."""
+
+import threading
+
+import pytest
+
+from atlassian_page_client.page_cache import PageCache
+
+
+class TestPageCache:
+    """Test cases for PageCache class."""
+
+    def test_requires_a_budget(self):
+        """Test that an unbounded cache is rejected."""
+        with pytest.raises(ValueError):
+            PageCache(max_entries=None, max_bytes=None)
+
+    def test_get_and_put(self):
+        """Test storing and reading a page."""
+        cache = PageCache()
+        cache.put("1", 3, '{"id": "1"}')
+
+        assert cache.get("1") == '{"id": "1"}'
+        assert cache.get("1", version=3) == '{"id": "1"}'
+        assert cache.get_version("1") == 3
+        assert "1" in cache
+        assert len(cache) == 1
+
+    def test_version_mismatch_is_a_miss(self):
+        """Test that asking for another version misses."""
+        cache = PageCache()
+        cache.put("1", 3, "v3")
+
+        assert cache.get("1", version=4) is None
+        assert cache.get("2") is None
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_newer_version_replaces_older(self):
+        """Test that only the newest version of a page is kept."""
+        cache = PageCache()
+        cache.put("1", 3, "v3")
+        cache.put("1", 4, "v4")
+        cache.put("1", 2, "v2")
+
+        assert len(cache) == 1
+        assert cache.get("1") == "v4"
+        assert cache.size_bytes == 2
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used page is evicted first."""
+        cache = PageCache(max_entries=2)
+        cache.put("1", 1, "a")
+        cache.put("2", 1, "b")
+        cache.get("1")
+        cache.put("3", 1, "c")
+
+        assert "2" not in cache
+        assert cache.get("1") == "a"
+        assert cache.get("3") == "c"
+        assert cache.stats()["evictions"] == 1
+
+    def test_lru_eviction_by_bytes(self):
+        """Test that the byte budget is enforced."""
+        cache = PageCache(max_entries=None, max_bytes=10)
+        cache.put("1", 1, "aaaa")
+        cache.put("2", 1, "bbbb")
+        cache.put("3", 1, "cccc")
+
+        assert "1" not in cache
+        assert cache.size_bytes == 8
+        assert cache.stats()["evictions"] == 1
+
+    def test_entry_larger_than_budget_is_not_cached(self):
+        """Test that an oversized entry does not flush the cache."""
+        cache = PageCache(max_entries=None, max_bytes=4)
+        cache.put("1", 1, "aa")
+        cache.put("2", 1, "toolarge")
+
+        assert "1" in cache
+        assert "2" not in cache
+
+    def test_invalidate_and_clear(self):
+        """Test removing entries."""
+        cache = PageCache()
+        cache.put("1", 1, "a")
+        cache.put("2", 1, "b")
+
+        cache.invalidate("1")
+        cache.invalidate("missing")
+        assert "1" not in cache
+        assert cache.size_bytes == 1
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    def test_stats(self):
+        """Test hit and miss counters."""
+        cache = PageCache()
+        cache.put("1", 1, "a")
+        cache.get("1")
+        cache.get("1")
+        cache.get("2")
+
+        assert cache.stats() == {
+            "hits": 2,
+            "misses": 1,
+            "evictions": 0,
+            "entries": 1,
+            "bytes": 1,
+        }
+
+    def test_thread_safety(self):
+        """Test concurrent puts and gets keep the cache consistent."""
+        cache = PageCache(max_entries=50)
+
+        def worker(offset):
+            for i in range(200):
+                cache.put(str((i + offset) % 80), i, "x" * (i % 7))
+                cache.get(str(i % 80))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) <= 50
+        assert cache.size_bytes == sum(
+            len(cache.get(p) or "") for p in list(cache._versions)
+        )
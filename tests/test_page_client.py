@@ -2,13 +2,21 @@
 
 import copy
 import json
-from unittest.mock import Mock, patch
+import threading
+import time
+from unittest.mock import patch
 
 import pytest
 from requests.auth import HTTPBasicAuth
 
+from atlassian_page_client.exceptions import (
+    AtlassianConflictError,
+    AtlassianNotFoundError,
+)
 from atlassian_page_client.page import AtlassianPage
+from atlassian_page_client.page_cache import PageCache
 from atlassian_page_client.page_client import AtlassianPageClient
+from tests.conftest import MockResponse
 
 
 class TestAtlassianPageClient:
@@ -95,6 +103,7 @@ class TestAtlassianPageClient:
 
         # Create a page object
         page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.raw_content["title"] = "Renamed Page"
         original_version = page.raw_content["version"]["number"]
 
         # Setup mock response for PUT
@@ -138,6 +147,7 @@ class TestAtlassianPageClient:
 
         # Create a page object
         page = AtlassianPage("12345", sample_page_data.copy())
+        page.raw_content["title"] = "Renamed Page"
 
         # Setup mock response for failure
         mock_requests_response.status_code = 403
@@ -147,3 +157,545 @@ class TestAtlassianPageClient:
         # Should raise an exception
         with pytest.raises(Exception):
             client.put(page)
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    def test_put_skips_unchanged_page(self, mock_put, client_config, sample_page_data):
+        """Test that an unchanged page is not sent and keeps its version."""
+        client = AtlassianPageClient(**client_config)
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+        page.get_working_page_content()
+
+        result = client.put(page)
+
+        mock_put.assert_not_called()
+        assert result is page
+        assert result.put_skipped is True
+        assert page.get_version() == 1
+
+    @staticmethod
+    def _version(page_data, number, storage):
+        """Copy of page_data at the given version with the given storage body."""
+        data = copy.deepcopy(page_data)
+        data["version"]["number"] = number
+        data["body"]["storage"]["value"] = storage
+        return json.dumps(data)
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_put_with_retry_replays_on_conflict(
+        self, mock_get, mock_put, client_config, sample_page_data
+    ):
+        """Test that a conflicting put is rebased on the latest version."""
+        mock_get.side_effect = [
+            MockResponse(
+                status_code=200, text=self._version(sample_page_data, 1, "<p>a</p>")
+            ),
+            MockResponse(
+                status_code=200, text=self._version(sample_page_data, 2, "<p>b</p>")
+            ),
+        ]
+        mock_put.side_effect = [
+            MockResponse(status_code=409, text="Version conflict", headers={}),
+            MockResponse(
+                status_code=200,
+                text=self._version(sample_page_data, 3, "<p>b</p><p>new</p>"),
+            ),
+        ]
+        client = AtlassianPageClient(**client_config)
+
+        def add_paragraph(content):
+            content.get_root().append(content.new_tag("p", string="new"))
+
+        page = client.put_with_retry("12345", add_paragraph)
+
+        sent = [json.loads(call[1]["data"]) for call in mock_put.call_args_list]
+        assert [data["version"]["number"] for data in sent] == [2, 3]
+        assert sent[1]["body"]["storage"]["value"] == "<p>b</p><p>new</p>"
+        assert page.get_version() == 3
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_put_with_retry_gives_up(
+        self, mock_get, mock_put, client_config, sample_page_data
+    ):
+        """Test that the conflict is raised after max_attempts puts."""
+        mock_get.side_effect = lambda url, **kwargs: MockResponse(
+            status_code=200, text=self._version(sample_page_data, 1, "<p>a</p>")
+        )
+        mock_put.side_effect = lambda url, **kwargs: MockResponse(
+            status_code=409, text="Version conflict", headers={}
+        )
+        client = AtlassianPageClient(**client_config)
+
+        with pytest.raises(AtlassianConflictError):
+            client.put_with_retry(
+                "12345",
+                lambda content: content.get_root().append("x"),
+                max_attempts=3,
+            )
+
+        assert mock_get.call_count == 3
+        assert mock_put.call_count == 3
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_put_with_retry_other_errors_are_not_retried(
+        self, mock_get, mock_put, client_config, sample_page_data
+    ):
+        """Test that errors other than conflicts are raised right away."""
+        mock_get.return_value = MockResponse(
+            status_code=200, text=self._version(sample_page_data, 1, "<p>a</p>")
+        )
+        mock_put.return_value = MockResponse(
+            status_code=404, text="Not Found", headers={}
+        )
+        client = AtlassianPageClient(**client_config)
+
+        with pytest.raises(AtlassianNotFoundError):
+            client.put_with_retry(
+                "12345", lambda content: content.get_root().append("x")
+            )
+
+        assert mock_put.call_count == 1
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    def test_put_force_sends_unchanged_page(
+        self, mock_put, client_config, sample_page_data
+    ):
+        """Test that force=True sends a page even if nothing changed."""
+        client = AtlassianPageClient(**client_config)
+        updated_data = copy.deepcopy(sample_page_data)
+        updated_data["version"]["number"] = 2
+        mock_put.return_value = MockResponse(
+            status_code=200, text=json.dumps(updated_data)
+        )
+        page = AtlassianPage("12345", copy.deepcopy(sample_page_data))
+
+        result = client.put(page, force=True)
+
+        mock_put.assert_called_once()
+        assert json.loads(mock_put.call_args[1]["data"])["version"]["number"] == 2
+        assert result.put_skipped is False
+        assert result.get_version() == 2
+
+    @pytest.mark.parametrize(
+        "edit, expected",
+        [
+            (
+                lambda root: setattr(root.find("td"), "name", "th"),
+                "<tr><th>Cell 1</th></tr>",
+            ),
+            (
+                lambda root: setattr(root.find("table"), "attrs", {"class": "x"}),
+                '<table class="x">',
+            ),
+            (lambda root: root.find("p").string.extract(), '<p class="a"></p>'),
+            (lambda root: root.find("p")["class"].append("b"), '<p class="a b">'),
+        ],
+        ids=["rename", "attrs_reassigned", "string_extracted", "list_attribute"],
+    )
+    @patch("atlassian_page_client.page_client.requests.put")
+    def test_put_sends_edits_outside_the_bs4_api(
+        self, mock_put, client_config, sample_page_data, edit, expected
+    ):
+        """Test that edits made without the bs4 methods are sent, not skipped."""
+        client = AtlassianPageClient(**client_config)
+        mock_put.return_value = MockResponse(
+            status_code=200, text=json.dumps(sample_page_data)
+        )
+        page_data = copy.deepcopy(sample_page_data)
+        page_data["body"]["storage"]["value"] = (
+            "<p class='a'>Test content</p>"
+            "<table ac:local-id='test-table'><tr><td>Cell 1</td></tr></table>"
+        )
+        page = AtlassianPage("12345", page_data)
+
+        edit(page.get_working_page_content().get_root())
+        result = client.put(page)
+
+        mock_put.assert_called_once()
+        assert result.put_skipped is False
+        sent = json.loads(mock_put.call_args[1]["data"])["body"]["storage"]["value"]
+        assert expected in sent
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_many_success(self, mock_get, client_config, sample_page_data):
+        """Test bulk retrieval of several pages in input order."""
+        client = AtlassianPageClient(**client_config)
+
+        def respond(url, **kwargs):
+            response = MockResponse()
+            response.status_code = 200
+            response.text = json.dumps(sample_page_data)
+            return response
+
+        mock_get.side_effect = respond
+
+        results = list(client.get_many(["1", "2", "3"], max_workers=2))
+
+        assert mock_get.call_count == 3
+        assert [r.item for r in results] == ["1", "2", "3"]
+        assert all(isinstance(r.result, AtlassianPage) for r in results)
+        assert [r.result.get_page_id() for r in results] == ["1", "2", "3"]
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_concurrent_gets_share_one_request(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that concurrent gets of one page send one request."""
+        client = AtlassianPageClient(**client_config)
+        started = threading.Event()
+
+        def respond(url, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            return MockResponse(status_code=200, text=json.dumps(sample_page_data))
+
+        mock_get.side_effect = respond
+        pages = []
+
+        def get():
+            pages.append(client.get("12345"))
+
+        threads = [threading.Thread(target=get)]
+        threads[0].start()
+        started.wait()
+        threads += [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_get.call_count == 1
+        assert len(pages) == 5
+        assert len({id(page.raw_content) for page in pages}) == 5
+        pages[0].get_working_page_content().get_root().find("p").string = "Changed"
+        assert (
+            "Changed"
+            not in pages[1].get_page_content_dict()["body"]["storage"]["value"]
+        )
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_many_reports_failures_per_page(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that a failing page does not abort the whole batch."""
+        client = AtlassianPageClient(**client_config)
+
+        def respond(url, **kwargs):
+            response = MockResponse()
+            response.url = url
+            if "/missing?" in url:
+                response.status_code = 404
+                response.text = "Not Found"
+            else:
+                response.status_code = 200
+                response.text = json.dumps(sample_page_data)
+            return response
+
+        mock_get.side_effect = respond
+
+        results = list(client.get_many(["1", "missing", "3"], ordered=False))
+
+        assert sorted(r.item for r in results) == ["1", "3", "missing"]
+        failed = [r for r in results if not r.ok]
+        assert len(failed) == 1
+        assert failed[0].item == "missing"
+        assert "404" in str(failed[0].error)
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_uses_cache(
+        self, mock_get, client_config, sample_page_data, mock_requests_response
+    ):
+        """Test that a cached body is reused when the version did not change."""
+        cache = PageCache()
+        client = AtlassianPageClient(**client_config, cache=cache)
+        mock_requests_response.text = json.dumps(sample_page_data)
+        mock_get.return_value = mock_requests_response
+
+        first = client.get("12345")
+        second = client.get("12345")
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[0][0].endswith("/content/12345?expand=version")
+        assert first is not second
+        assert second.raw_content == sample_page_data
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_refetches_page_changed_elsewhere(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that a cached page is not returned once the server has a newer one."""
+        cache = PageCache()
+        client = AtlassianPageClient(**client_config, cache=cache)
+        cache.put("12345", 1, json.dumps(sample_page_data))
+        updated_data = copy.deepcopy(sample_page_data)
+        updated_data["version"]["number"] = 2
+        mock_get.return_value = MockResponse(
+            status_code=200, text=json.dumps(updated_data)
+        )
+
+        page = client.get("12345")
+
+        assert mock_get.call_count == 2
+        assert page.get_version() == 2
+        assert cache.get_version("12345") == 2
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_cached_pages_are_independent(
+        self, mock_get, client_config, sample_page_data, mock_requests_response
+    ):
+        """Test that edits to a cached page do not leak to other callers."""
+        client = AtlassianPageClient(**client_config, cache=PageCache())
+        mock_requests_response.text = json.dumps(sample_page_data)
+        mock_get.return_value = mock_requests_response
+
+        first = client.get("12345")
+        content = first.get_working_page_content()
+        content.get_root().append(content.new_tag("p", string="local edit"))
+        first.get_page_content_dict()
+        first.raw_content["title"] = "Changed"
+
+        second = client.get("12345")
+
+        assert second.get_title() == "Test Page"
+        assert (
+            "local edit"
+            not in second.get_page_content_dict()["body"]["storage"]["value"]
+        )
+
+    @patch("atlassian_page_client.page_client.requests.put")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_put_updates_cache(
+        self, mock_get, mock_put, client_config, sample_page_data
+    ):
+        """Test that a successful put stores the returned page."""
+        cache = PageCache()
+        client = AtlassianPageClient(**client_config, cache=cache)
+
+        get_response = MockResponse(status_code=200, text=json.dumps(sample_page_data))
+        mock_get.return_value = get_response
+        updated_data = copy.deepcopy(sample_page_data)
+        updated_data["version"]["number"] = 2
+        updated_data["body"]["storage"]["value"] = "<p>new</p>"
+        mock_put.return_value = MockResponse(
+            status_code=200, text=json.dumps(updated_data)
+        )
+
+        page = client.get("12345")
+        client.put(page, force=True)
+        mock_get.return_value = MockResponse(
+            status_code=200, text=json.dumps(updated_data)
+        )
+        cached = client.get("12345")
+
+        assert mock_get.call_args[0][0].endswith("?expand=version")
+        assert cache.get_version("12345") == 2
+        assert cached.get_version() == 2
+        assert (
+            cached.get_page_content_dict()["body"]["storage"]["value"] == "<p>new</p>"
+        )
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_version_only_expands_version(
+        self, mock_get, client_config, mock_requests_response
+    ):
+        """Test that get_version does not request the storage body."""
+        client = AtlassianPageClient(**client_config)
+        mock_requests_response.text = json.dumps(
+            {"id": "12345", "version": {"number": 7}}
+        )
+        mock_get.return_value = mock_requests_response
+
+        version = client.get_version("12345")
+
+        assert version == 7
+        mock_get.assert_called_once_with(
+            client.base_url + "/wiki/rest/api/content/12345?expand=version",
+            headers=client.HEADERS,
+            auth=client.basicAuth,
+        )
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_if_changed_unchanged(
+        self, mock_get, client_config, mock_requests_response
+    ):
+        """Test that an unchanged page is not downloaded."""
+        client = AtlassianPageClient(**client_config)
+        mock_requests_response.text = json.dumps({"version": {"number": 1}})
+        mock_get.return_value = mock_requests_response
+
+        assert client.get_if_changed("12345", 1) is None
+        mock_get.assert_called_once()
+        assert "body.storage" not in mock_get.call_args[0][0]
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_if_changed_downloads_new_version(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that a moved version triggers a full download."""
+        client = AtlassianPageClient(**client_config)
+        page_data = copy.deepcopy(sample_page_data)
+        page_data["version"]["number"] = 2
+        mock_get.side_effect = [
+            MockResponse(status_code=200, text=json.dumps({"version": {"number": 2}})),
+            MockResponse(status_code=200, text=json.dumps(page_data)),
+        ]
+
+        page = client.get_if_changed("12345", 1)
+
+        assert isinstance(page, AtlassianPage)
+        assert page.get_version() == 2
+        assert mock_get.call_count == 2
+        assert "expand=body.storage,version" in mock_get.call_args[0][0]
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_if_changed_bypasses_stale_cache(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that a cached older version is not returned as the new one."""
+        cache = PageCache()
+        cache.put("12345", 1, json.dumps(sample_page_data))
+        client = AtlassianPageClient(**client_config, cache=cache)
+        page_data = copy.deepcopy(sample_page_data)
+        page_data["version"]["number"] = 2
+        mock_get.side_effect = [
+            MockResponse(status_code=200, text=json.dumps({"version": {"number": 2}})),
+            MockResponse(status_code=200, text=json.dumps(page_data)),
+        ]
+
+        page = client.get_if_changed("12345", 0)
+
+        assert page.get_version() == 2
+        assert cache.get_version("12345") == 2
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_if_changed_uses_cached_version(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that the body comes from the cache when that version is cached."""
+        cache = PageCache()
+        cache.put("12345", 1, json.dumps(sample_page_data))
+        client = AtlassianPageClient(**client_config, cache=cache)
+        mock_get.return_value = MockResponse(
+            status_code=200, text=json.dumps({"version": {"number": 1}})
+        )
+
+        page = client.get_if_changed("12345", 0)
+
+        mock_get.assert_called_once()
+        assert page.get_version() == 1
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_uses_client_parser(
+        self, mock_get, client_config, sample_page_data, mock_requests_response
+    ):
+        """Test that pages are parsed with the parser configured on the client."""
+        pytest.importorskip("lxml")
+        client = AtlassianPageClient(**client_config, parser="lxml")
+        mock_requests_response.text = json.dumps(sample_page_data)
+        mock_get.return_value = mock_requests_response
+
+        page = client.get("12345")
+
+        assert page.get_working_page_content().parser == "lxml"
+
+    @staticmethod
+    def _listing(ids, next_url=None):
+        links = {"next": next_url} if next_url else {}
+        return json.dumps(
+            {
+                "results": [
+                    {
+                        "id": page_id,
+                        "title": f"Page {page_id}",
+                        "status": "current",
+                        "spaceId": "42",
+                        "parentId": "1",
+                        "version": {"number": 3},
+                    }
+                    for page_id in ids
+                ],
+                "_links": links,
+            }
+        )
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_iter_space_pages_follows_cursor(self, mock_get, client_config):
+        """Test that all result pages are followed through _links.next."""
+        cursor_url = "/wiki/api/v2/spaces/42/pages?limit=2&cursor="
+        mock_get.side_effect = [
+            MockResponse(
+                status_code=200, text=self._listing(["1", "2"], cursor_url + "a")
+            ),
+            MockResponse(
+                status_code=200, text=self._listing(["3", "4"], cursor_url + "b")
+            ),
+            MockResponse(status_code=200, text=self._listing(["5"])),
+        ]
+        client = AtlassianPageClient(**client_config)
+
+        summaries = list(client.iter_space_pages("42", limit=2))
+
+        assert [summary.id for summary in summaries] == ["1", "2", "3", "4", "5"]
+        assert summaries[0].title == "Page 1"
+        assert summaries[0].version == 3
+        assert summaries[0].space_id == "42"
+        assert summaries[0].parent_id == "1"
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        assert urls == [
+            client.base_url + "/wiki/api/v2/spaces/42/pages?limit=2",
+            client.base_url + cursor_url + "a",
+            client.base_url + cursor_url + "b",
+        ]
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_iter_space_pages_prefetches_next_listing(self, mock_get, client_config):
+        """Test that the next listing is requested while the current is consumed."""
+        next_requested = threading.Event()
+
+        def respond(url, **kwargs):
+            if "cursor" in url:
+                next_requested.set()
+                return MockResponse(status_code=200, text=self._listing(["3"]))
+            return MockResponse(
+                status_code=200,
+                text=self._listing(["1", "2"], "/wiki/api/v2/spaces/42/pages?cursor=x"),
+            )
+
+        mock_get.side_effect = respond
+        client = AtlassianPageClient(**client_config)
+
+        pages = client.iter_space_pages("42")
+        assert next(pages).id == "1"
+
+        assert next_requested.wait(timeout=5)
+        assert [summary.id for summary in pages] == ["2", "3"]
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_iter_space_pages_without_prefetch(self, mock_get, client_config):
+        """Test that stopping early without prefetch sends no further requests."""
+        mock_get.return_value = MockResponse(
+            status_code=200,
+            text=self._listing(["1", "2"], "/wiki/api/v2/spaces/42/pages?cursor=x"),
+        )
+        client = AtlassianPageClient(**client_config)
+
+        pages = client.iter_space_pages("42", prefetch=False)
+        assert next(pages).id == "1"
+        pages.close()
+
+        mock_get.assert_called_once()
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_iter_space_pages_failure(self, mock_get, client_config):
+        """Test that a failing listing request raises from the iterator."""
+        mock_get.return_value = MockResponse(
+            status_code=404, text="Not Found", headers={}
+        )
+        client = AtlassianPageClient(**client_config)
+
+        with pytest.raises(AtlassianNotFoundError):
+            list(client.iter_space_pages("missing"))
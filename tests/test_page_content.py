@@ -1,10 +1,13 @@
 """Tests for AtlassianPageContent."""
 
+from unittest.mock import patch
+
 import bs4
 import pytest
 from bs4 import BeautifulSoup
 
-from atlassian_page_client.page_content import AtlassianPageContent
+from atlassian_page_client import page_content
+from atlassian_page_client.page_content import AtlassianPageContent, resolve_parser
 
 
 class TestAtlassianPageContent:
@@ -195,3 +198,329 @@ class TestAtlassianPageContent:
         assert content.raw_html == html_with_special
         root = content.get_root()
         assert "🎉" in str(root) or "émojis" in str(root)
+
+    def test_find_all_by_attribute(self):
+        """Test finding all elements with an attribute value in document order."""
+        content = AtlassianPageContent(
+            '<div><p class="test">First</p><p class="other">x</p>'
+            '<span class="test">Second</span></div>'
+        )
+
+        result = content.find_all_by_attribute("class", "test")
+
+        assert [tag.get_text() for tag in result] == ["First", "Second"]
+        assert content.find_all_by_attribute("class", "missing") == []
+
+    def test_index_is_built_once(self, sample_html_content):
+        """Test that repeated lookups do not walk the tree again."""
+        content = AtlassianPageContent(sample_html_content)
+        content.find_by_Attribute("ac:local-id", "test-table")
+
+        with patch.object(
+            content.soup, "find_all", side_effect=AssertionError("tree walked")
+        ):
+            assert content.find_by_Attribute("ac:local-id", "test-table") is not None
+            assert content.find_by_Attribute("ac:local-id", "nothing") is None
+
+    def test_index_tracks_added_tags(self, sample_html_content):
+        """Test that tags added after indexing are found."""
+        content = AtlassianPageContent(sample_html_content)
+        table = content.find_by_Attribute("ac:local-id", "test-table")
+
+        new_row = content.new_tag("tr", **{"ac:local-id": "new-row"})
+        new_cell = content.new_tag("td", **{"ac:local-id": "new-cell"})
+        new_row.append(new_cell)
+        table.append(new_row)
+
+        assert content.find_by_Attribute("ac:local-id", "new-row") is new_row
+        assert content.find_by_Attribute("ac:local-id", "new-cell") is new_cell
+
+    def test_index_tracks_removed_tags(self, sample_html_content):
+        """Test that removed tags are no longer found."""
+        content = AtlassianPageContent(sample_html_content)
+        table = content.find_by_Attribute("ac:local-id", "test-table")
+        div = content.find_by_Attribute("data-test", "test-div")
+
+        table.extract()
+        div.decompose()
+
+        assert content.find_by_Attribute("ac:local-id", "test-table") is None
+        assert content.find_by_Attribute("data-test", "test-div") is None
+
+    def test_index_tracks_replaced_and_moved_tags(self):
+        """Test replace_with and moving a tag keep the index consistent."""
+        content = AtlassianPageContent(
+            '<div id="a"><p ac:local-id="p1">one</p></div><div id="b"></div>'
+        )
+        paragraph = content.find_by_Attribute("ac:local-id", "p1")
+        target = content.find_by_Attribute("id", "b")
+
+        target.append(paragraph)
+        assert content.find_all_by_attribute("ac:local-id", "p1") == [paragraph]
+        assert paragraph.parent is target
+
+        replacement = content.new_tag("p", **{"ac:local-id": "p2"})
+        paragraph.replace_with(replacement)
+
+        assert content.find_by_Attribute("ac:local-id", "p1") is None
+        assert content.find_by_Attribute("ac:local-id", "p2") is replacement
+
+    def test_index_tracks_attribute_changes(self, sample_html_content):
+        """Test that setting and deleting attributes updates the index."""
+        content = AtlassianPageContent(sample_html_content)
+        table = content.find_by_Attribute("ac:local-id", "test-table")
+
+        table["ac:local-id"] = "renamed"
+        assert content.find_by_Attribute("ac:local-id", "test-table") is None
+        assert content.find_by_Attribute("ac:local-id", "renamed") is table
+
+        del table["ac:local-id"]
+        assert content.find_by_Attribute("ac:local-id", "renamed") is None
+
+    def test_index_keeps_document_order_after_insert(self):
+        """Test that the first match stays the first one in the document."""
+        content = AtlassianPageContent('<div><p class="x">second</p></div>')
+        assert content.find_by_Attribute("class", "x").get_text() == "second"
+
+        first = content.new_tag("p", string="first", **{"class": "x"})
+        content.find_by_Attribute("class", "x").insert_before(first)
+
+        assert content.find_by_Attribute("class", "x") is first
+        assert [t.get_text() for t in content.find_all_by_attribute("class", "x")] == [
+            "first",
+            "second",
+        ]
+
+    def test_index_tracks_top_level_appends(self, sample_html_content):
+        """Test that tags appended to the root are indexed."""
+        content = AtlassianPageContent(sample_html_content)
+        content.find_by_Attribute("data-test", "test-div")
+
+        added = content.new_tag("div", **{"data-test": "root-div"})
+        content.soup.append(added)
+
+        assert content.find_by_Attribute("data-test", "root-div") is added
+
+    def test_invalidate_index(self, sample_html_content):
+        """Test that direct attrs edits are picked up after invalidation."""
+        content = AtlassianPageContent(sample_html_content)
+        div = content.find_by_Attribute("data-test", "test-div")
+
+        div.attrs["data-test"] = "direct"
+        content.invalidate_index()
+
+        assert content.find_by_Attribute("data-test", "direct") is div
+
+
+STORAGE_FORMAT = (
+    "<p>Intro &amp; more&nbsp;text</p>"
+    '<ac:structured-macro ac:name="code" ac:macro-id="m1">'
+    '<ac:parameter ac:name="language">python</ac:parameter>'
+    '<ac:plain-text-body><![CDATA[if a > b:\n    print("<p>")]]></ac:plain-text-body>'
+    "</ac:structured-macro>"
+    '<ac:structured-macro ac:name="toc"><ac:parameter ac:name="minLevel" />'
+    '<ac:parameter ac:name="maxLevel">3</ac:parameter></ac:structured-macro>'
+    '<p><ac:link><ri:page ri:content-title="Other page" /></ac:link>'
+    ' <ac:emoticon ac:name="smile" /> done<br/></p>'
+    '<table ac:local-id="t1"><colgroup><col style="width: 10px;" /></colgroup>'
+    '<tbody><tr><th><p>Head</p></th></tr><tr><td ac:local-id="c1">Cell</td></tr>'
+    "</tbody></table>"
+    "<!-- comment -->"
+    '<ac:image ac:height="250"><ri:attachment ri:filename="a.png" /></ac:image>'
+)
+
+
+@pytest.fixture(params=["lxml", "html5lib"])
+def alternative_parser(request):
+    """Parser backends that are checked against html.parser."""
+    pytest.importorskip(request.param)
+    return request.param
+
+
+class TestAtlassianPageContentParsers:
+    """Test cases for the selectable parser backends."""
+
+    def test_default_parser(self):
+        """Test that html.parser stays the default."""
+        content = AtlassianPageContent("<p>x</p>")
+
+        assert content.parser == "html.parser"
+
+    def test_resolve_parser(self):
+        """Test parser name resolution."""
+        assert resolve_parser(None) == "html.parser"
+        assert resolve_parser("html5lib") == "html5lib"
+
+        fast = resolve_parser("fast")
+        try:
+            import lxml  # noqa: F401
+
+            assert fast == "lxml"
+        except ImportError:
+            assert fast == "html.parser"
+
+    def test_round_trip_matches_html_parser(self, alternative_parser):
+        """Test that serializing gives the same storage format as html.parser."""
+        reference = str(AtlassianPageContent(STORAGE_FORMAT).soup)
+
+        content = AtlassianPageContent(STORAGE_FORMAT, parser=alternative_parser)
+
+        assert content.parser == alternative_parser
+        assert str(content.soup) == reference
+        assert "<![CDATA[if a > b:" in str(content.soup)
+
+    def test_fragment_is_not_wrapped(self, alternative_parser):
+        """Test that no html/body wrapper is added to the fragment."""
+        content = AtlassianPageContent("text <b>bold</b>", parser=alternative_parser)
+
+        assert str(content.soup) == "text <b>bold</b>"
+        assert content.soup.find("body") is None
+        assert list(content.soup.descendants) == list(_iter_next_elements(content.soup))
+
+    def test_editing_with_alternative_parser(self, alternative_parser):
+        """Test lookups and edits work on trees built by other backends."""
+        content = AtlassianPageContent(STORAGE_FORMAT, parser=alternative_parser)
+
+        cell = content.find_by_Attribute("ac:local-id", "c1")
+        cell.append(content.new_tag("p", string="added"))
+        content.soup.append(content.new_tag("p", string="last"))
+
+        html = str(content.soup)
+        assert '<td ac:local-id="c1">Cell<p>added</p></td>' in html
+        assert html.endswith("<p>last</p>")
+
+    def test_empty_content(self, alternative_parser):
+        """Test parsing an empty body."""
+        content = AtlassianPageContent("", parser=alternative_parser)
+
+        assert str(content.soup) == ""
+
+
+class TestAtlassianPageContentSerialize:
+    """Test cases for serialize, which reuses the source of unchanged subtrees."""
+
+    def test_unedited_content_is_the_source(self):
+        """Test that serializing without edits returns the loaded body."""
+        content = AtlassianPageContent(STORAGE_FORMAT)
+
+        assert content.serialize() == STORAGE_FORMAT
+
+    def test_source_is_located_on_the_first_edit(self):
+        """Test that parsing and lookups do not locate the source of subtrees."""
+        with patch(
+            "atlassian_page_client.page_content._source_runs",
+            wraps=page_content._source_runs,
+        ) as source_runs:
+            content = AtlassianPageContent(STORAGE_FORMAT)
+            cell = content.find_by_Attribute("ac:local-id", "c1")
+            source_runs.assert_not_called()
+
+            cell.string = "Edited"
+            cell["class"] = "x"
+
+        source_runs.assert_called_once()
+        assert '<col style="width: 10px;" />' in content.serialize()
+
+    def test_only_edited_subtrees_are_rendered(self):
+        """Test that markup outside the edited tags keeps its source text."""
+        content = AtlassianPageContent(STORAGE_FORMAT)
+
+        content.find_by_Attribute("ac:local-id", "c1").string = "Edited"
+
+        html = content.serialize()
+        assert '<td ac:local-id="c1">Edited</td>' in html
+        # unchanged siblings and other top level elements are not re-rendered
+        assert '<col style="width: 10px;" />' in html
+        assert '<ri:page ri:content-title="Other page" />' in html
+        assert "<br/></p>" in html
+        assert str(AtlassianPageContent(html).soup) == str(content.soup)
+
+    def test_structural_edits(self):
+        """Test inserts, removals, replaced strings and cleared tags."""
+        content = AtlassianPageContent(STORAGE_FORMAT)
+        root = content.get_root()
+
+        root.find("p").extract()
+        root.insert(1, content.new_tag("h1", string="Title"))
+        root.find("th").p.string.replace_with("New head")
+        root.find("ac:link").clear()
+        root.append("tail")
+
+        html = content.serialize()
+        assert "Intro" not in html
+        assert "<h1>Title</h1>" in html
+        assert "<p>New head</p>" in html
+        assert "<ac:link></ac:link>" in html
+        assert html.endswith("tail")
+        assert str(AtlassianPageContent(html).soup) == str(content.soup)
+
+    def test_attribute_edits(self):
+        """Test that attribute changes, also through tag.attrs, are serialized."""
+        content = AtlassianPageContent(STORAGE_FORMAT)
+        root = content.get_root()
+
+        root.find("table")["class"] = "wide"
+        root.find("ac:image").attrs["ac:height"] = "100"
+
+        html = content.serialize()
+        assert '<table ac:local-id="t1" class="wide">' in html
+        assert '<ac:image ac:height="100">' in html
+        assert str(AtlassianPageContent(html).soup) == str(content.soup)
+
+    def test_direct_tag_edits(self):
+        """Test renames, new attrs dicts, list values, extracted strings, hiding."""
+        content = AtlassianPageContent(
+            STORAGE_FORMAT.replace("<p>Head</p>", "<p class='head'>Head</p>")
+        )
+        root = content.get_root()
+
+        root.find("th").name = "td"
+        root.find("table").attrs = {"ac:local-id": "t2"}
+        root.find("p", class_="head")["class"].append("bold")
+        root.find("p").string.extract()
+        root.find("ac:link").hidden = True
+
+        html = content.serialize()
+        assert '<table ac:local-id="t2">' in html
+        assert '<td><p class="head bold">Head</p></td>' in html
+        assert html.startswith("<p></p>")
+        assert "<ac:link>" not in html
+        assert str(AtlassianPageContent(html).soup) == str(content.soup)
+        assert content.find_by_Attribute("ac:local-id", "t1") is None
+        assert content.find_by_Attribute("ac:local-id", "t2").name == "table"
+
+    def test_unclosed_tags_are_rendered(self):
+        """Test that source text of tags without a closing tag is not reused."""
+        content = AtlassianPageContent("<p><b>one</b> two")
+
+        content.get_root().append(content.new_tag("div"))
+
+        assert content.serialize() == "<p><b>one</b> two</p><div></div>"
+
+    def test_invalidate_index_renders_the_whole_tree(self):
+        """Test that untracked edits are serialized after invalidate_index."""
+        content = AtlassianPageContent(STORAGE_FORMAT)
+
+        content.get_root().find("td").contents.append(content.new_tag("br"))
+        content.invalidate_index()
+
+        assert content.serialize() == str(content.soup)
+
+    def test_without_source(self):
+        """Test that the whole tree is rendered when the source is not kept."""
+        content = AtlassianPageContent(STORAGE_FORMAT, keep_raw=False)
+
+        assert content.serialize() == str(content.soup)
+
+    def test_alternative_parser(self, alternative_parser):
+        """Test that other backends render the whole tree."""
+        content = AtlassianPageContent(STORAGE_FORMAT, parser=alternative_parser)
+
+        assert content.serialize() == str(content.soup)
+
+
+def _iter_next_elements(soup):
+    element = soup.next_element
+    while element is not None:
+        yield element
+        element = element.next_element
@@ -0,0 +1,153 @@
+"""Tests for the client side rate limiter."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from atlassian_page_client.async_page_client import AsyncAtlassianPageClient
+from atlassian_page_client.client_factory import AtlassianClientFactory
+from atlassian_page_client.page_client import AtlassianPageClient
+from atlassian_page_client.rate_limit import RateLimiter, TokenBucket
+from tests.conftest import FakeAsyncResponse, MockResponse
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_steady_rate(self):
+        """Test that a full bucket allows a burst and then paces callers."""
+        bucket = TokenBucket(rate=10, burst=3)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1, abs=0.01)
+        assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_tokens_refill_over_time(self):
+        """Test that waiting refills the bucket up to its burst size."""
+        bucket = TokenBucket(rate=100, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        time.sleep(0.05)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() > 0
+
+    def test_invalid_configuration(self):
+        """Test that a non positive rate or a burst below one is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0.5)
+
+    def test_threads_share_the_rate(self):
+        """Test that concurrent threads are paced by one bucket."""
+        bucket = TokenBucket(rate=200, burst=1)
+        start = time.monotonic()
+
+        threads = [
+            threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 tokens at 200/s with one token available up front
+        assert time.monotonic() - start >= 19 / 200 * 0.9
+
+    def test_tasks_share_the_rate(self):
+        """Test that coroutines wait without blocking each other."""
+        bucket = TokenBucket(rate=200, burst=1)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(20)))
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 19 / 200 * 0.9
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter and its use by the clients."""
+
+    def test_separate_read_and_write_buckets(self):
+        """Test that reads and writes draw from different buckets."""
+        limiter = RateLimiter(read_rate=5, write_rate=1)
+
+        assert limiter.bucket_for("get") is limiter.read_bucket
+        for method in ("put", "POST", "delete"):
+            assert limiter.bucket_for(method) is limiter.write_bucket
+
+        limiter.write_bucket.reserve()
+        assert limiter.read_bucket.reserve() == 0.0
+        assert limiter.write_bucket.reserve() > 0
+
+    def test_unlimited_kind(self):
+        """Test that a missing rate leaves that kind of request unlimited."""
+        limiter = RateLimiter(write_rate=1)
+
+        assert limiter.read_bucket is None
+        for _ in range(100):
+            limiter.acquire("get")
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_client_acquires_before_each_request(
+        self, mock_get, client_config, sample_page_data
+    ):
+        """Test that the client asks the limiter before sending."""
+        mock_get.return_value = MockResponse(
+            status_code=200, text=json.dumps(sample_page_data), headers={}
+        )
+        limiter = Mock(spec=RateLimiter)
+        client = AtlassianPageClient(**client_config, rate_limiter=limiter)
+
+        client.get("12345")
+        client.get_version("12345")
+
+        assert [call.args for call in limiter.acquire.call_args_list] == [
+            ("get",),
+            ("get",),
+        ]
+
+    def test_async_client_acquires_before_each_request(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test that async clients wait on the limiter without blocking."""
+        limiter = RateLimiter(read_rate=100)
+        limiter.read_bucket.acquire_async = Mock(side_effect=lambda: asyncio.sleep(0))
+        session = fake_async_session(
+            FakeAsyncResponse(text=json.dumps(sample_page_data))
+        )
+        client = AsyncAtlassianPageClient(
+            **client_config, session=session, rate_limiter=limiter
+        )
+
+        asyncio.run(client.get("12345"))
+
+        limiter.read_bucket.acquire_async.assert_called_once()
+
+    def test_factory_shares_rate_limiter(self, client_config):
+        """Test that all clients of a factory share its limiter."""
+        limiter = RateLimiter(read_rate=10, write_rate=2)
+        factory = AtlassianClientFactory(**client_config, rate_limiter=limiter)
+
+        clients = [
+            factory.createPageClient(),
+            factory.createBlogClient(),
+            factory.createAttachmentClient(),
+            factory.createAsyncPageClient(),
+            factory.createAsyncBlogClient(),
+            factory.createAsyncAttachmentClient(),
+        ]
+
+        assert all(client.rate_limiter is limiter for client in clients)
+        assert AtlassianClientFactory(**client_config).rate_limiter is None
@@ -0,0 +1,241 @@
+"""Tests for RetryPolicy, the typed API errors and retrying clients."""
+
+import asyncio
+import json
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from atlassian_page_client.async_page_client import AsyncAtlassianPageClient
+from atlassian_page_client.blog_client import AtlassianBlogClient
+from atlassian_page_client.exceptions import (
+    AtlassianAPIError,
+    AtlassianAuthenticationError,
+    AtlassianConflictError,
+    AtlassianNotFoundError,
+    AtlassianRateLimitError,
+    AtlassianServerError,
+    error_for_status,
+)
+from atlassian_page_client.page_client import AtlassianPageClient
+from atlassian_page_client.retry import RetryPolicy, is_replayable, parse_retry_after
+from tests.conftest import FakeAsyncResponse, MockResponse
+
+
+def response(status_code, text="", headers=None):
+    return MockResponse(status_code=status_code, text=text, headers=headers or {})
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+
+    def test_parse_retry_after(self):
+        """Test Retry-After values given as seconds and as HTTP date."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+        in_ten_seconds = parse_retry_after(
+            formatdate(timeval=time.time() + 10, usegmt=True)
+        )
+        assert 8 <= in_ten_seconds <= 10
+        assert parse_retry_after(formatdate(timeval=0, usegmt=True)) == 0.0
+
+    def test_retryable_requests(self):
+        """Test which methods and statuses are retried."""
+        policy = RetryPolicy()
+
+        for status in (429, 502, 503, 504, None):
+            assert policy.is_retryable("get", status) is True
+            assert policy.is_retryable("PUT", status) is True
+        for status in (400, 401, 404, 409, 500):
+            assert policy.is_retryable("get", status) is False
+        assert policy.is_retryable("post", 429) is True
+        assert policy.is_retryable("post", 503) is False
+        assert policy.is_retryable("post", None) is False
+        assert policy.is_retryable("get", 503, replayable=False) is False
+
+    def test_is_replayable(self):
+        """Test that only in-memory bodies count as replayable."""
+        assert is_replayable(None) is True
+        assert is_replayable('{"a": 1}') is True
+        assert is_replayable(b"bytes") is True
+        assert is_replayable(iter([b"chunk"])) is False
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test the exponential backoff bounds and Retry-After handling."""
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, max_retry_after=30)
+
+        for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 4.0), (8, 5.0)):
+            for _ in range(20):
+                assert 0 <= policy.backoff(attempt) <= ceiling
+        assert policy.backoff(1, retry_after=7) == 7
+        assert policy.backoff(1, retry_after=600) == 30
+
+    def test_retry_delay_respects_attempts_and_budget(self):
+        """Test that max_attempts and the shared retry budget stop retries."""
+        policy = RetryPolicy(max_attempts=3, retry_budget=3)
+
+        assert policy.retry_delay("get", 1, status=503) is not None
+        assert policy.retry_delay("get", 2, status=503) is not None
+        assert policy.retry_delay("get", 3, status=503) is None
+        assert policy.retry_delay("get", 1, status=404) is None
+        assert policy.retry_delay("get", 1, status=429, retry_after="2") == 2
+        assert policy.remaining_budget == 0
+        assert policy.retry_delay("get", 1, status=503) is None
+        assert policy.retries == 3
+
+    def test_invalid_configuration(self):
+        """Test that nonsensical settings are rejected."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(retry_budget=-1)
+
+
+class TestAtlassianAPIError:
+    """Test cases for the typed API errors."""
+
+    @pytest.mark.parametrize(
+        "status_code, error_class",
+        [
+            (400, AtlassianAPIError),
+            (401, AtlassianAuthenticationError),
+            (403, AtlassianAuthenticationError),
+            (404, AtlassianNotFoundError),
+            (409, AtlassianConflictError),
+            (429, AtlassianRateLimitError),
+            (500, AtlassianServerError),
+            (503, AtlassianServerError),
+        ],
+    )
+    def test_error_for_status(self, status_code, error_class):
+        """Test that each status maps to its exception type."""
+        error = error_for_status("https://example/api", status_code, "text")
+
+        assert type(error) is error_class
+        assert isinstance(error, AtlassianAPIError)
+        assert error.status_code == status_code
+        assert (
+            str(error)
+            == f"Failed to get page from url https://example/api: {status_code} text"
+        )
+
+    def test_check_response_raises_typed_error(self, client_config):
+        """Test that check_response carries the Retry-After of a 429."""
+        client = AtlassianPageClient(**client_config)
+        limited = response(429, "Too Many Requests", {"Retry-After": "12"})
+        limited.url = "https://example/api"
+
+        with pytest.raises(AtlassianRateLimitError) as exc_info:
+            client.check_response(limited)
+
+        assert exc_info.value.retry_after == 12.0
+
+
+class TestRetryingClients:
+    """Test cases for clients configured with a retry policy."""
+
+    @patch("atlassian_page_client.base_client.time.sleep")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_retries_transient_failures(
+        self, mock_get, mock_sleep, client_config, sample_page_data
+    ):
+        """Test that 429 and 503 responses are retried until the page arrives."""
+        mock_get.side_effect = [
+            response(429, headers={"Retry-After": "4"}),
+            response(503),
+            response(200, json.dumps(sample_page_data)),
+        ]
+        policy = RetryPolicy(backoff_factor=0.1)
+        client = AtlassianPageClient(**client_config, retry_policy=policy)
+
+        page = client.get("12345")
+
+        assert page.get_title() == "Test Page"
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_args_list[0][0][0] == 4
+        assert 0 <= mock_sleep.call_args_list[1][0][0] <= 0.2
+        assert policy.retries == 2
+
+    @patch("atlassian_page_client.base_client.time.sleep")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_get_raises_after_last_attempt(self, mock_get, mock_sleep, client_config):
+        """Test that the last failure is raised as a typed error."""
+        mock_get.return_value = response(502, "Bad Gateway")
+        client = AtlassianPageClient(
+            **client_config, retry_policy=RetryPolicy(max_attempts=3)
+        )
+
+        with pytest.raises(AtlassianServerError):
+            client.get("12345")
+
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("atlassian_page_client.base_client.time.sleep")
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_connection_errors_are_retried(
+        self, mock_get, mock_sleep, client_config, sample_page_data
+    ):
+        """Test that an idempotent request survives a dropped connection."""
+        mock_get.side_effect = [
+            requests.ConnectionError("reset"),
+            response(200, json.dumps(sample_page_data)),
+        ]
+        client = AtlassianPageClient(**client_config, retry_policy=RetryPolicy())
+
+        assert client.get("12345").get_page_id() == "12345"
+        assert mock_get.call_count == 2
+
+    @patch("atlassian_page_client.base_client.time.sleep")
+    @patch("atlassian_page_client.blog_client.requests.post")
+    def test_post_is_only_retried_on_rate_limit(
+        self, mock_post, mock_sleep, client_config
+    ):
+        """Test that a POST is replayed after a 429 but not after a 503."""
+        mock_post.side_effect = [response(429), response(200, "{}")]
+        client = AtlassianBlogClient(**client_config, retry_policy=RetryPolicy())
+
+        client.post(1, "Title", "<p>Body</p>")
+        assert mock_post.call_count == 2
+
+        mock_post.side_effect = [response(503, "Unavailable"), response(200, "{}")]
+        with pytest.raises(AtlassianServerError):
+            client.post(1, "Title", "<p>Body</p>")
+        assert mock_post.call_count == 3
+
+    @patch("atlassian_page_client.page_client.requests.get")
+    def test_no_retries_without_policy(self, mock_get, client_config):
+        """Test that standalone clients keep failing on the first error."""
+        mock_get.return_value = response(503, "Unavailable")
+        client = AtlassianPageClient(**client_config)
+
+        with pytest.raises(AtlassianServerError):
+            client.get("12345")
+
+        mock_get.assert_called_once()
+
+    def test_async_get_retries(
+        self, client_config, sample_page_data, fake_async_session
+    ):
+        """Test that the async clients follow the same policy."""
+        session = fake_async_session(
+            FakeAsyncResponse(status=429, headers={"Retry-After": "0"}),
+            FakeAsyncResponse(status=504),
+            FakeAsyncResponse(text=json.dumps(sample_page_data)),
+        )
+        client = AsyncAtlassianPageClient(
+            **client_config,
+            session=session,
+            retry_policy=RetryPolicy(backoff_factor=0),
+        )
+
+        page = asyncio.run(client.get("12345"))
+
+        assert page.get_title() == "Test Page"
+        assert len(session.client_session.calls) == 3
@@ -0,0 +1,118 @@
+"""Tests for SingleFlight and AsyncSingleFlight."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from atlassian_page_client.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight class."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test that callers arriving during a call wait for its result."""
+        flight = SingleFlight()
+        started = threading.Event()
+        calls = []
+        results = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return "page"
+
+        def call():
+            results.append(flight.do("1", slow))
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        started.wait()
+        threads += [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(results) == [("page", False)] + [("page", True)] * 4
+
+    def test_errors_are_shared(self):
+        """Test that waiting callers get the exception of the call."""
+        flight = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                flight.do("1", failing)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        started.wait()
+        threads.append(threading.Thread(target=call))
+        threads[1].start()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 2
+
+    def test_sequential_calls_are_not_shared(self):
+        """Test that a finished call is not reused."""
+        flight = SingleFlight()
+        values = iter([1, 2])
+
+        assert flight.do("1", lambda: next(values)) == (1, False)
+        assert flight.do("1", lambda: next(values)) == (2, False)
+
+
+class TestAsyncSingleFlight:
+    """Test cases for AsyncSingleFlight class."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test that tasks awaiting the same key share one call."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "page"
+
+        async def run():
+            return await asyncio.gather(*(flight.do("1", fetch) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == [("page", False)] + [("page", True)] * 4
+
+    def test_cancelled_caller_does_not_cancel_the_call(self):
+        """Test that the call goes on when the caller that started it is cancelled."""
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "page"
+
+        async def run():
+            first = asyncio.ensure_future(flight.do("1", fetch))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(flight.do("1", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(run()) == ("page", True)
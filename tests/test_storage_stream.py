@@ -0,0 +1,130 @@
+"""Tests for StorageStream."""
+
+import pytest
+
+from atlassian_page_client.page_content import AtlassianPageContent
+from atlassian_page_client.storage_stream import StorageElement, StorageStream
+
+STORAGE_FORMAT = (
+    "<p>Intro &amp; more&nbsp;text</p>"
+    '<ac:structured-macro ac:name="code" ac:macro-id="m1">'
+    '<ac:parameter ac:name="language">python</ac:parameter>'
+    '<ac:plain-text-body><![CDATA[if a > b:\n    print("<p>")]]></ac:plain-text-body>'
+    "</ac:structured-macro>"
+    '<p><ac:link><ri:page ri:content-title="Other page" /></ac:link> done<br/></p>'
+    '<table ac:local-id="t1"><tbody>'
+    '<tr><td ac:local-id="c1">Cell <strong>one</strong></td></tr>'
+    '<tr><td ac:local-id="c2">Cell two</td></tr>'
+    "</tbody></table>"
+)
+
+
+class TestStorageStream:
+    """Test cases for StorageStream class."""
+
+    def test_find_by_attribute(self):
+        """Test lookups by attribute value, like AtlassianPageContent."""
+        stream = StorageStream(STORAGE_FORMAT)
+
+        cell = stream.find_by_Attribute("ac:local-id", "c2")
+
+        assert isinstance(cell, StorageElement)
+        assert cell.name == "td"
+        assert cell.parents == ("table", "tbody", "tr")
+        assert stream.find_by_Attribute("ac:local-id", "missing") is None
+
+    def test_find_all(self):
+        """Test matching by name and attributes in document order."""
+        stream = StorageStream(STORAGE_FORMAT)
+
+        cells = list(stream.find_all("td"))
+        links = list(stream.find_all("ri:page", {"ri:content-title": True}))
+
+        assert [cell.get("ac:local-id") for cell in cells] == ["c1", "c2"]
+        assert links[0].attrs == {"ri:content-title": "Other page"}
+        assert [tag.name for tag in stream.find_all(attrs={"ac:local-id": "t1"})] == [
+            "table"
+        ]
+
+    def test_text(self):
+        """Test that text=True collects the text, entities and CDATA included."""
+        stream = StorageStream(STORAGE_FORMAT)
+
+        assert stream.find("td", text=True).text == "Cell one"
+        assert stream.find("p", text=True).text == "Intro & more\xa0text"
+        assert (
+            stream.find("ac:plain-text-body", text=True).text
+            == 'if a > b:\n    print("<p>")'
+        )
+        assert stream.find("br", text=True).text == ""
+
+    def test_nested_matches_with_text(self):
+        """Test that nested matches are yielded first, each with its own text."""
+        stream = StorageStream("<div>a<div>b</div>c</div>")
+
+        assert [div.text for div in stream.find_all("div", text=True)] == [
+            "b",
+            "abc",
+        ]
+
+    def test_matches_the_soup(self):
+        """Test that lookups give the same tags as the parsed content."""
+        content = AtlassianPageContent(STORAGE_FORMAT)
+        stream = StorageStream(STORAGE_FORMAT)
+
+        for name in ("p", "td", "ac:parameter", "ri:page", "br"):
+            assert [tag.attrs for tag in stream.find_all(name)] == [
+                tag.attrs for tag in content.soup.find_all(name)
+            ]
+
+    def test_unclosed_and_stray_tags(self):
+        """Test that unclosed tags end with their parent and stray ends are ignored."""
+        stream = StorageStream("<div><p>one</b> two</div><p>three")
+
+        assert [p.text for p in stream.find_all("p", text=True)] == [
+            "one two",
+            "three",
+        ]
+        assert stream.find("p", {"class": "x"}) is None
+
+    def test_chunked_bytes(self):
+        """Test reading chunks of bytes, split inside tags and characters."""
+        data = "<p>Grüße</p><td ac:local-id='x'>é</td>".encode("utf-8")
+        chunks = (data[i : i + 3] for i in range(0, len(data), 3))
+
+        cell = StorageStream(chunks).find("td", text=True)
+
+        assert cell.attrs == {"ac:local-id": "x"}
+        assert cell.text == "é"
+
+    def test_stops_at_the_first_match(self):
+        """Test that find does not read the body past the first match."""
+        read = []
+
+        def chunks():
+            for chunk in ["<p a='1'>x</p>", "<p>y</p>", "<p>z</p>"]:
+                read.append(chunk)
+                yield chunk
+
+        assert StorageStream(chunks()).find("p").get("a") == "1"
+        assert len(read) == 1
+
+        body = "<h1>first</h1>" + "<p>filler</p>" * 10000
+        stream = StorageStream(body, chunk_size=1024)
+        assert stream.find("h1", text=True).text == "first"
+
+    def test_iterator_is_read_once(self):
+        """Test that a second query over an iterator of chunks fails."""
+        stream = StorageStream(iter(["<p>x</p>"]))
+        list(stream.find_all("p"))
+
+        with pytest.raises(RuntimeError):
+            list(stream.find_all("p"))
+
+    def test_str_and_bytes_can_be_queried_again(self):
+        """Test that str and bytes bodies are read again by each query."""
+        for body in (STORAGE_FORMAT, STORAGE_FORMAT.encode("utf-8")):
+            stream = StorageStream(body)
+
+            assert stream.find_by_Attribute("ac:local-id", "c1").name == "td"
+            assert stream.find_by_Attribute("ac:local-id", "c1").name == "td"